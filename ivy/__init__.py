@@ -3,10 +3,12 @@ import copy
 import warnings
 import builtins
 import numpy as np
+import os
 import sys
 
 
 import ivy.utils.backend.handler
+from ivy.utils.context_stack import ContextStack
 from ivy._version import __version__ as __version__
 
 _not_imported_backends = list(ivy.utils.backend.handler._backend_dict.keys())
@@ -300,11 +302,11 @@ class Node(str):
     pass
 
 
-array_significant_figures_stack = list()
-array_decimal_values_stack = list()
-warning_level_stack = list()
-nan_policy_stack = list()
-dynamic_backend_stack = list()
+array_significant_figures_stack = ContextStack("array_significant_figures_stack")
+array_decimal_values_stack = ContextStack("array_decimal_values_stack")
+warning_level_stack = ContextStack("warning_level_stack")
+nan_policy_stack = ContextStack("nan_policy_stack")
+dynamic_backend_stack = ContextStack("dynamic_backend_stack")
 warn_to_regex = {"all": "!.*", "ivy_only": "^(?!.*ivy).*$", "none": ".*"}
 
 
@@ -709,6 +711,7 @@ from ivy.utils.backend import (
     current_backend,
     compiled_backends,
     with_backend,
+    release_backend,
     set_backend,
     set_numpy_backend,
     set_jax_backend,
@@ -722,14 +725,28 @@ from ivy.utils.backend import (
 from . import func_wrapper
 from .utils import assertions, exceptions, verbosity
 from .utils.backend import handler
-from . import functional
-from .functional import *
-from . import stateful
-from .stateful import *
+from ivy.utils.lazy_import import enabled as _lazy_import
+
+if not _lazy_import:
+    from . import functional
+    from .functional import *
+    from . import stateful
+    from .stateful import *
+else:
+    from ivy.utils.lazy_import import core_groups as _core_groups
+    from ivy.utils.lazy_import import lazy_package as _lazy_package
+
+    # the function groups are imported on first access, see ivy.utils.lazy_import
+    __getattr__, __dir__ = _lazy_package(
+        __name__,
+        [
+            ("functional", (), True),
+            ("stateful", (), True),
+            *[("functional.ivy." + group, (group,), False) for group in _core_groups],
+        ],
+    )
 from ivy.utils.inspection import fn_array_spec, add_array_specs
 
-add_array_specs()
-
 _imported_frameworks_before_compiler = list(sys.modules.keys())
 try:
     from .compiler.compiler import transpile, compile, unify
@@ -743,33 +760,11 @@ finally:
                 _not_imported_backends.remove(backend_framework)
 
 
-# add instance methods to Ivy Array and Container
-from ivy.functional.ivy import (
-    activations,
-    creation,
-    data_type,
-    device,
-    elementwise,
-    general,
-    gradients,
-    layers,
-    linear_algebra,
-    losses,
-    manipulation,
-    norms,
-    random,
-    searching,
-    set,
-    sorting,
-    statistical,
-    utility,
-)
-
-add_ivy_array_instance_methods(
-    Array,
-    [
+# add instance methods to Ivy Array and Container, which lazy loading defers until
+# the data classes are first used
+if not _lazy_import:
+    from ivy.functional.ivy import (
         activations,
-        arr_conversions,
         creation,
         data_type,
         device,
@@ -787,60 +782,102 @@ add_ivy_array_instance_methods(
         sorting,
         statistical,
         utility,
-    ],
-)
-
-add_ivy_container_instance_methods(
-    Container,
-    [
-        activations,
-        cont_conversions,
-        creation,
-        data_type,
-        device,
-        elementwise,
-        general,
-        gradients,
-        layers,
-        linear_algebra,
-        losses,
-        manipulation,
-        norms,
-        random,
-        searching,
-        set,
-        sorting,
-        statistical,
-        utility,
-    ],
-)
-
-
-add_ivy_container_instance_methods(
-    Container,
-    [
-        activations,
-        cont_conversions,
-        creation,
-        data_type,
-        device,
-        elementwise,
-        general,
-        gradients,
-        layers,
-        linear_algebra,
-        losses,
-        manipulation,
-        norms,
-        random,
-        searching,
-        set,
-        sorting,
-        statistical,
-        utility,
-    ],
-    static=True,
-)
+    )
+
+    add_ivy_array_instance_methods(
+        Array,
+        [
+            activations,
+            arr_conversions,
+            creation,
+            data_type,
+            device,
+            elementwise,
+            general,
+            gradients,
+            layers,
+            linear_algebra,
+            losses,
+            manipulation,
+            norms,
+            random,
+            searching,
+            set,
+            sorting,
+            statistical,
+            utility,
+        ],
+    )
+
+    add_ivy_container_instance_methods(
+        Container,
+        [
+            activations,
+            cont_conversions,
+            creation,
+            data_type,
+            device,
+            elementwise,
+            general,
+            gradients,
+            layers,
+            linear_algebra,
+            losses,
+            manipulation,
+            norms,
+            random,
+            searching,
+            set,
+            sorting,
+            statistical,
+            utility,
+        ],
+    )
+
+    add_ivy_container_instance_methods(
+        Container,
+        [
+            activations,
+            cont_conversions,
+            creation,
+            data_type,
+            device,
+            elementwise,
+            general,
+            gradients,
+            layers,
+            linear_algebra,
+            losses,
+            manipulation,
+            norms,
+            random,
+            searching,
+            set,
+            sorting,
+            statistical,
+            utility,
+        ],
+        static=True,
+    )
+else:
+    # used without the `ivy.` prefix below and by the data type classes, which module
+    # level `__getattr__` doesn't apply to
+    from ivy.functional.ivy import data_type, device, general
+    from ivy.functional.ivy.data_type import (
+        as_native_dtype,
+        can_cast,
+        default_complex_dtype,
+        default_float_dtype,
+        default_int_dtype,
+        dtype_bits,
+        finfo,
+        iinfo,
+        is_bool_dtype,
+        is_complex_dtype,
+        is_float_dtype,
+        is_int_dtype,
+        is_uint_dtype,
+    )
 
 
 class GlobalsDict(dict):
@@ -1200,3 +1237,7 @@ from ivy.utils.backend.sub_backend_handler import (
 
 def current_sub_backends():
     return []
+
+
+if _lazy_import:
+    utils.lazy_import.initialized()
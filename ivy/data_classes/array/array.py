@@ -1,7 +1,9 @@
 # flake8: noqa
 # global
+import abc
 import copy
 import functools
+import importlib
 import numpy as np
 from operator import mul
 from typing import Optional
@@ -9,131 +11,120 @@ from typing import Optional
 # local
 import ivy
 from .conversions import *
-from .activations import _ArrayWithActivations
-from .creation import _ArrayWithCreation
-from .data_type import _ArrayWithDataTypes
-from .device import _ArrayWithDevice
-from .elementwise import _ArrayWithElementwise
-from .general import _ArrayWithGeneral
-from .gradients import _ArrayWithGradients
-from .image import _ArrayWithImage
-from .layers import _ArrayWithLayers
-from .linear_algebra import _ArrayWithLinearAlgebra
-from .losses import _ArrayWithLosses
-from .manipulation import _ArrayWithManipulation
-from .norms import _ArrayWithNorms
-from .random import _ArrayWithRandom
-from .searching import _ArrayWithSearching
-from .set import _ArrayWithSet
-from .sorting import _ArrayWithSorting
-from .statistical import _ArrayWithStatistical
-from .utility import _ArrayWithUtility
 from ivy.func_wrapper import handle_view_indexing
-from .experimental import (
-    _ArrayWithSearchingExperimental,
-    _ArrayWithActivationsExperimental,
-    _ArrayWithConversionsExperimental,
-    _ArrayWithCreationExperimental,
-    _ArrayWithData_typeExperimental,
-    _ArrayWithDeviceExperimental,
-    _ArrayWithElementWiseExperimental,
-    _ArrayWithGeneralExperimental,
-    _ArrayWithGradientsExperimental,
-    _ArrayWithImageExperimental,
-    _ArrayWithLayersExperimental,
-    _ArrayWithLinearAlgebraExperimental,
-    _ArrayWithLossesExperimental,
-    _ArrayWithManipulationExperimental,
-    _ArrayWithNormsExperimental,
-    _ArrayWithRandomExperimental,
-    _ArrayWithSetExperimental,
-    _ArrayWithSortingExperimental,
-    _ArrayWithStatisticalExperimental,
-    _ArrayWithUtilityExperimental,
-)
-
-
-class Array(
-    _ArrayWithActivations,
-    _ArrayWithCreation,
-    _ArrayWithDataTypes,
-    _ArrayWithDevice,
-    _ArrayWithElementwise,
-    _ArrayWithGeneral,
-    _ArrayWithGradients,
-    _ArrayWithImage,
-    _ArrayWithLayers,
-    _ArrayWithLinearAlgebra,
-    _ArrayWithLosses,
-    _ArrayWithManipulation,
-    _ArrayWithNorms,
-    _ArrayWithRandom,
-    _ArrayWithSearching,
-    _ArrayWithSet,
-    _ArrayWithSorting,
-    _ArrayWithStatistical,
-    _ArrayWithUtility,
-    _ArrayWithActivationsExperimental,
-    _ArrayWithConversionsExperimental,
-    _ArrayWithCreationExperimental,
-    _ArrayWithData_typeExperimental,
-    _ArrayWithDeviceExperimental,
-    _ArrayWithElementWiseExperimental,
-    _ArrayWithGeneralExperimental,
-    _ArrayWithGradientsExperimental,
-    _ArrayWithImageExperimental,
-    _ArrayWithLayersExperimental,
-    _ArrayWithLinearAlgebraExperimental,
-    _ArrayWithLossesExperimental,
-    _ArrayWithManipulationExperimental,
-    _ArrayWithNormsExperimental,
-    _ArrayWithRandomExperimental,
-    _ArrayWithSearchingExperimental,
-    _ArrayWithSetExperimental,
-    _ArrayWithSortingExperimental,
-    _ArrayWithStatisticalExperimental,
-    _ArrayWithUtilityExperimental,
-):
+from ivy.utils.lazy_import import enabled as _lazy_import
+
+if not _lazy_import:
+    from .activations import _ArrayWithActivations
+    from .creation import _ArrayWithCreation
+    from .data_type import _ArrayWithDataTypes
+    from .device import _ArrayWithDevice
+    from .elementwise import _ArrayWithElementwise
+    from .general import _ArrayWithGeneral
+    from .gradients import _ArrayWithGradients
+    from .image import _ArrayWithImage
+    from .layers import _ArrayWithLayers
+    from .linear_algebra import _ArrayWithLinearAlgebra
+    from .losses import _ArrayWithLosses
+    from .manipulation import _ArrayWithManipulation
+    from .norms import _ArrayWithNorms
+    from .random import _ArrayWithRandom
+    from .searching import _ArrayWithSearching
+    from .set import _ArrayWithSet
+    from .sorting import _ArrayWithSorting
+    from .statistical import _ArrayWithStatistical
+    from .utility import _ArrayWithUtility
+    from .experimental import (
+        _ArrayWithSearchingExperimental,
+        _ArrayWithActivationsExperimental,
+        _ArrayWithConversionsExperimental,
+        _ArrayWithCreationExperimental,
+        _ArrayWithData_typeExperimental,
+        _ArrayWithDeviceExperimental,
+        _ArrayWithElementWiseExperimental,
+        _ArrayWithGeneralExperimental,
+        _ArrayWithGradientsExperimental,
+        _ArrayWithImageExperimental,
+        _ArrayWithLayersExperimental,
+        _ArrayWithLinearAlgebraExperimental,
+        _ArrayWithLossesExperimental,
+        _ArrayWithManipulationExperimental,
+        _ArrayWithNormsExperimental,
+        _ArrayWithRandomExperimental,
+        _ArrayWithSetExperimental,
+        _ArrayWithSortingExperimental,
+        _ArrayWithStatisticalExperimental,
+        _ArrayWithUtilityExperimental,
+    )
+
+    _bases = (
+        _ArrayWithActivations,
+        _ArrayWithCreation,
+        _ArrayWithDataTypes,
+        _ArrayWithDevice,
+        _ArrayWithElementwise,
+        _ArrayWithGeneral,
+        _ArrayWithGradients,
+        _ArrayWithImage,
+        _ArrayWithLayers,
+        _ArrayWithLinearAlgebra,
+        _ArrayWithLosses,
+        _ArrayWithManipulation,
+        _ArrayWithNorms,
+        _ArrayWithRandom,
+        _ArrayWithSearching,
+        _ArrayWithSet,
+        _ArrayWithSorting,
+        _ArrayWithStatistical,
+        _ArrayWithUtility,
+        _ArrayWithActivationsExperimental,
+        _ArrayWithConversionsExperimental,
+        _ArrayWithCreationExperimental,
+        _ArrayWithData_typeExperimental,
+        _ArrayWithDeviceExperimental,
+        _ArrayWithElementWiseExperimental,
+        _ArrayWithGeneralExperimental,
+        _ArrayWithGradientsExperimental,
+        _ArrayWithImageExperimental,
+        _ArrayWithLayersExperimental,
+        _ArrayWithLinearAlgebraExperimental,
+        _ArrayWithLossesExperimental,
+        _ArrayWithManipulationExperimental,
+        _ArrayWithNormsExperimental,
+        _ArrayWithRandomExperimental,
+        _ArrayWithSearchingExperimental,
+        _ArrayWithSetExperimental,
+        _ArrayWithSortingExperimental,
+        _ArrayWithStatisticalExperimental,
+        _ArrayWithUtilityExperimental,
+    )
+    _metaclass = abc.ABCMeta
+else:
+    from ivy.utils.lazy_import import DeferredMixins as _metaclass
+
+    # the mixins are attached on first use, see ivy.utils.lazy_import
+    _bases = (abc.ABC,)
+
+
+class Array(*_bases, metaclass=_metaclass):
+    # the metadata and view tracking state live in slots rather than in an instance
+    # dict, which keeps the many small arrays created during computation compact
+    __slots__ = (
+        "_data",
+        "_shape",
+        "_dtype",
+        "_device",
+        "_itemsize",
+        "_dynamic_backend",
+        "_backend",
+        "backend",
+        "_view_state",
+        "__weakref__",
+    )
+
+    _pre_repr = "ivy.array"
+
     def __init__(self, data, dynamic_backend=None):
-        _ArrayWithActivations.__init__(self)
-        _ArrayWithCreation.__init__(self)
-        _ArrayWithDataTypes.__init__(self)
-        _ArrayWithDevice.__init__(self)
-        _ArrayWithElementwise.__init__(self)
-        _ArrayWithGeneral.__init__(self)
-        _ArrayWithGradients.__init__(self)
-        _ArrayWithImage.__init__(self)
-        _ArrayWithLayers.__init__(self)
-        _ArrayWithLinearAlgebra.__init__(self)
-        _ArrayWithLosses.__init__(self)
-        _ArrayWithManipulation.__init__(self)
-        _ArrayWithNorms.__init__(self)
-        _ArrayWithRandom.__init__(self)
-        _ArrayWithSearching.__init__(self)
-        _ArrayWithSet.__init__(self)
-        _ArrayWithSorting.__init__(self)
-        _ArrayWithStatistical.__init__(self)
-        _ArrayWithUtility.__init__(self)
-        _ArrayWithActivationsExperimental.__init__(self),
-        _ArrayWithConversionsExperimental.__init__(self),
-        _ArrayWithCreationExperimental.__init__(self),
-        _ArrayWithData_typeExperimental.__init__(self),
-        _ArrayWithDeviceExperimental.__init__(self),
-        _ArrayWithElementWiseExperimental.__init__(self),
-        _ArrayWithGeneralExperimental.__init__(self),
-        _ArrayWithGradientsExperimental.__init__(self),
-        _ArrayWithImageExperimental.__init__(self),
-        _ArrayWithLayersExperimental.__init__(self),
-        _ArrayWithLinearAlgebraExperimental.__init__(self),
-        _ArrayWithLossesExperimental.__init__(self),
-        _ArrayWithManipulationExperimental.__init__(self),
-        _ArrayWithNormsExperimental.__init__(self),
-        _ArrayWithRandomExperimental.__init__(self),
-        _ArrayWithSearchingExperimental.__init__(self),
-        _ArrayWithSetExperimental.__init__(self),
-        _ArrayWithSortingExperimental.__init__(self),
-        _ArrayWithStatisticalExperimental.__init__(self),
-        _ArrayWithUtilityExperimental.__init__(self),
         self._init(data, dynamic_backend)
         self._view_attributes(data)
 
@@ -149,31 +140,104 @@ class Array(
                 "data must be ivy array, native array or ndarray"
             )
         self._shape = self._data.shape
-        self._size = (
-            functools.reduce(mul, self._data.shape) if len(self._data.shape) > 0 else 0
-        )
-        self._itemsize = ivy.itemsize(self._data)
-        self._dtype = ivy.dtype(self._data)
-        self._device = ivy.dev(self._data)
-        self._dev_str = ivy.as_ivy_dev(self._device)
-        self._pre_repr = "ivy.array"
-        if "gpu" in self._dev_str:
-            self._post_repr = ", dev={})".format(self._dev_str)
-        else:
-            self._post_repr = ")"
         self.backend = ivy.current_backend_str()
+        if self.backend == "":
+            # with no backend set, the backend inferred for the data may not be the
+            # one set by the time the metadata is read, so it's computed right away
+            self._dtype = ivy.dtype(self._data)
+            self._device = ivy.dev(self._data)
+            self._itemsize = ivy.itemsize(self._data)
+        else:
+            # otherwise dtype, device and itemsize are computed on first access
+            self._dtype = None
+            self._device = None
+            self._itemsize = None
         if dynamic_backend is not None:
             self._dynamic_backend = dynamic_backend
         else:
             self._dynamic_backend = ivy.get_dynamic_backend()
 
     def _view_attributes(self, data):
-        self._base = None
-        self._view_refs = []
-        self._manipulation_stack = []
-        self._torch_base = None
-        self._torch_view_refs = []
-        self._torch_manipulation = None
+        # allocated by _views once the array is involved in a view
+        self._view_state = None
+
+    def _views(self):
+        if self._view_state is None:
+            self._view_state = _ViewState()
+        return self._view_state
+
+    def _metadata(self, fn_name):
+        # the metadata is computed lazily, so it's computed with the backend which
+        # created the array rather than the backend which is set at the time
+        if ivy.is_local() or self.backend == ivy.current_backend_str():
+            backend = ivy
+        else:
+            # the backend module computes it on the native data, without compiling a
+            # whole local ivy for that backend
+            backend = importlib.import_module(
+                ivy.utils.backend.handler._backend_dict[self.backend]
+            )
+        try:
+            return getattr(backend, fn_name)(self._data)
+        except AttributeError as e:
+            # an AttributeError raised within a property would otherwise fall
+            # through to __getattr__ and be reported as a missing attribute
+            raise ivy.utils.exceptions.IvyBackendException(
+                "failed to compute the {} of the array".format(fn_name)
+            ) from e
+
+    # View Attributes #
+    # --------------- #
+
+    @property
+    def _base(self):
+        return None if self._view_state is None else self._view_state.base
+
+    @_base.setter
+    def _base(self, value):
+        self._views().base = value
+
+    @property
+    def _view_refs(self):
+        return self._views().view_refs
+
+    @_view_refs.setter
+    def _view_refs(self, value):
+        self._views().view_refs = value
+
+    @property
+    def _manipulation_stack(self):
+        return self._views().manipulation_stack
+
+    @_manipulation_stack.setter
+    def _manipulation_stack(self, value):
+        self._views().manipulation_stack = value
+
+    @property
+    def _torch_base(self):
+        return None if self._view_state is None else self._view_state.torch_base
+
+    @_torch_base.setter
+    def _torch_base(self, value):
+        self._views().torch_base = value
+
+    @property
+    def _torch_view_refs(self):
+        return self._views().torch_view_refs
+
+    @_torch_view_refs.setter
+    def _torch_view_refs(self, value):
+        self._views().torch_view_refs = value
+
+    @property
+    def _torch_manipulation(self):
+        if self._view_state is None:
+            return None
+        return self._view_state.torch_manipulation
+
+    @_torch_manipulation.setter
+    def _torch_manipulation(self, value):
+        self._views().torch_manipulation = value
 
     # Properties #
     # ---------- #
@@ -218,11 +282,15 @@ class Array(
     @property
     def dtype(self) -> ivy.Dtype:
         """Data type of the array elements"""
+        if self._dtype is None:
+            self._dtype = self._metadata("dtype")
         return self._dtype
 
     @property
     def device(self) -> ivy.Device:
         """Hardware device the array data resides on."""
+        if self._device is None:
+            self._device = self._metadata("dev")
         return self._device
 
     @property
@@ -254,11 +322,13 @@ class Array(
     @property
     def size(self) -> Optional[int]:
         """Number of elements in the array."""
-        return self._size
+        return functools.reduce(mul, self._shape) if len(self._shape) > 0 else 0
 
     @property
     def itemsize(self) -> Optional[int]:
         """Size of array elements in bytes."""
+        if self._itemsize is None:
+            self._itemsize = self._metadata("itemsize")
         return self._itemsize
 
     @property
@@ -349,21 +419,20 @@ class Array(
             # from the currently set backend
             backend = ivy.with_backend(self.backend, cached=True)
         arr_np = backend.to_numpy(self._data)
-        rep = ivy.vec_sig_fig(arr_np, sig_fig) if self._size > 0 else np.array(arr_np)
+        rep = ivy.vec_sig_fig(arr_np, sig_fig) if self.size > 0 else np.array(arr_np)
+        dev_str = ivy.as_ivy_dev(self.device)
+        post_repr = ", dev={})".format(dev_str) if "gpu" in dev_str else ")"
         with np.printoptions(precision=dec_vals):
             repr = rep.__repr__()[:-1].partition(", dtype")[0].partition(", dev")[0]
             return (
                 self._pre_repr
                 + repr[repr.find("(") :]
-                + self._post_repr.format(ivy.current_backend_str())
+                + post_repr.format(ivy.current_backend_str())
             )
 
     def __dir__(self):
         return self._data.__dir__()
 
-    def __getattribute__(self, item):
-        return super().__getattribute__(item)
-
     def __getattr__(self, item):
         try:
             attr = self._data.__getattribute__(item)
@@ -382,7 +451,7 @@ class Array(
             self._data.__setitem__(query, val)
         except (AttributeError, TypeError):
             self._data = ivy.scatter_nd(query, val, reduction="replace", out=self)._data
-            self._dtype = ivy.dtype(self._data)
+            self._dtype = None
 
     def __contains__(self, key):
         return self._data.__contains__(key)
@@ -410,7 +479,9 @@ class Array(
         ivy_array = ivy.array(state["data"])
         ivy.previous_backend()
 
-        self.__dict__ = ivy_array.__dict__
+        for attr in ivy.Array.__slots__:
+            if attr != "__weakref__" and hasattr(ivy_array, attr):
+                setattr(self, attr, getattr(ivy_array, attr))
 
         # TODO: what about placement of the array on the right device ?
         # device = backend.as_native_dev(state["device_str"])
@@ -1130,3 +1201,73 @@ class Array(
         ]:
             return iter([to_ivy(i) for i in ivy.unstack(self._data)])
         return iter([to_ivy(i) for i in self._data])
+
+
+if _lazy_import:
+    from ivy.utils.lazy_import import defer_mixins
+
+    defer_mixins(
+        Array,
+        (
+            "activations._ArrayWithActivations",
+            "creation._ArrayWithCreation",
+            "data_type._ArrayWithDataTypes",
+            "device._ArrayWithDevice",
+            "elementwise._ArrayWithElementwise",
+            "general._ArrayWithGeneral",
+            "gradients._ArrayWithGradients",
+            "image._ArrayWithImage",
+            "layers._ArrayWithLayers",
+            "linear_algebra._ArrayWithLinearAlgebra",
+            "losses._ArrayWithLosses",
+            "manipulation._ArrayWithManipulation",
+            "norms._ArrayWithNorms",
+            "random._ArrayWithRandom",
+            "searching._ArrayWithSearching",
+            "set._ArrayWithSet",
+            "sorting._ArrayWithSorting",
+            "statistical._ArrayWithStatistical",
+            "utility._ArrayWithUtility",
+            "experimental._ArrayWithActivationsExperimental",
+            "experimental._ArrayWithConversionsExperimental",
+            "experimental._ArrayWithCreationExperimental",
+            "experimental._ArrayWithData_typeExperimental",
+            "experimental._ArrayWithDeviceExperimental",
+            "experimental._ArrayWithElementWiseExperimental",
+            "experimental._ArrayWithGeneralExperimental",
+            "experimental._ArrayWithGradientsExperimental",
+            "experimental._ArrayWithImageExperimental",
+            "experimental._ArrayWithLayersExperimental",
+            "experimental._ArrayWithLinearAlgebraExperimental",
+            "experimental._ArrayWithLossesExperimental",
+            "experimental._ArrayWithManipulationExperimental",
+            "experimental._ArrayWithNormsExperimental",
+            "experimental._ArrayWithRandomExperimental",
+            "experimental._ArrayWithSearchingExperimental",
+            "experimental._ArrayWithSetExperimental",
+            "experimental._ArrayWithSortingExperimental",
+            "experimental._ArrayWithStatisticalExperimental",
+            "experimental._ArrayWithUtilityExperimental",
+        ),
+    )
+
+
+class _ViewState:
+    """The view tracking state of an ivy.Array, see ivy.func_wrapper._build_view."""
+
+    __slots__ = (
+        "base",
+        "view_refs",
+        "manipulation_stack",
+        "torch_base",
+        "torch_view_refs",
+        "torch_manipulation",
+    )
+
+    def __init__(self):
+        self.base = None
+        self.view_refs = []
+        self.manipulation_stack = []
+        self.torch_base = None
+        self.torch_view_refs = []
+        self.torch_manipulation = None
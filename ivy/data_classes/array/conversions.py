@@ -94,9 +94,8 @@ def args_to_ivy(
         instances.
 
     """
-    native_args = ivy.nested_map(args, _to_ivy, include_derived, shallow=False)
-    native_kwargs = ivy.nested_map(kwargs, _to_ivy, include_derived, shallow=False)
-    return native_args, native_kwargs
+    leaves, treedef = ivy.tree_flatten((args, kwargs), include_derived)
+    return ivy.tree_unflatten(treedef, [_to_ivy(x) for x in leaves])
 
 
 def to_native(
@@ -168,16 +167,7 @@ def args_to_native(
         native form.
 
     """
-    native_args = ivy.nested_map(
-        args,
-        lambda x: _to_native(x, inplace=cont_inplace),
-        include_derived,
-        shallow=False,
+    leaves, treedef = ivy.tree_flatten((args, kwargs), include_derived)
+    return ivy.tree_unflatten(
+        treedef, [_to_native(x, inplace=cont_inplace) for x in leaves]
     )
-    native_kwargs = ivy.nested_map(
-        kwargs,
-        lambda x: _to_native(x, inplace=cont_inplace),
-        include_derived,
-        shallow=False,
-    )
-    return native_args, native_kwargs
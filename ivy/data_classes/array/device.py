@@ -9,6 +9,8 @@ import ivy
 
 
 class _ArrayWithDevice(abc.ABC):
+    __slots__ = ()
+
     def dev(
         self: ivy.Array, *, as_native: bool = False
     ) -> Union[ivy.Device, ivy.NativeDevice]:
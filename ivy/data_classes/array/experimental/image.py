@@ -3,4 +3,4 @@ import abc
 
 
 class _ArrayWithImageExperimental(abc.ABC):
-    pass
+    __slots__ = ()
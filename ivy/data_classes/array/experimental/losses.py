@@ -3,4 +3,4 @@ import abc
 
 
 class _ArrayWithLossesExperimental(abc.ABC):
-    pass
+    __slots__ = ()
@@ -7,6 +7,8 @@ import ivy
 
 
 class _ArrayWithRandomExperimental(abc.ABC):
+    __slots__ = ()
+
     def dirichlet(
         self: ivy.Array,
         /,
@@ -7,6 +7,8 @@ import ivy
 
 
 class _ArrayWithStatisticalExperimental(abc.ABC):
+    __slots__ = ()
+
     def median(
         self: ivy.Array,
         /,
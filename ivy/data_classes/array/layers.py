@@ -12,6 +12,8 @@ import ivy
 
 
 class _ArrayWithLayers(abc.ABC):
+    __slots__ = ()
+
     def linear(
         self: ivy.Array,
         weight: Union[ivy.Array, ivy.NativeArray],
@@ -247,6 +249,7 @@ class _ArrayWithLayers(abc.ABC):
         /,
         *,
         mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        chunk_size: Optional[int] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         """
@@ -276,6 +279,9 @@ class _ArrayWithLayers(abc.ABC):
             The mask input array. The mask to apply to the query-key values.
             Default is None. The shape of mask input should be in
             *[batch_shape,num_queries,num_keys]*.
+        chunk_size
+            The number of keys to attend to at once. Default is ``None``, in which
+            case all the keys are attended to at once.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -316,6 +322,7 @@ class _ArrayWithLayers(abc.ABC):
             v,
             scale,
             mask=mask,
+            chunk_size=chunk_size,
             out=out,
         )
 
@@ -333,6 +340,7 @@ class _ArrayWithLayers(abc.ABC):
         to_q_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_kv_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_out_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        chunk_size: Optional[int] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         return ivy.multi_head_attention(
@@ -347,6 +355,7 @@ class _ArrayWithLayers(abc.ABC):
             to_q_v=to_q_v,
             to_kv_v=to_kv_v,
             to_out_v=to_out_v,
+            chunk_size=chunk_size,
             out=out,
         )
 
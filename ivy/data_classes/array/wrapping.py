@@ -1,5 +1,6 @@
 # local
 import ivy
+from ivy.utils.inspection import _get_array_spec
 
 # global
 from typing import Callable, Type, List, Iterable
@@ -39,7 +40,7 @@ def _wrap_function(function_name: str) -> Callable:
         """
         function = ivy.__dict__[function_name]
         # gives us the position and name of the array argument
-        data_idx = function.array_spec[0]
+        data_idx = _get_array_spec(function)[0]
         if len(args) >= data_idx[0][0]:
             args = ivy.copy_nest(args, to_mutable=True)
             data_idx = [data_idx[0][0]] + [
@@ -13,13 +13,9 @@ import json
 from ivy.utils.exceptions import IvyBackendException, IvyException
 
 
-try:
-    # noinspection PyPackageRequirements
-    import h5py
-except ModuleNotFoundError:
-    h5py = None
 import pickle
 import random
+from concurrent.futures import ThreadPoolExecutor
 from operator import mul
 from functools import reduce
 from typing import Union, Tuple
@@ -32,6 +28,47 @@ import ivy
 ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
 
+def _import_h5py():
+    # h5py is only needed by the hdf5 methods, so it isn't imported with ivy
+    try:
+        # noinspection PyPackageRequirements
+        import h5py
+    except ModuleNotFoundError:
+        h5py = None
+    return h5py
+
+
+def _read_h5_dataset(dataset, slice_obj, mmap):
+    # contiguous datasets are raw bytes at an offset of the file, so they can be
+    # mapped rather than read, unless they're held in memory or not yet written
+    if (
+        mmap
+        and dataset.chunks is None
+        and dataset.size
+        and not dataset.dtype.hasobject
+        and dataset.file.driver == "sec2"
+    ):
+        offset = dataset.id.get_offset()
+        if offset is not None:
+            return np.memmap(
+                dataset.file.filename,
+                dtype=dataset.dtype,
+                mode="r",
+                offset=offset,
+                shape=dataset.shape,
+            )[slice_obj]
+    # read straight into a numpy array
+    return dataset[slice_obj]
+
+
+_FLAT_MAGIC = b"IVYFLAT\x00"
+_FLAT_VERSION = 1
+
+
+def _align(nbytes, alignment):
+    return -(-nbytes // alignment) * alignment
+
+
 def _is_jsonable(x):
     try:
         json.dumps(x)
@@ -47,10 +84,219 @@ def _repr(x):
         return str(x)
 
 
+def _segment_norms(x, segment_ids, num_segments, ord=2):
+    if ord == 2:
+        return ivy.bincount(segment_ids, weights=x * x, minlength=num_segments) ** 0.5
+    return ivy.bincount(
+        segment_ids, weights=ivy.abs(x) ** ord, minlength=num_segments
+    ) ** (1 / ord)
+
+
+def _cont_tree_node(cont, leaves, prune_empty=False, config=None):
+    # the node of a container for an ivy.TreeDef, with the sub-containers as dict
+    # nodes and anything else as a leaf, as cont_map traverses the container, or None
+    # if config is given and any sub-container has a different one
+    keys = list()
+    children = list()
+    for key, value in cont.items():
+        if isinstance(value, ivy.Container):
+            if config is not None and value._config != config:
+                return None
+            child = _cont_tree_node(value, leaves, prune_empty, config)
+            if child is None:
+                return None
+            if prune_empty and not child[1]:
+                continue
+        else:
+            leaves.append(value)
+            child = None
+        keys.append(key)
+        children.append(child)
+    return dict, tuple(keys), tuple(children)
+
+
+class _FlatLayout:
+    def __init__(self, xs):
+        """Record where each leaf of a container lives in a flat buffer, with one
+        buffer for the leaves of each dtype and device.
+
+        Parameters
+        ----------
+        xs
+            Container of arrays to lay out.
+
+        """
+        # noinspection PyProtectedMember
+        leaves, self._treedef = xs._cont_tree_flatten()
+        self._config = xs.cont_config
+        self._key_chains = list()
+        self._shapes = dict()
+        self.offsets = dict()
+        for kc, x in zip(self._treedef.key_chains, leaves):
+            if not isinstance(x, ivy.Array):
+                x = ivy.Array(x)
+            shape = tuple(x._shape)
+            offsets = self.offsets.setdefault((x.dtype, x.device), list())
+            start = offsets[-1][2] if offsets else 0
+            offsets.append((kc, start, start + reduce(mul, shape, 1)))
+            self._key_chains.append(kc)
+            self._shapes[kc] = shape
+        self.segment_ids = {
+            group: ivy.repeat(
+                ivy.arange(len(offsets), dtype="int64", device=group[1]),
+                [stop - start for _, start, stop in offsets],
+            )
+            for group, offsets in self.offsets.items()
+        }
+        self.num_segments = {
+            group: len(offsets) for group, offsets in self.offsets.items()
+        }
+
+    @property
+    def groups(self):
+        return list(self.offsets)
+
+    def matches(self, other):
+        return self is other or (
+            self._shapes == other._shapes
+            and self._key_chains == other._key_chains
+            and self.offsets == other.offsets
+        )
+
+    def pack(self, xs):
+        """Concatenate the flattened leaves of a container into one buffer per group.
+
+        Parameters
+        ----------
+        xs
+            Container of arrays with the same key chains as the laid out container.
+
+        Returns
+        -------
+            Dict from each (dtype, device) group to its flat buffer.
+
+        """
+        leaves = dict(xs.cont_to_iterator())
+        if leaves.keys() != self._shapes.keys():
+            raise ivy.utils.exceptions.IvyException(
+                "the key chains {} do not match the laid out key chains {}".format(
+                    list(leaves), self._key_chains
+                )
+            )
+        return {
+            group: ivy.concat([leaves[kc] for kc, _, _ in offsets], axis=None)
+            for group, offsets in self.offsets.items()
+        }
+
+    def items(self, buffers):
+        """Iterate over the key chains and leaves of flat buffers, in the order of the
+        laid out container. Each leaf is sliced and reshaped with the native methods of
+        its buffer, so it is a view of the buffer where the backend supports views.
+
+        Parameters
+        ----------
+        buffers
+            Dict from each (dtype, device) group to its flat native or numpy buffer.
+
+        Returns
+        -------
+            Iterator of key chains and leaves.
+
+        """
+        leaves = dict()
+        for group, offsets in self.offsets.items():
+            buffer = buffers[group]
+            reshape = (
+                np.reshape
+                if isinstance(buffer, np.ndarray)
+                else ivy.current_backend(buffer).reshape
+            )
+            for kc, start, stop in offsets:
+                leaves[kc] = reshape(buffer[start:stop], self._shapes[kc])
+        return ((kc, leaves[kc]) for kc in self._key_chains)
+
+    def unpack(self, buffers):
+        """Split flat buffers back into a container of leaves, each leaf being a view
+        of its buffer where the backend supports views.
+
+        Parameters
+        ----------
+        buffers
+            Dict from each (dtype, device) group to its flat buffer.
+
+        Returns
+        -------
+            Container of arrays with the laid out key chains and shapes.
+
+        """
+        leaves = [
+            ivy.Array(x)
+            for _, x in self.items(
+                {group: ivy.to_native(x) for group, x in buffers.items()}
+            )
+        ]
+        return ivy.Container(ivy.tree_unflatten(self._treedef, leaves), **self._config)
+
+    def unpack_segments(self, values):
+        """Build a container holding one value per leaf, from arrays holding the
+        values of the leaves of each group in order.
+
+        Parameters
+        ----------
+        values
+            Dict from each (dtype, device) group to the values of its leaves.
+
+        Returns
+        -------
+            Container with the laid out key chains, and 0-dim arrays as leaves.
+
+        """
+        leaves = dict()
+        for group, offsets in self.offsets.items():
+            group_values = ivy.to_native(values[group])
+            for i, (kc, _, _) in enumerate(offsets):
+                leaves[kc] = ivy.Array(group_values[i, ...])
+        return ivy.Container(
+            ivy.tree_unflatten(self._treedef, [leaves[kc] for kc in self._key_chains]),
+            **self._config,
+        )
+
+    def to_device(self, device):
+        """Lay out the same leaves on another device, or return None if leaves now
+        on different devices would have to share a buffer.
+
+        Parameters
+        ----------
+        device
+            Device to move the layout to.
+
+        Returns
+        -------
+            The new layout, with its groups in the same order.
+
+        """
+        device = ivy.as_ivy_dev(device)
+        if len(set(dtype for dtype, _ in self.offsets)) < len(self.offsets):
+            return None
+        ret = copy.copy(self)
+        ret.offsets = {
+            (dtype, device): offsets for (dtype, _), offsets in self.offsets.items()
+        }
+        ret.segment_ids = {
+            (dtype, device): ivy.to_device(segment_ids, device)
+            for (dtype, _), segment_ids in self.segment_ids.items()
+        }
+        ret.num_segments = dict(zip(ret.offsets, self.num_segments.values()))
+        return ret
+
+
 # noinspection PyMissingConstructor
 
 
 class ContainerBase(dict, abc.ABC):
+    # the layout, flat buffers and leaves of a packed container
+    _packed = None
+
     def __init__(
         self,
         dict_in=None,
@@ -680,7 +926,8 @@ class ContainerBase(dict, abc.ABC):
         key_chain
             Chain of keys for this dict entry (Default value = '')
         config
-            The configuration for the containers. Default is the same as container0.
+            The configuration for the containers. Default is the same as container0,
+            with each sub-container taking the config of the one in container0.
         map_sequences
             Whether to also map method to sequences (lists, tuples).
             Default is ``False``.
@@ -692,6 +939,35 @@ class ContainerBase(dict, abc.ABC):
             Container
 
         """
+        if (
+            key_chains is None
+            and not prune_unapplied
+            and not map_nests
+            and key_chain == ""
+            and all(isinstance(cont, ivy.Container) for cont in containers)
+        ):
+            # containers of the same structure are mapped over their flat leaves, so
+            # long as the sub-containers of the result all take the same config
+            # noinspection PyProtectedMember
+            flat = [
+                cont._cont_tree_flatten(
+                    prune_empty=True, same_config=i == 0 and not ivy.exists(config)
+                )
+                for i, cont in enumerate(containers)
+            ]
+            treedef = None if flat[0] is None else flat[0][1]
+            if treedef is not None and all(treedef == td for _, td in flat[1:]):
+                values = zip(*[leaves for leaves, _ in flat])
+                return ivy.Container(
+                    ivy.tree_unflatten(
+                        treedef,
+                        [
+                            func(list(vals), kc)
+                            for vals, kc in zip(values, treedef.key_chains)
+                        ],
+                    ),
+                    **(config if ivy.exists(config) else containers[0].cont_config),
+                )._cont_inherit_packed(containers[0])
         # retrieve all keys and the first container if it exists
         keys = set([])
         container0 = None
@@ -705,8 +981,12 @@ class ContainerBase(dict, abc.ABC):
             container0,
             message="No containers found in the inputs to ivy.Container.cont_multi_map",
         )
-        if not ivy.exists(config):
-            config = (
+        # the config is passed on as given, so the sub-containers of the result take
+        # the configs of those in container0 by default
+        if ivy.exists(config):
+            cont_config = config
+        else:
+            cont_config = (
                 container0.cont_config if isinstance(container0, ivy.Container) else {}
             )
         return_dict = dict()
@@ -777,7 +1057,9 @@ class ContainerBase(dict, abc.ABC):
                 return_dict[key] = value0
 
             # noinspection PyProtectedMember
-        return ivy.Container(return_dict, **config)
+        return ivy.Container(return_dict, **cont_config)._cont_inherit_packed(
+            containers[0]
+        )
 
     @staticmethod
     def cont_common_key_chains(containers):
@@ -1095,7 +1377,11 @@ class ContainerBase(dict, abc.ABC):
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        mmap=False,
     ):
         """Load container object from disk, as an h5py file, at the specified hdf5
         filepath.
@@ -1112,31 +1398,39 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        mmap
+            Whether to memory-map the contiguous datasets of the file rather than
+            reading them, such that their bytes are only read from disk once used.
+            Chunked or compressed datasets are always read. Default is ``False``.
 
         Returns
         -------
             Container loaded from disk
 
         """
+        h5py = _import_h5py()
         ivy.utils.assertions.check_exists(
             h5py,
             message="You must install python package h5py in order to load hdf5 \
             files from disk into a container.",
         )
-        container_dict = dict()
         if type(h5_obj_or_filepath) is str:
-            h5_obj = h5py.File(h5_obj_or_filepath, "r")
-        else:
-            h5_obj = h5_obj_or_filepath
+            with h5py.File(h5_obj_or_filepath, "r") as h5_obj:
+                return ivy.Container.cont_from_disk_as_hdf5(
+                    h5_obj, slice_obj, alphabetical_keys, ivyh, mmap
+                )
+        h5_obj = h5_obj_or_filepath
+        container_dict = dict()
         items = sorted(h5_obj.items()) if alphabetical_keys else h5_obj.items()
         for key, value in items:
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value, slice_obj, alphabetical_keys, ivyh, mmap
                 )
             elif isinstance(value, h5py.Dataset):
+                value = _read_h5_dataset(value, slice_obj, mmap)
                 container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj]), dtype=str(value[slice_obj].dtype)
+                    value, dtype=str(value.dtype)
                 )
             else:
                 raise ivy.utils.exceptions.IvyException(
@@ -1144,6 +1438,62 @@ class ContainerBase(dict, abc.ABC):
                 )
         return ivy.Container(container_dict, ivyh=ivyh)
 
+    @staticmethod
+    def cont_from_disk_as_flat(flat_filepath, ivyh=None):
+        """Load container object from disk at the specified flat checkpoint filepath,
+        as saved by ``cont_to_disk_as_flat``.
+
+        The file is memory-mapped read-only, and each leaf is a view of its bytes, so
+        nothing is read from disk until the arrays are used, and only the pages which
+        are used are read, such as those of the leaves accessed with
+        ``cont_at_key_chain`` or of the slices taken of them. The mapped pages are
+        shared by all the processes loading the same file.
+
+        Parameters
+        ----------
+        flat_filepath
+            Filepath where the container object is saved to disk.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+
+        Returns
+        -------
+            Container loaded from disk
+
+        """
+        with open(flat_filepath, "rb") as flat_file:
+            magic = flat_file.read(len(_FLAT_MAGIC))
+            if magic != _FLAT_MAGIC:
+                raise ivy.utils.exceptions.IvyException(
+                    "{} is not a flat container checkpoint.".format(flat_filepath)
+                )
+            header_size = int(np.frombuffer(flat_file.read(8), "<u8")[0])
+            header = json.loads(flat_file.read(header_size).decode("utf-8"))
+        if header["version"] > _FLAT_VERSION:
+            raise ivy.utils.exceptions.IvyException(
+                "flat container checkpoint version {} is not supported.".format(
+                    header["version"]
+                )
+            )
+        data_offset = _align(len(_FLAT_MAGIC) + 8 + header_size, header["alignment"])
+        buffer = np.memmap(flat_filepath, dtype=np.uint8, mode="r")
+        container_dict = dict()
+        for leaf in header["leaves"]:
+            start = data_offset + leaf["offset"]
+            value = (
+                buffer[start : start + leaf["nbytes"]]
+                .view(leaf["dtype"])
+                .reshape(leaf["shape"])
+            )
+            sub_dict = container_dict
+            for key in leaf["keys"][:-1]:
+                sub_dict = sub_dict.setdefault(key, dict())
+            sub_dict[leaf["keys"][-1]] = ivy.default(ivyh, ivy).array(
+                value, dtype=str(value.dtype)
+            )
+        return ivy.Container(container_dict, ivyh=ivyh)
+
     @staticmethod
     def cont_from_disk_as_pickled(pickle_filepath, ivyh=None):
         """Load container object from disk at the specified pickle filepath.
@@ -1202,6 +1552,7 @@ class ContainerBase(dict, abc.ABC):
             Size of h5 file contents, and batch size.
 
         """
+        h5py = _import_h5py()
         ivy.utils.assertions.check_exists(
             h5py,
             message="You must install python package h5py in order to determine \
@@ -1241,6 +1592,7 @@ class ContainerBase(dict, abc.ABC):
             random seed to use for array shuffling (Default value = 0)
 
         """
+        h5py = _import_h5py()
         ivy.utils.assertions.check_exists(
             h5py,
             message="You must install python package h5py in order to shuffle \
@@ -1539,6 +1891,124 @@ class ContainerBase(dict, abc.ABC):
                 del return_cont[k]
         return return_cont
 
+    def _cont_tree_flatten(self, prune_empty=False, same_config=False):
+        # the leaves and the ivy.TreeDef of the container, whose sub-containers
+        # unflatten to dicts, which ivy.Container then turns into sub-containers with
+        # its config, optionally leaving out the sub-containers without any leaves,
+        # or None if same_config is set and any sub-container has a different config
+        # noinspection PyProtectedMember
+        from ivy.functional.ivy.nest import _treedef
+
+        leaves = list()
+        node = _cont_tree_node(
+            self, leaves, prune_empty, self._config if same_config else None
+        )
+        if node is None:
+            return None
+        return leaves, _treedef(node)
+
+    @staticmethod
+    def _cont_from_packed(layout, buffers):
+        ret = layout.unpack(buffers)
+        ret._packed = (layout, buffers, ret.cont_to_flat_list())
+        return ret
+
+    def _cont_packed_state(self):
+        # a packed container stays packed while it holds the leaves it was built with,
+        # setting any leaf leaves the buffers behind, so the container is unpacked
+        if self._packed is None:
+            return None
+        layout, buffers, leaves = self._packed
+        current_leaves = self.cont_to_flat_list()
+        if len(current_leaves) != len(leaves) or any(
+            x is not y for x, y in zip(current_leaves, leaves)
+        ):
+            self._packed = None
+            return None
+        return layout, buffers
+
+    def _cont_inherit_packed(self, container):
+        # a map which returned the leaves of a packed container as they were, such as
+        # a conversion to ivy arrays, leaves this container packed in the same buffers
+        if isinstance(container, ivy.Container) and container._packed is not None:
+            self._packed = container._packed
+            self._cont_packed_state()
+        return self
+
+    @staticmethod
+    def _cont_packed_op(fn, operands):
+        layout = None
+        buffers = list()
+        for operand in operands:
+            if isinstance(operand, ivy.Container):
+                state = operand._cont_packed_state()
+                if state is None or (
+                    layout is not None and not layout.matches(state[0])
+                ):
+                    return None
+                layout = state[0]
+                buffers.append(state[1])
+            elif isinstance(operand, (int, float)):
+                buffers.append(operand)
+            else:
+                return None
+        if layout is None:
+            return None
+        return ContainerBase._cont_from_packed(
+            layout,
+            {
+                group: fn(*[b[group] if isinstance(b, dict) else b for b in buffers])
+                for group in layout.groups
+            },
+        )
+
+    def _cont_packed_vector_norm(self, ord):
+        state = self._cont_packed_state()
+        if state is None or ord in [0, float("inf"), -float("inf")]:
+            return None
+        layout, buffers = state
+        if not all(ivy.is_float_dtype(buffer) for buffer in buffers.values()):
+            return None
+        return layout.unpack_segments(
+            {
+                group: _segment_norms(
+                    buffer, layout.segment_ids[group], layout.num_segments[group], ord
+                )
+                for group, buffer in buffers.items()
+            }
+        )
+
+    def _cont_packed_clip_vector_norm(self, max_norm, p):
+        state = self._cont_packed_state()
+        if state is None or p in [0, float("inf"), -float("inf")]:
+            return None
+        layout, buffers = state
+        if not all(ivy.is_float_dtype(buffer) for buffer in buffers.values()):
+            return None
+        new_buffers = dict()
+        for group, buffer in buffers.items():
+            segment_ids = layout.segment_ids[group]
+            norms = _segment_norms(buffer, segment_ids, layout.num_segments[group], p)
+            ratios = ivy.minimum(ivy.stable_divide(max_norm, norms), 1.0)
+            new_buffers[group] = buffer * ivy.gather(ratios, segment_ids)
+        return ContainerBase._cont_from_packed(layout, new_buffers)
+
+    def _cont_packed_to_device(self, device):
+        state = self._cont_packed_state()
+        if state is None:
+            return None
+        layout, buffers = state
+        new_layout = layout.to_device(device)
+        if new_layout is None:
+            return None
+        return ContainerBase._cont_from_packed(
+            new_layout,
+            {
+                new_group: ivy.to_device(buffers[group], device)
+                for group, new_group in zip(layout.groups, new_layout.groups)
+            },
+        )
+
     # Public Methods #
     # ---------------#
 
@@ -1658,9 +2128,13 @@ class ContainerBase(dict, abc.ABC):
 
         Returns
         -------
-            Boolean, whether all entries are boolean True.
+            Boolean, whether all entries are boolean True. For a packed container,
+            whether all the elements of its leaves are True.
 
         """
+        state = None if assert_is_bool else self._cont_packed_state()
+        if state is not None and key_chains is None and not map_sequences:
+            return all(bool(ivy.all(buffer)) for buffer in state[1].values())
         return bool(
             np.prod(
                 [
@@ -1705,9 +2179,13 @@ class ContainerBase(dict, abc.ABC):
 
         Returns
         -------
-            Boolean, whether all entries are boolean False.
+            Boolean, whether all entries are boolean False. For a packed container,
+            whether all the elements of its leaves are False.
 
         """
+        state = None if assert_is_bool else self._cont_packed_state()
+        if state is not None and key_chains is None and not map_sequences:
+            return not any(bool(ivy.any(buffer)) for buffer in state[1].values())
         return not bool(
             np.sum(
                 [
@@ -1933,7 +2411,15 @@ class ContainerBase(dict, abc.ABC):
         )
 
     def cont_to_disk_as_hdf5(
-        self, h5_obj_or_filepath, starting_index=0, mode="a", max_batch_size=None
+        self,
+        h5_obj_or_filepath,
+        starting_index=0,
+        mode="a",
+        max_batch_size=None,
+        chunks=None,
+        compression=None,
+        compression_opts=None,
+        num_workers=None,
     ):
         """Save container object to disk, as an h5py file, at the specified filepath.
 
@@ -1950,37 +2436,91 @@ class ContainerBase(dict, abc.ABC):
         max_batch_size
             Maximum batch size for the container on disk, this is useful if later
             appending to file. (Default value = None)
+        chunks
+            Chunk shape of the datasets created, or ``True`` for h5py to choose it.
+            ``False`` creates contiguous datasets, which can be memory-mapped when
+            loading but can't be resized or compressed. Default is ``None``, which
+            creates resizable datasets chunked by h5py.
+        compression
+            Compression filter of the datasets created, such as 'gzip' or 'lzf'.
+            Default is ``None``.
+        compression_opts
+            Options of the compression filter, such as the gzip level. Default is
+            ``None``.
+        num_workers
+            Number of threads converting the leaves to numpy, such that the device
+            to host copies of several leaves overlap. Default is ``None``, which
+            converts them one at a time while writing.
 
         """
+        h5py = _import_h5py()
         ivy.utils.assertions.check_exists(
             h5py,
             message="You must install python package h5py in order to save \
             containers to disk as hdf5 files.",
         )
         if type(h5_obj_or_filepath) is str:
-            h5_obj = h5py.File(h5_obj_or_filepath, mode)
-        else:
-            h5_obj = h5_obj_or_filepath
+            with h5py.File(h5_obj_or_filepath, mode) as h5_obj:
+                return self.cont_to_disk_as_hdf5(
+                    h5_obj,
+                    starting_index,
+                    mode,
+                    max_batch_size,
+                    chunks,
+                    compression,
+                    compression_opts,
+                    num_workers,
+                )
+        h5_obj = h5_obj_or_filepath
+        if num_workers is not None and num_workers > 1:
+            leaves = dict(self.cont_to_iterator())
+            with ThreadPoolExecutor(num_workers) as executor:
+                leaves = dict(
+                    zip(leaves, executor.map(self._cont_ivy.to_numpy, leaves.values()))
+                )
+            return self.cont_map(lambda x, kc: leaves[kc]).cont_to_disk_as_hdf5(
+                h5_obj,
+                starting_index,
+                mode,
+                max_batch_size,
+                chunks,
+                compression,
+                compression_opts,
+            )
         for key, value in self.items():
             if isinstance(value, ivy.Container):
-                if key not in h5_obj.keys():
-                    h5_group = h5_obj.create_group(key)
-                else:
-                    h5_group = h5_obj[key]
                 value.cont_to_disk_as_hdf5(
-                    h5_group, starting_index, mode, max_batch_size
+                    h5_obj.require_group(key),
+                    starting_index,
+                    mode,
+                    max_batch_size,
+                    chunks,
+                    compression,
+                    compression_opts,
                 )
             else:
-                value_as_np = self._cont_ivy.to_numpy(value)
+                value_as_np = (
+                    value
+                    if isinstance(value, np.ndarray)
+                    else self._cont_ivy.to_numpy(value)
+                )
                 value_shape = value_as_np.shape
                 this_batch_size = value_shape[0]
                 if not max_batch_size:
                     max_batch_size = starting_index + this_batch_size
-                if key not in h5_obj.keys():
+                if key not in h5_obj:
                     dataset_shape = [max_batch_size] + list(value_shape[1:])
-                    maxshape = [None for _ in dataset_shape]
+                    maxshape = (
+                        None if chunks is False else [None for _ in dataset_shape]
+                    )
                     h5_obj.create_dataset(
-                        key, dataset_shape, dtype=value_as_np.dtype, maxshape=maxshape
+                        key,
+                        dataset_shape,
+                        dtype=value_as_np.dtype,
+                        maxshape=maxshape,
+                        chunks=None if chunks is False else chunks,
+                        compression=compression,
+                        compression_opts=compression_opts,
                     )
                 space_left = max_batch_size - starting_index
                 amount_to_write = min(this_batch_size, space_left)
@@ -1988,6 +2528,80 @@ class ContainerBase(dict, abc.ABC):
                     starting_index : starting_index + amount_to_write
                 ] = value_as_np[0:amount_to_write]
 
+    def cont_to_disk_as_flat(self, flat_filepath, alignment=64):
+        """Save container object to disk, as a flat checkpoint, at the specified
+        filepath.
+
+        The file holds a header indexing the leaves by key chain, followed by the raw
+        bytes of each leaf, starting at offsets which are multiples of the alignment.
+        It can be loaded with ``cont_from_disk_as_flat``, which memory-maps it rather
+        than reading it. Leaves which aren't arrays are saved as 0-dim arrays.
+
+        Parameters
+        ----------
+        flat_filepath
+            Filepath for where to save the container to disk.
+        alignment
+            Alignment in bytes of the leaves in the file. Default is ``64``.
+
+        """
+        state = self._cont_packed_state()
+        if state is None:
+            items = self.cont_to_iterator()
+        else:
+            # copy each buffer to numpy at once, then save views of it
+            layout, buffers = state
+            items = layout.items(
+                {
+                    group: self._cont_ivy.to_numpy(buffer)
+                    for group, buffer in buffers.items()
+                }
+            )
+        leaves = list()
+        offset = 0
+        for key_chain, value in items:
+            if not isinstance(value, np.ndarray):
+                value = (
+                    self._cont_ivy.to_numpy(value)
+                    if self._cont_ivy.is_array(value)
+                    else np.asarray(value)
+                )
+            if value.dtype.hasobject:
+                raise ivy.utils.exceptions.IvyException(
+                    "leaf at key chain {} can't be saved in a flat checkpoint, as it "
+                    "holds python objects.".format(key_chain)
+                )
+            value = np.require(value, requirements="C")
+            leaves.append(
+                (
+                    value,
+                    {
+                        "keys": key_chain.split("/"),
+                        "dtype": value.dtype.str,
+                        "shape": list(value.shape),
+                        "offset": offset,
+                        "nbytes": value.nbytes,
+                    },
+                )
+            )
+            offset = _align(offset + value.nbytes, alignment)
+        header = json.dumps(
+            {
+                "version": _FLAT_VERSION,
+                "alignment": alignment,
+                "leaves": [leaf for _, leaf in leaves],
+            }
+        ).encode("utf-8")
+        data_offset = _align(len(_FLAT_MAGIC) + 8 + len(header), alignment)
+        with open(flat_filepath, "wb") as flat_file:
+            flat_file.write(_FLAT_MAGIC)
+            flat_file.write(np.array(len(header), "<u8").tobytes())
+            flat_file.write(header)
+            for value, leaf in leaves:
+                flat_file.seek(data_offset + leaf["offset"])
+                flat_file.write(value.data)
+            flat_file.truncate(data_offset + offset)
+
     def cont_to_disk_as_pickled(self, pickle_filepath):
         """Save container object to disk, as an pickled file, at the specified filepath.
 
@@ -3110,6 +3724,33 @@ class ContainerBase(dict, abc.ABC):
     def __deepcopy__(self, memo):
         return self.cont_deep_copy()
 
+    def cont_pack(self):
+        """Pack the leaves of this container into one flat buffer per dtype and
+        device.
+
+        The returned container has the same structure, with each leaf a view of its
+        buffer where the backend supports views. Elementwise arithmetic between packed
+        containers with the same layout or with python scalars, ``vector_norm``,
+        ``clip_vector_norm``, ``to_device``, ``cont_all_true``, ``cont_all_false`` and
+        ``cont_to_disk_as_flat`` then operate on each buffer at once, rather than on
+        each leaf. Setting any leaf of the packed container unpacks it, after which
+        these methods fall back to operating on each leaf.
+
+        Returns
+        -------
+            The packed container.
+
+        """
+        for key_chain, value in self.cont_to_iterator():
+            if not self._cont_ivy.is_array(value):
+                raise ivy.utils.exceptions.IvyException(
+                    "leaf at key chain {} can't be packed, as it isn't an array".format(
+                        key_chain
+                    )
+                )
+        layout = _FlatLayout(self)
+        return self._cont_from_packed(layout, layout.pack(self))
+
     def cont_map(
         self,
         func,
@@ -3148,6 +3789,26 @@ class ContainerBase(dict, abc.ABC):
             New container following the function mapped to each sub-array.
 
         """
+        flat = (
+            self._cont_tree_flatten(same_config=True)
+            if key_chains is None
+            and not prune_unapplied
+            and not map_sequences
+            and not inplace
+            and key_chain == ""
+            else None
+        )
+        if flat is not None:
+            # every leaf is mapped, and the sub-containers all have the config of this
+            # one, so the container is mapped over its flat leaves
+            leaves, treedef = flat
+            return ivy.Container(
+                ivy.tree_unflatten(
+                    treedef,
+                    [func(x, kc) for x, kc in zip(leaves, treedef.key_chains)],
+                ),
+                **self._config,
+            )._cont_inherit_packed(self)
         return_dict = self if inplace else dict()
         for key, value in self.items():
             this_key_chain = (
@@ -3186,7 +3847,7 @@ class ContainerBase(dict, abc.ABC):
                 return_dict[key] = func(value, this_key_chain)
         if inplace:
             return self
-        return ivy.Container(return_dict, **self._config)
+        return ivy.Container(return_dict, **self._config)._cont_inherit_packed(self)
 
     def cont_map_sub_conts(
         self,
@@ -4110,6 +4771,8 @@ class ContainerBase(dict, abc.ABC):
 
     def __getstate__(self):
         state_dict = copy.copy(self.__dict__)
+        # the leaves are pickled as they are, without the buffers they view
+        state_dict.pop("_packed", None)
         state_dict["_local_ivy"] = (
             state_dict["_local_ivy"].current_backend_str()
             if state_dict["_local_ivy"] is not None
@@ -4130,6 +4793,8 @@ class ContainerBase(dict, abc.ABC):
         return state_dict
 
     def __setstate__(self, state_dict):
+        # unpickling doesn't call the class, which attaches the mixins when lazy
+        ivy.utils.lazy_import.load()
         if "_local_ivy" in state_dict:
             if ivy.exists(state_dict["_local_ivy"]):
                 if len(state_dict["_local_ivy"]) > 0:
@@ -4203,6 +4868,13 @@ class ContainerBase(dict, abc.ABC):
         """
         return self._cont_get_dev()
 
+    @property
+    def cont_is_packed(self):
+        """Whether the container is packed, with its leaves still views of its flat
+        buffers.
+        """
+        return self._cont_packed_state() is not None
+
     @property
     def cont_ivy(self):
         return self._cont_ivy
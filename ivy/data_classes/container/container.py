@@ -1,95 +1,123 @@
 # global
+import abc
+import functools
 import operator
 
 # local
 import ivy
-from .activations import _ContainerWithActivations
 from .base import ContainerBase
-from .conversions import _ContainerWithConversions
-from .creation import _ContainerWithCreation
-from .data_type import _ContainerWithDataTypes
-from .device import _ContainerWithDevice
-from .elementwise import _ContainerWithElementwise
-from .general import _ContainerWithGeneral
-from .gradients import _ContainerWithGradients
-from .image import _ContainerWithImage
-from .layers import _ContainerWithLayers
-from .linear_algebra import _ContainerWithLinearAlgebra
-from .losses import _ContainerWithLosses
-from .manipulation import _ContainerWithManipulation
-from .norms import _ContainerWithNorms
-from .random import _ContainerWithRandom
-from .searching import _ContainerWithSearching
-from .set import _ContainerWithSet
-from .sorting import _ContainerWithSorting
-from .statistical import _ContainerWithStatistical
-from .utility import _ContainerWithUtility
-from ivy.data_classes.container.experimental import (
-    _ContainerWithActivationExperimental,
-    _ContainerWithConversionExperimental,
-    _ContainerWithCreationExperimental,
-    _ContainerWithData_typeExperimental,
-    _ContainerWithDeviceExperimental,
-    _ContainerWithElementWiseExperimental,
-    _ContainerWithGeneralExperimental,
-    _ContainerWithGradientsExperimental,
-    _ContainerWithImageExperimental,
-    _ContainerWithLayersExperimental,
-    _ContainerWithLinearAlgebraExperimental,
-    _ContainerWithLossesExperimental,
-    _ContainerWithManipulationExperimental,
-    _ContainerWithNormsExperimental,
-    _ContainerWithRandomExperimental,
-    _ContainerWithSearchingExperimental,
-    _ContainerWithSetExperimental,
-    _ContainerWithSortingExperimental,
-    _ContainerWithStatisticalExperimental,
-    _ContainerWithUtilityExperimental,
-)
-
-
-class Container(
-    _ContainerWithActivations,
-    _ContainerWithConversions,
-    _ContainerWithCreation,
-    _ContainerWithDataTypes,
-    _ContainerWithDevice,
-    _ContainerWithElementwise,
-    _ContainerWithGeneral,
-    _ContainerWithGradients,
-    _ContainerWithImage,
-    _ContainerWithLayers,
-    _ContainerWithLinearAlgebra,
-    _ContainerWithLosses,
-    _ContainerWithManipulation,
-    _ContainerWithNorms,
-    _ContainerWithRandom,
-    _ContainerWithSearching,
-    _ContainerWithSet,
-    _ContainerWithSorting,
-    _ContainerWithStatistical,
-    _ContainerWithUtility,
-    _ContainerWithActivationExperimental,
-    _ContainerWithConversionExperimental,
-    _ContainerWithCreationExperimental,
-    _ContainerWithData_typeExperimental,
-    _ContainerWithDeviceExperimental,
-    _ContainerWithElementWiseExperimental,
-    _ContainerWithGeneralExperimental,
-    _ContainerWithGradientsExperimental,
-    _ContainerWithImageExperimental,
-    _ContainerWithLayersExperimental,
-    _ContainerWithLinearAlgebraExperimental,
-    _ContainerWithLossesExperimental,
-    _ContainerWithManipulationExperimental,
-    _ContainerWithNormsExperimental,
-    _ContainerWithRandomExperimental,
-    _ContainerWithSearchingExperimental,
-    _ContainerWithSetExperimental,
-    _ContainerWithSortingExperimental,
-    _ContainerWithStatisticalExperimental,
-    _ContainerWithUtilityExperimental,
-):
+from ivy.utils.lazy_import import enabled as _lazy_import
+
+if not _lazy_import:
+    from .activations import _ContainerWithActivations
+    from .conversions import _ContainerWithConversions
+    from .creation import _ContainerWithCreation
+    from .data_type import _ContainerWithDataTypes
+    from .device import _ContainerWithDevice
+    from .elementwise import _ContainerWithElementwise
+    from .general import _ContainerWithGeneral
+    from .gradients import _ContainerWithGradients
+    from .image import _ContainerWithImage
+    from .layers import _ContainerWithLayers
+    from .linear_algebra import _ContainerWithLinearAlgebra
+    from .losses import _ContainerWithLosses
+    from .manipulation import _ContainerWithManipulation
+    from .norms import _ContainerWithNorms
+    from .random import _ContainerWithRandom
+    from .searching import _ContainerWithSearching
+    from .set import _ContainerWithSet
+    from .sorting import _ContainerWithSorting
+    from .statistical import _ContainerWithStatistical
+    from .utility import _ContainerWithUtility
+    from ivy.data_classes.container.experimental import (
+        _ContainerWithActivationExperimental,
+        _ContainerWithConversionExperimental,
+        _ContainerWithCreationExperimental,
+        _ContainerWithData_typeExperimental,
+        _ContainerWithDeviceExperimental,
+        _ContainerWithElementWiseExperimental,
+        _ContainerWithGeneralExperimental,
+        _ContainerWithGradientsExperimental,
+        _ContainerWithImageExperimental,
+        _ContainerWithLayersExperimental,
+        _ContainerWithLinearAlgebraExperimental,
+        _ContainerWithLossesExperimental,
+        _ContainerWithManipulationExperimental,
+        _ContainerWithNormsExperimental,
+        _ContainerWithRandomExperimental,
+        _ContainerWithSearchingExperimental,
+        _ContainerWithSetExperimental,
+        _ContainerWithSortingExperimental,
+        _ContainerWithStatisticalExperimental,
+        _ContainerWithUtilityExperimental,
+    )
+
+    _bases = (
+        _ContainerWithActivations,
+        _ContainerWithConversions,
+        _ContainerWithCreation,
+        _ContainerWithDataTypes,
+        _ContainerWithDevice,
+        _ContainerWithElementwise,
+        _ContainerWithGeneral,
+        _ContainerWithGradients,
+        _ContainerWithImage,
+        _ContainerWithLayers,
+        _ContainerWithLinearAlgebra,
+        _ContainerWithLosses,
+        _ContainerWithManipulation,
+        _ContainerWithNorms,
+        _ContainerWithRandom,
+        _ContainerWithSearching,
+        _ContainerWithSet,
+        _ContainerWithSorting,
+        _ContainerWithStatistical,
+        _ContainerWithUtility,
+        _ContainerWithActivationExperimental,
+        _ContainerWithConversionExperimental,
+        _ContainerWithCreationExperimental,
+        _ContainerWithData_typeExperimental,
+        _ContainerWithDeviceExperimental,
+        _ContainerWithElementWiseExperimental,
+        _ContainerWithGeneralExperimental,
+        _ContainerWithGradientsExperimental,
+        _ContainerWithImageExperimental,
+        _ContainerWithLayersExperimental,
+        _ContainerWithLinearAlgebraExperimental,
+        _ContainerWithLossesExperimental,
+        _ContainerWithManipulationExperimental,
+        _ContainerWithNormsExperimental,
+        _ContainerWithRandomExperimental,
+        _ContainerWithSearchingExperimental,
+        _ContainerWithSetExperimental,
+        _ContainerWithSortingExperimental,
+        _ContainerWithStatisticalExperimental,
+        _ContainerWithUtilityExperimental,
+    )
+    _metaclass = abc.ABCMeta
+else:
+    from ivy.utils.lazy_import import DeferredMixins as _metaclass
+
+    # the mixins are attached on first use, see ivy.utils.lazy_import
+    _bases = (ContainerBase,)
+
+
+def _packed_elementwise(op, reflected=False):
+    # applies op once to each flat buffer when the operands are packed containers
+    # with matching layouts or python scalars, otherwise maps over the leaves
+    def _decorator(fn):
+        @functools.wraps(fn)
+        def _fn(self, *args):
+            operands = [*args, self] if reflected else [self, *args]
+            ret = ContainerBase._cont_packed_op(op, operands)
+            return fn(self, *args) if ret is None else ret
+
+        return _fn
+
+    return _decorator
+
+
+class Container(*_bases, metaclass=_metaclass):
     def __init__(
         self,
         dict_in=None,
@@ -137,9 +165,11 @@ class Container(
     def __pos__(self):
         return self
 
+    @_packed_elementwise(operator.neg)
     def __neg__(self):
         return self.cont_map(lambda x, kc: -x, map_sequences=True)
 
+    @_packed_elementwise(operator.pow)
     def __pow__(self, power):
         """
         ivy.Container special method for the power operator, calling
@@ -186,6 +216,7 @@ class Container(
             )
         return self.cont_map(lambda x, kc: x**power, map_sequences=True)
 
+    @_packed_elementwise(operator.pow, reflected=True)
     def __rpow__(self, power):
         return self.cont_map(lambda x, kc: power**x, map_sequences=True)
 
@@ -196,6 +227,7 @@ class Container(
             )
         return self.cont_map(lambda x, _: operator.ipow(x, power), map_sequences=True)
 
+    @_packed_elementwise(operator.add)
     def __add__(self, other):
         """
         ivy.Container special method for the add operator, calling :code:`operator.add`
@@ -261,6 +293,7 @@ class Container(
             lambda xs, _: operator.add(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_packed_elementwise(operator.add, reflected=True)
     def __radd__(self, other):
         """
         ivy.Container reverse special method for the add operator, calling
@@ -300,6 +333,7 @@ class Container(
             lambda xs, _: operator.iadd(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_packed_elementwise(operator.sub)
     def __sub__(self, other):
         """
         ivy.Container special method for the subtract operator, calling
@@ -370,6 +404,7 @@ class Container(
             lambda xs, _: operator.isub(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_packed_elementwise(operator.sub, reflected=True)
     def __rsub__(self, other):
         """
         ivy.Container reverse special method for the subtract operator, calling
@@ -404,11 +439,13 @@ class Container(
             lambda xs, _: operator.sub(xs[0], xs[1]), [other, self], map_nests=True
         )
 
+    @_packed_elementwise(operator.mul)
     def __mul__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.mul(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_packed_elementwise(operator.mul, reflected=True)
     def __rmul__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.mul(xs[0], xs[1]), [other, self], map_nests=True
@@ -452,6 +489,7 @@ class Container(
             map_nests=True,
         )
 
+    @_packed_elementwise(operator.truediv)
     def __truediv__(self, other):
         """
         ivy.Container special method for the divide operator, calling
@@ -503,6 +541,7 @@ class Container(
             lambda xs, _: operator.truediv(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_packed_elementwise(operator.truediv, reflected=True)
     def __rtruediv__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.truediv(xs[0], xs[1]), [other, self], map_nests=True
@@ -569,6 +608,7 @@ class Container(
             lambda x, kc: operator.imatmul(x, other), map_sequences=True
         )
 
+    @_packed_elementwise(operator.abs)
     def __abs__(self):
         """
         ivy.Container special method for the abs operator, calling
@@ -1102,3 +1142,53 @@ class Container(
         return self.cont_map(
             lambda x, kc: operator.irshift(x, other), map_sequences=True
         )
+
+
+if _lazy_import:
+    from ivy.utils.lazy_import import defer_mixins
+
+    defer_mixins(
+        Container,
+        (
+            "activations._ContainerWithActivations",
+            "conversions._ContainerWithConversions",
+            "creation._ContainerWithCreation",
+            "data_type._ContainerWithDataTypes",
+            "device._ContainerWithDevice",
+            "elementwise._ContainerWithElementwise",
+            "general._ContainerWithGeneral",
+            "gradients._ContainerWithGradients",
+            "image._ContainerWithImage",
+            "layers._ContainerWithLayers",
+            "linear_algebra._ContainerWithLinearAlgebra",
+            "losses._ContainerWithLosses",
+            "manipulation._ContainerWithManipulation",
+            "norms._ContainerWithNorms",
+            "random._ContainerWithRandom",
+            "searching._ContainerWithSearching",
+            "set._ContainerWithSet",
+            "sorting._ContainerWithSorting",
+            "statistical._ContainerWithStatistical",
+            "utility._ContainerWithUtility",
+            "experimental._ContainerWithActivationExperimental",
+            "experimental._ContainerWithConversionExperimental",
+            "experimental._ContainerWithCreationExperimental",
+            "experimental._ContainerWithData_typeExperimental",
+            "experimental._ContainerWithDeviceExperimental",
+            "experimental._ContainerWithElementWiseExperimental",
+            "experimental._ContainerWithGeneralExperimental",
+            "experimental._ContainerWithGradientsExperimental",
+            "experimental._ContainerWithImageExperimental",
+            "experimental._ContainerWithLayersExperimental",
+            "experimental._ContainerWithLinearAlgebraExperimental",
+            "experimental._ContainerWithLossesExperimental",
+            "experimental._ContainerWithManipulationExperimental",
+            "experimental._ContainerWithNormsExperimental",
+            "experimental._ContainerWithRandomExperimental",
+            "experimental._ContainerWithSearchingExperimental",
+            "experimental._ContainerWithSetExperimental",
+            "experimental._ContainerWithSortingExperimental",
+            "experimental._ContainerWithStatisticalExperimental",
+            "experimental._ContainerWithUtilityExperimental",
+        ),
+    )
@@ -115,6 +115,15 @@ class _ContainerWithDevice(ContainerBase):
         cpu cpu
 
         """
+        if (
+            isinstance(x, ivy.Container)
+            and key_chains is None
+            and stream is None
+            and out is None
+        ):
+            ret = x._cont_packed_to_device(device)
+            if ret is not None:
+                return ret
         return ContainerBase.cont_multi_map_in_function(
             "to_device",
             x,
@@ -427,6 +427,15 @@ class _ContainerWithGeneral(ContainerBase):
         }
 
         """
+        if (
+            isinstance(x, ivy.Container)
+            and isinstance(max_norm, (int, float))
+            and key_chains is None
+            and out is None
+        ):
+            ret = x._cont_packed_clip_vector_norm(max_norm, p)
+            if ret is not None:
+                return ret
         return ContainerBase.cont_multi_map_in_function(
             "clip_vector_norm",
             x,
@@ -640,6 +640,7 @@ class _ContainerWithLayers(ContainerBase):
         /,
         *,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
+        chunk_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -673,6 +674,9 @@ class _ContainerWithLayers(ContainerBase):
             The mask input array/container. The mask to apply to the query-key values.
             Default is None. The shape of mask input array leaves should be in
             *[batch_shape,num_queries,num_keys]*.
+        chunk_size
+            The number of keys to attend to at once. Default is ``None``, in which
+            case all the keys are attended to at once.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -735,6 +739,7 @@ class _ContainerWithLayers(ContainerBase):
             v,
             scale,
             mask=mask,
+            chunk_size=chunk_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -750,6 +755,7 @@ class _ContainerWithLayers(ContainerBase):
         /,
         *,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
+        chunk_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -783,6 +789,9 @@ class _ContainerWithLayers(ContainerBase):
             The mask input array/container. The mask to apply to the query-key values.
             Default is None. The shape of mask input array leaves should be in
             *[batch_shape,num_queries,num_keys]*.
+        chunk_size
+            The number of keys to attend to at once. Default is ``None``, in which
+            case all the keys are attended to at once.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -843,6 +852,7 @@ class _ContainerWithLayers(ContainerBase):
             v,
             scale,
             mask=mask,
+            chunk_size=chunk_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -865,6 +875,7 @@ class _ContainerWithLayers(ContainerBase):
         to_q_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_kv_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_out_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        chunk_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -884,6 +895,7 @@ class _ContainerWithLayers(ContainerBase):
             to_q_v=to_q_v,
             to_kv_v=to_kv_v,
             to_out_v=to_out_v,
+            chunk_size=chunk_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -905,6 +917,7 @@ class _ContainerWithLayers(ContainerBase):
         to_q_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_kv_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_out_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        chunk_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -923,6 +936,7 @@ class _ContainerWithLayers(ContainerBase):
             to_q_v=to_q_v,
             to_kv_v=to_kv_v,
             to_out_v=to_out_v,
+            chunk_size=chunk_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -2847,6 +2847,17 @@ class _ContainerWithLinearAlgebra(ContainerBase):
             b: ivy.array([3.77359247])
         }
         """
+        if (
+            isinstance(x, ivy.Container)
+            and axis is None
+            and not keepdims
+            and dtype is None
+            and key_chains is None
+            and out is None
+        ):
+            ret = x._cont_packed_vector_norm(ord)
+            if ret is not None:
+                return ret
         return ContainerBase.cont_multi_map_in_function(
             "vector_norm",
             x,
@@ -1,5 +1,6 @@
 # local
 import ivy
+from ivy.utils.inspection import _get_array_spec
 
 # global
 from typing import Callable, Type, List, Iterable, Optional, Union, Sequence, Dict
@@ -35,7 +36,7 @@ def _wrap_function(function_name: str, static: bool) -> Callable:
         **kwargs
     ):
         function = ivy.__dict__[function_name]
-        data_idx = function.array_spec[0]
+        data_idx = _get_array_spec(function)[0]
         if (
             not (data_idx[0][0] == 0 and len(data_idx[0]) == 1)
             and args
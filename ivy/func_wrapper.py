@@ -6,8 +6,10 @@ import weakref
 import warnings
 import copy as python_copy
 from types import FunctionType
+from collections import UserDict
 from typing import Callable
 import inspect
+from ivy.utils.lazy_import import enabled as _lazy_import
 
 
 # for wrapping (sequence matters)
@@ -186,8 +188,9 @@ def handle_array_function(func):
                                     break
                             overloaded_args.insert(index, arg)
 
+        # looked up as an attribute, which loads the function if it's still deferred
         success, value = try_array_function_override(
-            ivy.__dict__[func.__name__], overloaded_args, overloaded_types, args, kwargs
+            getattr(ivy, func.__name__), overloaded_args, overloaded_types, args, kwargs
         )
         if success:
             return value
@@ -228,7 +231,14 @@ def handle_array_like_without_promotion(fn: Callable) -> Callable:
                     # since asarray throws unpredictable bugs
                     if _check_in_nested_sequence(arg, value=Ellipsis, _type=slice):
                         continue
-                    if not ivy.is_array(arg):
+                    # objects overriding ivy functions are handled by
+                    # handle_array_function, so aren't converted here. The
+                    # attribute is looked up on the type, as containers map
+                    # attribute access over their leaves
+                    if not ivy.is_array(arg) and (
+                        isinstance(arg, ivy.Container)
+                        or not hasattr(type(arg), "__ivy_array_function__")
+                    ):
                         args[i] = ivy.array(arg)
                 elif parameters in kwargs:
                     kwarg = kwargs[parameter]
@@ -630,6 +640,9 @@ def handle_out_argument(fn: Callable) -> Callable:
 
 
 def _update_torch_views(x, visited_view=None):
+    if x._view_state is None:
+        # x hasn't been involved in any views
+        return
     if x._torch_view_refs != []:
         _update_torch_references(x, visited_view)
     if ivy.exists(x._torch_manipulation):
@@ -662,8 +675,45 @@ def _update_torch_references(x, visited_view=None):
 # ------------------#
 
 
+def _contains_container(args, kwargs):
+    """
+    Checks whether any of the arguments is or contains an ivy.Container, giving the
+    same result as `ivy.nested_any(..., ivy.is_ivy_container, check_nests=True)` over
+    both args and kwargs, but only recursing into the arguments which are nests.
+    """
+    # containers are dicts, so the (slower) abc instance check against ivy.Container
+    # is only needed for nests
+    for arg in args:
+        if isinstance(arg, (list, tuple, dict)) and (
+            ivy.is_ivy_container(arg)
+            or ivy.nested_any(arg, ivy.is_ivy_container, check_nests=True)
+        ):
+            return True
+    for arg in kwargs.values():
+        if isinstance(arg, (list, tuple, dict)) and (
+            ivy.is_ivy_container(arg)
+            or ivy.nested_any(arg, ivy.is_ivy_container, check_nests=True)
+        ):
+            return True
+    return False
+
+
+def _container_fn(fn: Callable) -> Callable:
+    """Returns the function which `handle_nestable` calls when given containers."""
+    if hasattr(ivy.Container, "_static_" + fn.__name__):
+        return getattr(ivy.Container, "_static_" + fn.__name__)
+    return lambda *args, **kwargs: ivy.Container.cont_multi_map_in_function(
+        fn, *args, **kwargs
+    )
+
+
 def handle_nestable(fn: Callable) -> Callable:
-    fn_name = fn.__name__
+    # the container function is resolved once here rather than on each call, unless
+    # the function is wrapped before ivy.Container has its methods, which is before
+    # it's defined, or before its mixins are attached when loading lazily
+    cont_fn = (
+        _container_fn(fn) if hasattr(ivy, "Container") and not _lazy_import else None
+    )
 
     @functools.wraps(fn)
     def new_fn(*args, **kwargs):
@@ -684,19 +734,13 @@ def handle_nestable(fn: Callable) -> Callable:
         -------
             The return of the function, with the nestable property handled correctly.
         """
+        nonlocal cont_fn
         # if any of the arguments or keyword arguments passed to the function contains
         # a container, get the container's version of the function and call it using
         # the passed arguments.
-        if hasattr(ivy.Container, "_static_" + fn_name):
-            cont_fn = getattr(ivy.Container, "_static_" + fn_name)
-        else:
-            cont_fn = lambda *args, **kwargs: ivy.Container.cont_multi_map_in_function(
-                fn, *args, **kwargs
-            )
-        if ivy.get_nestable_mode() and (
-            ivy.nested_any(args, ivy.is_ivy_container, check_nests=True)
-            or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
-        ):
+        if ivy.get_nestable_mode() and _contains_container(args, kwargs):
+            if cont_fn is None:
+                cont_fn = _container_fn(fn)
             return cont_fn(*args, **kwargs)
 
         # if the passed arguments does not contain a container, the function using
@@ -707,6 +751,209 @@ def handle_nestable(fn: Callable) -> Callable:
     return new_fn
 
 
+# Fused Wrapping #
+# ---------------#
+
+# the decorators which `_fuse_wrappers` can apply in a single dispatcher
+_FUSABLE_DECORATORS = {
+    "infer_device",
+    "infer_dtype",
+    "handle_array_function",
+    "outputs_to_ivy_arrays",
+    "inputs_to_native_arrays",
+    "handle_out_argument",
+    "handle_array_like_without_promotion",
+    "handle_nestable",
+    "handle_exceptions",
+    "handle_nans",
+}
+
+# leaves which none of the fusable decorators modify or dispatch on
+_PLAIN_TYPES = (int, float, complex, str)
+
+# returned by `_fused_arg` when the full decorator stack has to handle an argument
+_UNFUSED = object()
+
+
+def _array_like_positions(fn):
+    """
+    Returns the positional argument indices which `handle_array_like_without_promotion`
+    would check for array-like inputs, mirroring the checks done there on each call.
+    """
+    try:
+        type_hints = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return ()
+    positions = []
+    for i, (parameter, param) in enumerate(type_hints.items()):
+        annotation_str = str(param.annotation)
+        if (
+            ("rray" in annotation_str or "Tensor" in annotation_str)
+            and parameter != "out"
+            and all(
+                sq not in annotation_str
+                for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+            )
+        ):
+            positions.append(i)
+    return tuple(positions)
+
+
+def _fused_arg(arg, native_array, to_native, array_function):
+    """
+    Applies the input handling of the fused decorators to a single argument, or
+    returns `_UNFUSED` if the argument needs the full decorator stack, for example
+    because it is a container, a nest deeper than one level or overrides
+    `__ivy_array_function__`.
+    """
+    if isinstance(arg, ivy.Array):
+        return arg.data if to_native else arg
+    if arg is None or isinstance(arg, (native_array,) + _PLAIN_TYPES):
+        return arg
+    arg_type = type(arg)
+    if arg_type is list or arg_type is tuple:
+        converted = []
+        for item in arg:
+            if isinstance(item, ivy.Array):
+                converted.append(item.data if to_native else item)
+            elif item is None or isinstance(item, (native_array,) + _PLAIN_TYPES):
+                converted.append(item)
+            else:
+                return _UNFUSED
+        # `args_to_native` returns a new nest, which we replicate
+        return arg_type(converted) if to_native else arg
+    if isinstance(arg, (dict, list, tuple, UserDict, ivy.Container)):
+        return _UNFUSED
+    if isinstance(arg, slice):
+        bounds = (arg.start, arg.stop, arg.step)
+        if to_native and any(isinstance(b, ivy.Array) for b in bounds):
+            return _UNFUSED
+        return arg
+    if array_function and hasattr(arg, "__ivy_array_function__"):
+        return _UNFUSED
+    return arg
+
+
+def _fuse_wrappers(fn: Callable, wrapped: Callable, decorators) -> Callable:
+    """
+    Fuses the decorators applied to the backend function `fn` into one dispatcher.
+
+    The dispatcher converts the arguments, checks for containers and for overridden
+    array functions in a single pass over the arguments. Whenever the inputs or the
+    global modes need anything beyond this fast path, the call is forwarded to
+    `wrapped`, which is `fn` with the full decorator stack applied, so the results
+    are exactly the same as those of the decorator stack.
+
+    Parameters
+    ----------
+    fn
+        the undecorated backend function.
+    wrapped
+        `fn` wrapped with `decorators`, in the order given by `FN_DECORATORS`.
+    decorators
+        the names of the decorators applied to create `wrapped`.
+
+    Returns
+    -------
+    ret
+        the fused dispatcher, or `wrapped` if any of the decorators can't be fused.
+    """
+    decorators = set(decorators)
+    if not decorators or not decorators.issubset(_FUSABLE_DECORATORS):
+        return wrapped
+    fn_name = fn.__name__
+    nans = "handle_nans" in decorators
+    exceptions = "handle_exceptions" in decorators
+    out_argument = "handle_out_argument" in decorators
+    to_native = "inputs_to_native_arrays" in decorators
+    to_ivy = "outputs_to_ivy_arrays" in decorators
+    array_function = "handle_array_function" in decorators
+    dtype_inference = "infer_dtype" in decorators
+    device_inference = "infer_device" in decorators
+    array_like_positions = (
+        _array_like_positions(fn)
+        if "handle_array_like_without_promotion" in decorators
+        else ()
+    )
+
+    def _dispatch(args, kwargs):
+        if dtype_inference:
+            dtype = kwargs.pop("dtype", None)
+            arr = None if ivy.exists(dtype) else _get_first_array(*args, **kwargs)
+            dtype = ivy.default_dtype(dtype=dtype, item=arr, as_native=True)
+            ivy.utils.assertions._check_jax_x64_flag(dtype)
+            kwargs["dtype"] = dtype
+        if device_inference:
+            device = kwargs.pop("device", None)
+            arr = None if ivy.exists(device) else _get_first_array(*args, **kwargs)
+            kwargs["device"] = ivy.default_device(device, item=arr, as_native=True)
+        ret = fn(*args, **kwargs)
+        if not to_ivy:
+            return ret
+        if isinstance(ret, ivy.NativeArray):
+            return ivy.Array(ret)
+        return ivy.to_ivy(ret, nested=True, include_derived={tuple: True})
+
+    @functools.wraps(wrapped)
+    def new_fn(*args, **kwargs):
+        """
+        Calls `fn` with the fused decorators applied in a single pass over the
+        arguments, falling back to the full decorator stack if required.
+
+        Parameters
+        ----------
+        args
+            The arguments to be passed to the function.
+
+        kwargs
+            The keyword arguments to be passed to the function.
+
+        Returns
+        -------
+            The return of the function, the same as with the decorator stack.
+        """
+        if nans and ivy.get_nan_policy() != "nothing":
+            return wrapped(*args, **kwargs)
+        if (to_native or to_ivy) and not ivy.get_array_mode():
+            return wrapped(*args, **kwargs)
+        if "out" in kwargs:
+            if kwargs["out"] is not None or not out_argument:
+                return wrapped(*args, **kwargs)
+            del kwargs["out"]
+        native_array = ivy.NativeArray
+        for i in array_like_positions:
+            if i < len(args) and not isinstance(args[i], (ivy.Array, native_array)):
+                return wrapped(*args, **kwargs)
+        new_args = []
+        for arg in args:
+            arg = _fused_arg(arg, native_array, to_native, array_function)
+            if arg is _UNFUSED:
+                return wrapped(*args, **kwargs)
+            new_args.append(arg)
+        new_kwargs = dict()
+        for k, v in kwargs.items():
+            v = _fused_arg(v, native_array, to_native, array_function)
+            if v is _UNFUSED:
+                return wrapped(*args, **kwargs)
+            new_kwargs[k] = v
+        if not exceptions:
+            return _dispatch(new_args, new_kwargs)
+        try:
+            return _dispatch(new_args, new_kwargs)
+        # Not to rethrow as IvyBackendException
+        except ivy.utils.exceptions.IvyNotImplementedException as e:
+            raise e
+        except (IndexError, ValueError, AttributeError) as e:
+            ivy.utils.exceptions._print_traceback_history()
+            raise ivy.utils.exceptions.IvyError(fn_name, str(e))
+        except Exception as e:
+            ivy.utils.exceptions._print_traceback_history()
+            raise ivy.utils.exceptions.IvyBackendException(fn_name, str(e))
+
+    new_fn.fused_wrappers = True
+    return new_fn
+
+
 # Functions #
 
 
@@ -779,21 +1026,35 @@ def _wrap_function(
             for attr in to_replace[compositional]:
                 setattr(original, attr, True)
 
+        # only a bare backend function is fused, the order of any decorators
+        # already applied to it is unknown
+        fusable = not mixed and not any(
+            hasattr(to_wrap, attr) for attr in FN_DECORATORS
+        )
+        unwrapped = to_wrap
+        applied = []
         for attr in FN_DECORATORS:
             if hasattr(original, attr) and not hasattr(to_wrap, attr):
                 to_wrap = getattr(ivy, attr)(to_wrap)
+                applied.append(attr)
+        if fusable and applied:
+            to_wrap = _fuse_wrappers(unwrapped, to_wrap, applied)
     return to_wrap
 
 
 # Gets dtype from a version dictionary
-def _dtype_from_version(dic, version):
-
+def _version_str(version):
     # if version is a string, it's a frontend function
     if isinstance(version, str):
         version = ivy.functional.frontends.__dict__["versions"][version]
     # if version is a dict, extract the version
     if isinstance(version, dict):
         version = version["version"]
+    return version
+
+
+def _dtype_from_version(dic, version):
+    version = _version_str(version)
 
     # If version dict is empty, then there is an error
     if not dic:
@@ -824,7 +1085,17 @@ def _dtype_from_version(dic, version):
     return dic[list(dic.keys())[-1]]
 
 
-def _versioned_attribute_factory(attribute_function, base):
+# bumped whenever the backend or its version is set, which invalidates the values
+# cached by every versioned attribute
+_versioned_attributes_generation = 0
+
+
+def _invalidate_versioned_attributes():
+    global _versioned_attributes_generation
+    _versioned_attributes_generation += 1
+
+
+def _versioned_attribute_factory(attribute_function, base, version=None):
     class VersionedAttributes(base):
         """
         Creates a class which inherits `base` this way if isinstance is called on an
@@ -834,10 +1105,17 @@ def _versioned_attribute_factory(attribute_function, base):
 
         def __init__(self):
             self.attribute_function = attribute_function
+            self._cache_key = None
+            self._cached = None
 
         def __get__(self, instance=None, owner=None):
-            # version dtypes recalculated everytime it's accessed
-            return self.attribute_function()
+            # version dtypes are resolved once per backend version, and again
+            # whenever the backend is set
+            key = (_versioned_attributes_generation, _version_str(version))
+            if key != self._cache_key:
+                self._cached = self.attribute_function()
+                self._cache_key = key
+            return self._cached
 
         def __iter__(self):
             # iter allows for iteration over current version that's selected
@@ -886,7 +1164,7 @@ def _dtype_device_wrapper_creator(attrib, t):
 
         def _wrapped(func):
             val = _versioned_attribute_factory(
-                lambda: _dtype_from_version(version_dict, version), t
+                lambda: _dtype_from_version(version_dict, version), t, version
             )
             if hasattr(func, "override"):
                 # we do nothing
@@ -909,8 +1187,11 @@ def _dtype_device_wrapper_creator(attrib, t):
                         if attrib == attribs:
                             old_version_dict = getattr(func, "dictionary_info")
                             old_version_dict.update(version_dict)
+                            _invalidate_versioned_attributes()
                             val = _versioned_attribute_factory(
-                                lambda: _dtype_from_version(version_dict, version), t
+                                lambda: _dtype_from_version(version_dict, version),
+                                t,
+                                version,
                             )
                             setattr(func, attrib, val)
                         else:
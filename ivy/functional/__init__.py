@@ -1,4 +1,17 @@
-from .ivy import experimental
-from .ivy.experimental import *
-from . import ivy
-from .ivy import *
+from ivy.utils.lazy_import import enabled as _lazy_import
+
+if not _lazy_import:
+    from .ivy import experimental
+    from .ivy.experimental import *
+    from . import ivy
+    from .ivy import *
+else:
+    from ivy.utils.lazy_import import lazy_package as _lazy_package
+
+    __getattr__, __dir__ = _lazy_package(
+        __name__,
+        [
+            ("ivy.experimental", ("experimental",), True),
+            ("ivy", ("ivy",), True),
+        ],
+    )
@@ -1,4 +1,7 @@
 import logging
+import jax.numpy as jnp
+from jax.experimental import sparse as jsparse
+
 import ivy
 from ivy.functional.ivy.experimental.sparse_array import (
     _is_valid_format,
@@ -7,6 +10,7 @@ from ivy.functional.ivy.experimental.sparse_array import (
     _verify_coo_components,
     _verify_csc_components,
     _verify_csr_components,
+    _verify_sparse_matmul_shapes,
 )
 
 
@@ -25,7 +29,7 @@ def native_sparse_array(
     row_indices=None,
     values=None,
     dense_shape=None,
-    format="coo"
+    format="coo",
 ):
 
     ivy.utils.assertions.check_exists(
@@ -93,3 +97,28 @@ def native_sparse_array_to_indices_values_and_shape(x):
         " indices, values and shape."
     )
     return None, None, None
+
+
+def _to_bcoo(x, dtype=None):
+    # jax's sparse kernels take batched coo arrays, built from the coordinates of
+    # the nonzeros of any format
+    values = ivy.to_native(ivy.flatten(x.values))
+    if dtype is not None:
+        values = values.astype(dtype)
+    return jsparse.BCOO(
+        (values, ivy.to_native(x._dense_coordinates())),
+        shape=tuple(x.dense_shape),
+    )
+
+
+def sparse_matmul(x, y, /):
+    _verify_sparse_matmul_shapes(x, y)
+    dtype = jnp.promote_types(ivy.to_native(x.values).dtype, y.dtype)
+    return _to_bcoo(x, dtype) @ y.astype(dtype)
+
+
+def sparse_sum(x, /, *, axis=None):
+    if axis is None:
+        return jnp.sum(ivy.to_native(x.values))
+    axis = axis % len(x.dense_shape)
+    return jsparse.bcoo_reduce_sum(_to_bcoo(x), axes=(axis,)).todense()
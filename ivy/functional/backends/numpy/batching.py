@@ -0,0 +1,543 @@
+"""
+Batching rules for the NumPy backend's `vmap`, which traces the vectorized function
+once with a batch dimension rather than calling it once per sample.
+"""
+
+# global
+import functools
+import inspect
+import numpy as np
+
+# local
+import ivy
+
+
+class _Unbatchable(Exception):
+    """Raised while tracing when there's no batching rule for an operation."""
+
+
+class _BatchTracer:
+    """
+    Stands in for a single sample of a vectorized argument while `vmap` traces the
+    vectorized function, holding the native array of the whole batch with the
+    batch dimension first.
+
+    The ivy functions which the tracer is passed to are dispatched to its
+    `__ivy_array_function__`, which applies the batching rule of the function to the
+    batched native arrays. Any other use of the tracer raises `_Unbatchable`, so that
+    `vmap` falls back to calling the function once per sample.
+    """
+
+    __slots__ = ("val",)
+
+    def __init__(self, val):
+        self.val = val
+
+    # the properties of a single sample, as seen by the vectorized function
+
+    @property
+    def shape(self):
+        return self.val.shape[1:]
+
+    @property
+    def ndim(self):
+        return self.val.ndim - 1
+
+    @property
+    def dtype(self):
+        return self.val.dtype
+
+    def __len__(self):
+        if self.val.ndim < 2:
+            raise TypeError("len() of unsized object")
+        return self.val.shape[1]
+
+    def __getattr__(self, name):
+        # such as the methods of ivy.Array, which don't dispatch to the tracer
+        raise _Unbatchable(name)
+
+    def __ivy_array_function__(self, func, types, args, kwargs):
+        if "out" in kwargs and kwargs["out"] is not None:
+            raise _Unbatchable("out")
+        kwargs = {k: v for k, v in kwargs.items() if k != "out"}
+        rule = _batching_rules.get(func.__name__)
+        if rule is None:
+            raise _Unbatchable(func.__name__)
+        return _BatchTracer(_to_native(rule(func, args, kwargs)))
+
+    def __getitem__(self, query):
+        query = query if isinstance(query, tuple) else (query,)
+        if not all(
+            q is None or q is Ellipsis or isinstance(q, (int, slice)) for q in query
+        ):
+            raise _Unbatchable("__getitem__")
+        return _BatchTracer(self.val[(slice(None),) + query])
+
+    # the values of a sample aren't known while tracing, so anything depending on
+    # them can't be traced
+
+    def __array__(self, *args, **kwargs):
+        raise _Unbatchable("__array__")
+
+    def __bool__(self):
+        raise _Unbatchable("__bool__")
+
+    def __iter__(self):
+        raise _Unbatchable("__iter__")
+
+    def __float__(self):
+        raise _Unbatchable("__float__")
+
+    def __int__(self):
+        raise _Unbatchable("__int__")
+
+    def __index__(self):
+        raise _Unbatchable("__index__")
+
+    # operators, dispatched to the ivy functions and their batching rules
+
+    def __neg__(self):
+        return ivy.negative(self)
+
+    def __pos__(self):
+        return ivy.positive(self)
+
+    def __abs__(self):
+        return ivy.abs(self)
+
+    def __invert__(self):
+        return ivy.bitwise_invert(self)
+
+    def __add__(self, other):
+        return ivy.add(self, other)
+
+    def __radd__(self, other):
+        return ivy.add(other, self)
+
+    def __sub__(self, other):
+        return ivy.subtract(self, other)
+
+    def __rsub__(self, other):
+        return ivy.subtract(other, self)
+
+    def __mul__(self, other):
+        return ivy.multiply(self, other)
+
+    def __rmul__(self, other):
+        return ivy.multiply(other, self)
+
+    def __truediv__(self, other):
+        return ivy.divide(self, other)
+
+    def __rtruediv__(self, other):
+        return ivy.divide(other, self)
+
+    def __floordiv__(self, other):
+        return ivy.floor_divide(self, other)
+
+    def __rfloordiv__(self, other):
+        return ivy.floor_divide(other, self)
+
+    def __mod__(self, other):
+        return ivy.remainder(self, other)
+
+    def __rmod__(self, other):
+        return ivy.remainder(other, self)
+
+    def __pow__(self, other):
+        return ivy.pow(self, other)
+
+    def __rpow__(self, other):
+        return ivy.pow(other, self)
+
+    def __matmul__(self, other):
+        return ivy.matmul(self, other)
+
+    def __rmatmul__(self, other):
+        return ivy.matmul(other, self)
+
+    def __and__(self, other):
+        return ivy.bitwise_and(self, other)
+
+    def __rand__(self, other):
+        return ivy.bitwise_and(other, self)
+
+    def __or__(self, other):
+        return ivy.bitwise_or(self, other)
+
+    def __ror__(self, other):
+        return ivy.bitwise_or(other, self)
+
+    def __xor__(self, other):
+        return ivy.bitwise_xor(self, other)
+
+    def __rxor__(self, other):
+        return ivy.bitwise_xor(other, self)
+
+    def __lt__(self, other):
+        return ivy.less(self, other)
+
+    def __le__(self, other):
+        return ivy.less_equal(self, other)
+
+    def __gt__(self, other):
+        return ivy.greater(self, other)
+
+    def __ge__(self, other):
+        return ivy.greater_equal(self, other)
+
+    def __eq__(self, other):
+        return ivy.equal(self, other)
+
+    def __ne__(self, other):
+        return ivy.not_equal(self, other)
+
+    __hash__ = None
+
+
+def _to_native(x):
+    if isinstance(x, ivy.Array):
+        return x.data
+    if isinstance(x, np.ndarray):
+        return x
+    if isinstance(x, _BatchTracer):
+        return x.val
+    raise _Unbatchable(type(x).__name__)
+
+
+def _raised_unbatchable(e):
+    # whether e was raised by tracing an unsupported operation, which the ivy
+    # functions it passed through may have wrapped in their own exceptions
+    seen = set()
+    while e is not None and id(e) not in seen:
+        if isinstance(e, _Unbatchable):
+            return True
+        seen.add(id(e))
+        e = e.__cause__ or e.__context__
+    return False
+
+
+def _sample_ndim(x):
+    if isinstance(x, _BatchTracer):
+        return x.ndim
+    if isinstance(x, (ivy.Array, np.ndarray)):
+        return len(x.shape)
+    return 0
+
+
+def _pad_sample_dims(x, ndim):
+    # inserts unit dimensions after the batch dimension, so that the samples of x
+    # broadcast against arrays with ndim dimensions as they would without the batch
+    val = x.val
+    return val.reshape(val.shape[:1] + (1,) * (ndim - x.ndim) + val.shape[1:])
+
+
+def _shift_axis(axis, ndim):
+    # maps an axis of a sample with ndim dimensions to the axis of the batch
+    if not isinstance(axis, int) or not -ndim <= axis < max(ndim, 1):
+        raise _Unbatchable("axis")
+    return axis % max(ndim, 1) + 1
+
+
+@functools.lru_cache(maxsize=None)
+def _signature(fn_name):
+    return inspect.signature(ivy.__dict__[fn_name])
+
+
+def _bind(func, args, kwargs):
+    bound = _signature(func.__name__).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return bound
+
+
+def _call(func, bound):
+    return func(*bound.args, **bound.kwargs)
+
+
+def _batched_first_arg(bound):
+    args = list(bound.arguments.values())
+    if not isinstance(args[0], _BatchTracer) or any(
+        isinstance(arg, _BatchTracer) for arg in args[1:]
+    ):
+        raise _Unbatchable("only the first argument can be batched")
+    return args[0]
+
+
+# Batching Rules #
+# -------------- #
+
+
+def _elementwise_rule(func, args, kwargs):
+    # samples broadcast against each other, and so do the batches once the batched
+    # arrays are padded to the same number of sample dimensions
+    ndim = max(_sample_ndim(x) for x in args + tuple(kwargs.values()))
+    args = [
+        _pad_sample_dims(x, ndim) if isinstance(x, _BatchTracer) else x for x in args
+    ]
+    kwargs = {
+        k: _pad_sample_dims(v, ndim) if isinstance(v, _BatchTracer) else v
+        for k, v in kwargs.items()
+    }
+    return func(*args, **kwargs)
+
+
+def _matmul_rule(func, args, kwargs):
+    bound = _bind(func, args, kwargs)
+    x1, x2 = list(bound.arguments.values())[:2]
+    batch_size = (x1 if isinstance(x1, _BatchTracer) else x2).val.shape[0]
+    x1, x2 = [
+        x.val
+        if isinstance(x, _BatchTracer)
+        else np.broadcast_to(_to_native(x), (batch_size,) + tuple(x.shape))
+        for x in (x1, x2)
+    ]
+    if x1.ndim < 2 or x2.ndim < 2:
+        raise _Unbatchable("matmul of scalars")
+    # vectors are treated as matrices with a unit dimension which is then removed,
+    # as matmul does for the vectors of each sample
+    vector_1, vector_2 = x1.ndim == 2, x2.ndim == 2
+    flags = ("transpose_a", "transpose_b", "adjoint_a", "adjoint_b")
+    if (vector_1 or vector_2) and any(bound.arguments.get(f) for f in flags):
+        raise _Unbatchable("transposed matmul of vectors")
+    if vector_1:
+        x1 = x1[:, None, :]
+    if vector_2:
+        x2 = x2[:, :, None]
+    ndim = max(x1.ndim, x2.ndim)
+    x1 = x1.reshape(x1.shape[:1] + (1,) * (ndim - x1.ndim) + x1.shape[1:])
+    x2 = x2.reshape(x2.shape[:1] + (1,) * (ndim - x2.ndim) + x2.shape[1:])
+    names = list(bound.arguments.keys())
+    bound.arguments[names[0]], bound.arguments[names[1]] = x1, x2
+    ret = _to_native(_call(func, bound))
+    if vector_1 and vector_2:
+        return ret[..., 0, 0]
+    if vector_1:
+        return ret[..., 0, :]
+    if vector_2:
+        return ret[..., 0]
+    return ret
+
+
+def _axis_rule(func, args, kwargs, *, int_axis=False, param="axis", out_dims=0):
+    # the axes are shifted past the batch dimension, and all axes of a sample
+    # become all but the batch dimension
+    bound = _bind(func, args, kwargs)
+    x = _batched_first_arg(bound)
+    axis = bound.arguments[param]
+    ndim = x.ndim + out_dims
+    if axis is None:
+        if int_axis:
+            raise _Unbatchable(param)
+        axis = tuple(range(1, ndim + 1))
+    elif isinstance(axis, (tuple, list)):
+        if int_axis:
+            raise _Unbatchable(param)
+        axis = tuple(_shift_axis(a, ndim) for a in axis)
+    else:
+        axis = _shift_axis(axis, ndim)
+    bound.arguments[next(iter(bound.arguments))] = x.val
+    bound.arguments[param] = axis
+    return _call(func, bound)
+
+
+def _expand_dims_rule(func, args, kwargs):
+    bound = _bind(func, args, kwargs)
+    axis = bound.arguments["axis"]
+    num_new = len(axis) if isinstance(axis, (tuple, list)) else 1
+    return _axis_rule(func, args, kwargs, out_dims=num_new)
+
+
+def _squeeze_rule(func, args, kwargs):
+    bound = _bind(func, args, kwargs)
+    x = _batched_first_arg(bound)
+    if bound.arguments["axis"] is None:
+        # only the unit dimensions of the samples, and never the batch dimension
+        axes = tuple(i for i, d in enumerate(x.shape) if d == 1)
+        if not axes:
+            return x.val
+        kwargs = {**kwargs, "axis": axes}
+    return _axis_rule(func, args, kwargs)
+
+
+def _reshape_rule(func, args, kwargs):
+    bound = _bind(func, args, kwargs)
+    x = _batched_first_arg(bound)
+    if bound.arguments.get("order", "C") != "C":
+        raise _Unbatchable("order")
+    bound.arguments[next(iter(bound.arguments))] = x.val
+    bound.arguments["shape"] = (x.val.shape[0],) + tuple(bound.arguments["shape"])
+    return _call(func, bound)
+
+
+def _permute_dims_rule(func, args, kwargs):
+    bound = _bind(func, args, kwargs)
+    x = _batched_first_arg(bound)
+    bound.arguments[next(iter(bound.arguments))] = x.val
+    bound.arguments["axes"] = (0,) + tuple(
+        _shift_axis(a, x.ndim) for a in bound.arguments["axes"]
+    )
+    return _call(func, bound)
+
+
+def _swapaxes_rule(func, args, kwargs):
+    bound = _bind(func, args, kwargs)
+    x = _batched_first_arg(bound)
+    bound.arguments[next(iter(bound.arguments))] = x.val
+    for param in ("axis0", "axis1"):
+        bound.arguments[param] = _shift_axis(bound.arguments[param], x.ndim)
+    return _call(func, bound)
+
+
+def _trailing_dims_rule(func, args, kwargs):
+    # functions which only act on the last two dimensions of their input can be
+    # applied to the batch unchanged
+    bound = _bind(func, args, kwargs)
+    x = _batched_first_arg(bound)
+    if x.ndim < 2:
+        raise _Unbatchable("too few dimensions")
+    bound.arguments[next(iter(bound.arguments))] = x.val
+    return _call(func, bound)
+
+
+_elementwise_fns = (
+    "abs",
+    "acos",
+    "acosh",
+    "add",
+    "asin",
+    "asinh",
+    "atan",
+    "atan2",
+    "atanh",
+    "bitwise_and",
+    "bitwise_invert",
+    "bitwise_left_shift",
+    "bitwise_or",
+    "bitwise_right_shift",
+    "bitwise_xor",
+    "ceil",
+    "cos",
+    "cosh",
+    "deg2rad",
+    "divide",
+    "equal",
+    "erf",
+    "exp",
+    "exp2",
+    "expm1",
+    "floor",
+    "floor_divide",
+    "fmin",
+    "fmod",
+    "greater",
+    "greater_equal",
+    "isfinite",
+    "isinf",
+    "isnan",
+    "isreal",
+    "less",
+    "less_equal",
+    "log",
+    "log10",
+    "log1p",
+    "log2",
+    "logaddexp",
+    "logaddexp2",
+    "logical_and",
+    "logical_not",
+    "logical_or",
+    "logical_xor",
+    "maximum",
+    "minimum",
+    "multiply",
+    "negative",
+    "not_equal",
+    "positive",
+    "pow",
+    "rad2deg",
+    "reciprocal",
+    "remainder",
+    "round",
+    "sign",
+    "sin",
+    "sinh",
+    "sqrt",
+    "square",
+    "subtract",
+    "tan",
+    "tanh",
+    "trunc",
+    "trunc_divide",
+    "astype",
+    "clip",
+    "where",
+    "gelu",
+    "leaky_relu",
+    "mish",
+    "relu",
+    "sigmoid",
+    "softplus",
+)
+
+_reduction_fns = (
+    "all",
+    "any",
+    "max",
+    "mean",
+    "min",
+    "prod",
+    "std",
+    "sum",
+    "var",
+)
+
+_int_axis_fns = ("argmax", "argmin", "cumsum", "cumprod", "softmax", "log_softmax")
+
+_trailing_dims_fns = ("matrix_transpose",)
+
+_batching_rules = {
+    **{fn_name: _elementwise_rule for fn_name in _elementwise_fns},
+    **{fn_name: _axis_rule for fn_name in _reduction_fns},
+    **{
+        fn_name: functools.partial(_axis_rule, int_axis=True)
+        for fn_name in _int_axis_fns
+    },
+    **{fn_name: _trailing_dims_rule for fn_name in _trailing_dims_fns},
+    "matmul": _matmul_rule,
+    "reshape": _reshape_rule,
+    "expand_dims": _expand_dims_rule,
+    "squeeze": _squeeze_rule,
+    "permute_dims": _permute_dims_rule,
+    "swapaxes": _swapaxes_rule,
+}
+
+
+def _vmap_traced(func, args, unmapped):
+    """
+    Calls `func` once on the batched `args`, which have their mapped axes moved to
+    the front, with the batching rules applied to the ivy functions called by
+    `func`. The arguments which aren't mapped are given in `unmapped`, and passed to
+    `func` as they are, with None in place of the mapped arguments.
+
+    Returns the batched result with the batch dimension first, or None if `func`
+    uses anything which can't be traced, in which case `func` has to be called
+    once per sample. Any other exception raised by `func` is propagated.
+    """
+    traced_args = [
+        _BatchTracer(arg) if constant is None else constant
+        for arg, constant in zip(args, unmapped)
+    ]
+    # the traced function may fail at any point once it meets an unsupported
+    # operation, which shouldn't print any exception traces
+    ivy.set_exception_trace_mode("none")
+    try:
+        ret = func(*traced_args)
+    except Exception as e:
+        if _raised_unbatchable(e):
+            return None
+        raise
+    finally:
+        ivy.unset_exception_trace_mode()
+    if not isinstance(ret, _BatchTracer):
+        return None
+    return ret.val
@@ -1,5 +1,6 @@
 # global
 
+import itertools
 import math
 import numpy as np
 from typing import Optional, Union, Tuple, Literal
@@ -7,10 +8,77 @@ from typing import Optional, Union, Tuple, Literal
 # local
 import ivy
 from ivy.functional.ivy.layers import _handle_padding, _get_num_padded_values
-from ivy.functional.backends.numpy.layers import _add_dilations
 from ivy.functional.ivy.experimental.layers import _padding_ceil_mode
 
 
+def _pool_reduce(x, kernel, strides, pad_list, dilation, reduce, initial, dtype=None):
+    """
+    Pools the channel-last `x` by reducing the strided slices of `x` at each offset
+    of the kernel into the output with the `reduce` ufunc, one offset at a time.
+
+    Padding is never materialised: the output starts filled with `initial`, and
+    each slice only covers the windows in which its offset falls inside `x`. Peak
+    memory therefore stays close to the size of the output.
+    """
+    dims = len(kernel)
+    spatial_shape = x.shape[1:-1]
+    out_shape = [
+        (spatial_shape[i] + sum(pad_list[i]) - (kernel[i] - 1) * dilation[i] - 1)
+        // strides[i]
+        + 1
+        for i in range(dims)
+    ]
+    res = np.full(
+        (x.shape[0], *out_shape, x.shape[-1]),
+        initial,
+        dtype=x.dtype if dtype is None else dtype,
+    )
+    for offsets in itertools.product(*[range(k) for k in kernel]):
+        res_idx, x_idx = [slice(None)], [slice(None)]
+        for i in range(dims):
+            # the input position of output o along this axis is o * s + start
+            start = offsets[i] * dilation[i] - pad_list[i][0]
+            lo = max(-(start // strides[i]), 0)
+            hi = min((spatial_shape[i] - 1 - start) // strides[i] + 1, out_shape[i])
+            if hi <= lo:
+                break
+            res_idx.append(slice(lo, hi))
+            x_idx.append(
+                slice(
+                    lo * strides[i] + start,
+                    (hi - 1) * strides[i] + start + 1,
+                    strides[i],
+                )
+            )
+        else:
+            res_view = res[tuple(res_idx)]
+            reduce(res_view, x[tuple(x_idx)], out=res_view)
+    return res
+
+
+def _max_pool(x, kernel, strides, pad_list, dilation=None):
+    dilation = [1] * len(kernel) if dilation is None else dilation
+    if np.issubdtype(x.dtype, np.integer):
+        initial = np.iinfo(x.dtype).min
+    else:
+        initial = -math.inf
+    return _pool_reduce(x, kernel, strides, pad_list, dilation, np.maximum, initial)
+
+
+def _mean_pool(x, kernel, strides, pad_list):
+    # accumulate like np.mean, in at least float32 and in float64 for integers
+    if np.issubdtype(x.dtype, np.floating):
+        dtype = x.dtype
+        acc_dtype = np.promote_types(x.dtype, np.float32)
+    else:
+        dtype = acc_dtype = np.float64
+    res = _pool_reduce(
+        x, kernel, strides, pad_list, [1] * len(kernel), np.add, 0, acc_dtype
+    )
+    res /= np.prod(kernel)
+    return res.astype(dtype, copy=False)
+
+
 def max_pool1d(
     x: np.ndarray,
     kernel: Union[int, Tuple[int], Tuple[int, int]],
@@ -36,31 +104,7 @@ def max_pool1d(
         x = np.swapaxes(x, 1, 2)
 
     pad_w = _handle_padding(x.shape[1], strides[0], kernel[0], padding)
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            (pad_w // 2, pad_w - pad_w // 2),
-            (0, 0),
-        ],
-        "edge",
-    )
-
-    x_shape = x.shape
-    new_w = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w, kernel[0]] + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
-    )
-
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    res = sub_matrices.max(axis=(2))
+    res = _max_pool(x, kernel, strides, [(pad_w // 2, pad_w - pad_w // 2)])
 
     if data_format == "NCW":
         return res.swapaxes(1, 2)
@@ -109,58 +153,21 @@ def max_pool2d(
         x = np.transpose(x, (0, 2, 3, 1))
 
     x_shape = list(x.shape[1:3])
-    filters = np.ones((list(kernel)), dtype=x.dtype)
-    for j in range(2):
-        if dilation[j] > 1:
-            filters = _add_dilations(filters, dilation[j], axis=j, values=0)
-    kernel = list(filters.shape)
+    dilated_kernel = [(kernel[i] - 1) * dilation[i] + 1 for i in range(2)]
     pad_list = padding
     if isinstance(padding, str):
-        pad_h = _handle_padding(x_shape[0], strides[0], kernel[0], padding)
-        pad_w = _handle_padding(x_shape[1], strides[1], kernel[1], padding)
+        pad_h = _handle_padding(x_shape[0], strides[0], dilated_kernel[0], padding)
+        pad_w = _handle_padding(x_shape[1], strides[1], dilated_kernel[1], padding)
         pad_list = [(pad_h // 2, pad_h - pad_h // 2), (pad_w // 2, pad_w - pad_w // 2)]
     pad_list = list(pad_list)
     if ceil_mode:
         for i in range(2):
             pad_list[i] = _padding_ceil_mode(
-                x_shape[i], kernel[i], pad_list[i], strides[i]
+                x_shape[i], dilated_kernel[i], pad_list[i], strides[i]
             )
 
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            *pad_list,
-            (0, 0),
-        ],
-        "constant",
-        constant_values=-math.inf,
-    )
-
-    x_shape = x.shape
-    new_h = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_w = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
+    res = _max_pool(x, kernel, strides, pad_list, dilation)
 
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.where(
-        filters.reshape([1] * 3 + list(kernel) + [1]), sub_matrices, -math.inf
-    )
-
-    # B x OH x OW x O
-    res = sub_matrices.max(axis=(3, 4))
     if data_format == "NCHW":
         return np.transpose(res, (0, 3, 1, 2))
     return res
@@ -194,41 +201,13 @@ def max_pool3d(
     pad_d = _handle_padding(x_shape[0], strides[0], kernel[0], padding)
     pad_h = _handle_padding(x_shape[1], strides[1], kernel[1], padding)
     pad_w = _handle_padding(x_shape[2], strides[2], kernel[2], padding)
+    pad_list = [
+        (pad_d // 2, pad_d - pad_d // 2),
+        (pad_h // 2, pad_h - pad_h // 2),
+        (pad_w // 2, pad_w - pad_w // 2),
+    ]
 
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            (pad_d // 2, pad_d - pad_d // 2),
-            (pad_h // 2, pad_h - pad_h // 2),
-            (pad_w // 2, pad_w - pad_w // 2),
-            (0, 0),
-        ],
-        "edge",
-    )
-
-    x_shape = x.shape
-    new_d = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_h = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_w = (x_shape[3] - kernel[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    # B x OH x OW x O
-    res = sub_matrices.max(axis=(4, 5, 6))
+    res = _max_pool(x, kernel, strides, pad_list)
     if data_format == "NCDHW":
         return np.transpose(res, (0, 4, 1, 2, 3))
     return res
@@ -288,31 +267,7 @@ def avg_pool1d(
         x_shape, kernel, strides, padding, ceil_mode, 1
     )
 
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            *padding,
-            (0, 0),
-        ],
-        constant_values=0.0,
-    )
-
-    x_shape = x.shape
-    new_w = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w, kernel[0]] + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
-    )
-
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    res = np.mean(sub_matrices, axis=2)
+    res = _mean_pool(x, kernel, strides, padding)
 
     if (not count_include_pad or ceil_mode) and any(pad_specific):
         if not count_include_pad:
@@ -321,7 +276,7 @@ def avg_pool1d(
                     _get_num_padded_values,
                     constant={
                         "p": pad_specific[0],
-                        "n": x.shape[1] - pad_specific[0],
+                        "n": x.shape[1],
                         "k": kernel[0],
                         "s": strides[0],
                     },
@@ -370,35 +325,7 @@ def avg_pool2d(
     padding, pad_specific, c = _get_padded_values(
         x_shape, kernel, strides, padding, ceil_mode, 2
     )
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            *padding,
-            (0, 0),
-        ],
-        constant_values=0.0,
-    )
-
-    x_shape = x.shape
-    new_h = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_w = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    # B x OH x OW x O
-    res = np.mean(sub_matrices, axis=(3, 4))
+    res = _mean_pool(x, kernel, strides, padding)
     if (not count_include_pad or ceil_mode) and any(pad_specific):
         if not count_include_pad:
             num_padded_values = [
@@ -407,7 +334,7 @@ def avg_pool2d(
                         _get_num_padded_values,
                         constant={
                             "p": pad_specific[i],
-                            "n": x.shape[i + 1] - pad_specific[i],
+                            "n": x.shape[i + 1],
                             "k": kernel[i],
                             "s": strides[i],
                         },
@@ -471,38 +398,7 @@ def avg_pool3d(
         x_shape, kernel, strides, padding, ceil_mode, 3
     )
 
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            *padding,
-            (0, 0),
-        ],
-        constant_values=0.0,
-    )
-
-    x_shape = x.shape
-    new_d = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_h = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_w = (x_shape[3] - kernel[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    # B x OH x OW x O
-    res = np.mean(sub_matrices, axis=(4, 5, 6))
+    res = _mean_pool(x, kernel, strides, padding)
     if (not count_include_pad or ceil_mode) and any(pad_specific):
         if not count_include_pad:
             num_padded_values = [
@@ -511,7 +407,7 @@ def avg_pool3d(
                         _get_num_padded_values,
                         constant={
                             "p": pad_specific[i],
-                            "n": x.shape[i + 1] - pad_specific[i],
+                            "n": x.shape[i + 1],
                             "k": kernel[i],
                             "s": strides[i],
                         },
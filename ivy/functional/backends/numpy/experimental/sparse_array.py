@@ -1,5 +1,6 @@
 # global
 import logging
+import numpy as np
 
 # local
 import ivy
@@ -10,6 +11,7 @@ from ivy.functional.ivy.experimental.sparse_array import (
     _verify_coo_components,
     _verify_csc_components,
     _verify_csr_components,
+    _verify_sparse_matmul_shapes,
 )
 
 
@@ -98,3 +100,49 @@ def native_sparse_array_to_indices_values_and_shape(x):
         " indices, values and shape."
     )
     return None, None, None
+
+
+def sparse_matmul(x, y, /):
+    _verify_sparse_matmul_shapes(x, y)
+    x = x.to_csr_array()
+    crow_indices = ivy.to_numpy(x.crow_indices)
+    col_indices = ivy.to_numpy(x.col_indices)
+    values = ivy.to_numpy(x.values)
+    values = values.reshape((-1,) + (1,) * (y.ndim - 1))
+    dtype = np.result_type(values, y)
+    num_rows = x.dense_shape[0]
+    ret = np.zeros((num_rows,) + y.shape[1:], dtype=dtype)
+    # blocks of rows whose products take about 1MB, so that they stay in the cache
+    # between being gathered, scaled and summed
+    row_size = max(int(np.prod(y.shape[1:])) * dtype.itemsize, 1)
+    block_size = max(2**20 // row_size, 256)
+    bounds = np.searchsorted(
+        crow_indices, np.arange(0, crow_indices[-1] + block_size, block_size)
+    )
+    bounds = np.unique(np.clip(bounds, 0, num_rows))
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        starts = crow_indices[start:stop]
+        stops = crow_indices[start + 1 : stop + 1]
+        if starts[0] == stops[-1]:
+            continue
+        # each nonzero times its row of y, summed over the nonzeros of each row
+        products = y[col_indices[starts[0] : stops[-1]]].astype(dtype, copy=False)
+        products *= values[starts[0] : stops[-1]]
+        non_empty = starts < stops
+        ret[start:stop][non_empty] = np.add.reduceat(
+            products, starts[non_empty] - starts[0], axis=0
+        )
+    return ret
+
+
+def sparse_sum(x, /, *, axis=None):
+    values = ivy.to_numpy(x.values).reshape(-1)
+    if axis is None:
+        return np.sum(values)
+    num_dims = len(x.dense_shape)
+    axis = axis % num_dims
+    kept = [i for i in range(num_dims) if i != axis]
+    coordinates = ivy.to_numpy(x._dense_coordinates())
+    ret = np.zeros([x.dense_shape[i] for i in kept], dtype=values.dtype)
+    np.add.at(ret, tuple(coordinates[:, kept].T), values)
+    return ret
@@ -3,8 +3,7 @@
 # global
 from typing import Optional, Union, Sequence, Callable
 import numpy as np
-from operator import mul
-from functools import reduce
+import math
 import multiprocessing as _multiprocessing
 from numbers import Number
 
@@ -12,6 +11,7 @@ from numbers import Number
 import ivy
 from ivy.functional.backends.numpy.device import _to_device
 from ivy.functional.backends.numpy.helpers import _scalar_output_to_0d_array
+from ivy.functional.backends.numpy.batching import _vmap_traced
 from ivy.func_wrapper import with_unsupported_dtypes
 from . import backend_version
 
@@ -64,55 +64,67 @@ def gather(
     axis = axis % len(params.shape)
     batch_dims = batch_dims % len(params.shape)
     ivy.utils.assertions.check_gather_input_valid(params, indices, axis, batch_dims)
-    result = []
     if batch_dims == 0:
-        result = np.take(params, indices, axis)
-    else:
-        for b in range(batch_dims):
-            if b == 0:
-                zip_list = [(p, i) for p, i in zip(params, indices)]
-            else:
-                zip_list = [
-                    (p, i) for z in [zip(p1, i1) for p1, i1 in zip_list] for p, i in z
-                ]
-        for z in zip_list:
-            p, i = z
-            r = np.take(p, i, axis - batch_dims)
-            result.append(r)
-        result = np.array(result)
-        result = result.reshape([*params.shape[0:batch_dims], *result.shape[1:]])
+        return _to_device(np.take(params, indices, axis))
+    batch_shape = params.shape[:batch_dims]
+    batch_size = math.prod(batch_shape)
+    axis_size = params.shape[axis]
+    if indices.size and (indices.min() < -axis_size or indices.max() >= axis_size):
+        raise IndexError(
+            "index out of bounds for axis {} with size {}".format(axis, axis_size)
+        )
+    # flatten the batch and gathered dimensions, so that the gather becomes a
+    # single take with the batch offset added to each index
+    params = np.moveaxis(
+        params.reshape(batch_size, *params.shape[batch_dims:]),
+        axis - batch_dims + 1,
+        1,
+    )
+    params = params.reshape(batch_size * axis_size, *params.shape[2:])
+    indices = indices.reshape(batch_size, *indices.shape[batch_dims:])
+    indices = np.where(indices < 0, indices + axis_size, indices)
+    batch_offsets = np.arange(batch_size) * axis_size
+    indices = indices + batch_offsets.reshape(-1, *[1] * (indices.ndim - 1))
+    # B x I... x (params dims before axis) x (params dims after axis)
+    result = np.take(params, indices, 0)
+    num_index_dims = indices.ndim - 1
+    num_leading_dims = axis - batch_dims
+    result = np.moveaxis(
+        result,
+        range(1, num_index_dims + 1),
+        range(num_leading_dims + 1, num_leading_dims + num_index_dims + 1),
+    )
+    result = result.reshape(*batch_shape, *result.shape[1:])
     return _to_device(result)
 
 
-def gather_nd_helper(params, indices):
-    indices_shape = indices.shape
-    params_shape = params.shape
-    if len(indices.shape) == 0:
-        num_index_dims = 1
-    else:
-        num_index_dims = indices_shape[-1]
-    result_dim_sizes_list = [
-        reduce(mul, params_shape[i + 1 :], 1) for i in range(len(params_shape) - 1)
-    ] + [1]
-    result_dim_sizes = np.array(result_dim_sizes_list)
-    implicit_indices_factor = int(result_dim_sizes[num_index_dims - 1].item())
-    flat_params = np.reshape(params, (-1,))
-    new_shape = [1] * (len(indices_shape) - 1) + [num_index_dims]
-    indices_scales = np.reshape(result_dim_sizes[0:num_index_dims], new_shape)
-    indices_for_flat_tiled = np.tile(
-        np.reshape(np.sum(indices * indices_scales, -1, keepdims=True), (-1, 1)),
-        (1, implicit_indices_factor),
+def gather_nd_helper(params, indices, batch_dims=0):
+    batch_shape = params.shape[:batch_dims]
+    batch_size = math.prod(batch_shape)
+    if len(indices.shape) == batch_dims:
+        indices = np.expand_dims(indices, -1)
+    num_index_dims = indices.shape[-1]
+    index_dims = params.shape[batch_dims : batch_dims + num_index_dims]
+    indices_shape = indices.shape[batch_dims:-1]
+    indices = indices.reshape(batch_size, *indices_shape, num_index_dims)
+    indices = np.where(indices < 0, indices + np.array(index_dims, np.int64), indices)
+    # the batch index is the leading component of the index into the flattened
+    # batch and indexed dimensions of params
+    batch_indices = np.arange(batch_size).reshape(-1, *[1] * len(indices_shape))
+    flat_indices = np.ravel_multi_index(
+        (batch_indices, *np.moveaxis(indices, -1, 0)), (batch_size, *index_dims)
     )
-    implicit_indices = np.tile(
-        np.expand_dims(np.arange(implicit_indices_factor), 0),
-        (indices_for_flat_tiled.shape[0], 1),
+    flat_params = np.reshape(
+        params,
+        (
+            batch_size * math.prod(index_dims),
+            *params.shape[batch_dims + num_index_dims :],
+        ),
+    )
+    res = np.take(flat_params, flat_indices, 0)
+    return np.reshape(
+        res, (*batch_shape, *indices_shape, *res.shape[1 + len(indices_shape) :])
     )
-    indices_for_flat = indices_for_flat_tiled + implicit_indices
-    flat_indices_for_flat = np.reshape(indices_for_flat, (-1,)).astype(np.int32)
-    flat_gather = np.take(flat_params, flat_indices_for_flat, 0)
-    new_shape = list(indices_shape[:-1]) + list(params_shape[num_index_dims:])
-    res = np.reshape(flat_gather, new_shape)
-    return res
 
 
 def gather_nd(
@@ -125,24 +137,7 @@ def gather_nd(
 ) -> np.ndarray:
     ivy.utils.assertions.check_gather_nd_input_valid(params, indices, batch_dims)
     batch_dims = batch_dims % len(params.shape)
-    result = []
-    if batch_dims == 0:
-        result = gather_nd_helper(params, indices)
-    else:
-        for b in range(batch_dims):
-            if b == 0:
-                zip_list = [(p, i) for p, i in zip(params, indices)]
-            else:
-                zip_list = [
-                    (p, i) for z in [zip(p1, i1) for p1, i1 in zip_list] for p, i in z
-                ]
-        for z in zip_list:
-            p, i = z
-            r = gather_nd_helper(p, np.asarray(i, indices.dtype))
-            result.append(r)
-        result = np.array(result)
-        result = result.reshape([*params.shape[0:batch_dims], *result.shape[1:]])
-    return _to_device(result)
+    return _to_device(gather_nd_helper(params, indices, batch_dims))
 
 
 def get_num_dims(x, /, *, as_array=False):
@@ -413,6 +408,13 @@ def vmap(
                 in_axes, message="single value in_axes should not be None"
             )
 
+        # the arguments which aren't mapped, which don't need to be broadcast when
+        # tracing func with the batch dimension
+        unmapped = [
+            arg if isinstance(in_axes, (tuple, list)) and in_axes[i] is None else None
+            for i, arg in enumerate(args)
+        ]
+
         # Handling None in in_axes by broadcasting the axis_size
         if isinstance(in_axes, (tuple, list)) and None in in_axes:
             none_axis_index = list()
@@ -434,12 +436,17 @@ def vmap(
         elif isinstance(in_axes, int):
             args[0] = np.moveaxis(args[0], in_axes, 0)
 
-        # vectorisation. To be optimized.
-        arr_results = []
-        for arrays in zip(*args):
-            single_op = func(*arrays)
-            arr_results.append(single_op)
-        res = np.stack(arr_results)
+        # vectorisation, by tracing func once with the batch dimension if all of the
+        # ivy functions it calls have batching rules, else by calling it per sample.
+        # func can't be known to be untraceable before it's run, so any side effects
+        # of func before the tracing fails happen again in the calls per sample
+        res = _vmap_traced(func, args, unmapped)
+        if res is None:
+            arr_results = []
+            for arrays in zip(*args):
+                single_op = func(*arrays)
+                arr_results.append(single_op)
+            res = np.stack(arr_results)
 
         if out_axes:
             res = np.moveaxis(res, 0, out_axes)
@@ -52,6 +52,80 @@ def _dilate_pad_conv(x, filters, strides, padding, dims, dilations):
     return x, filters
 
 
+# the largest im2col buffer, in bytes, that a convolution creates at once, beyond
+# which the batch is split into tiles. None disables tiling.
+_im2col_max_bytes = 2**28
+
+
+def _im2col_gemm(x, filters, strides, dims, feature_group_count=1):
+    """
+    Convolves the padded channel-last input `x` with the (dilated) `filters`, by
+    copying the patches of `x` into a matrix for each feature group and multiplying
+    them with the filters of the group in a single batched GEMM.
+
+    The memory used grows with the size of the output times the size of the
+    kernel times the input channels, rather than also times the output channels.
+    """
+    batch_size = x.shape[0]
+    kernel_shape = filters.shape[:dims]
+    input_dim, output_dim = filters.shape[-2:]
+    group_dim = output_dim // feature_group_count
+    # the patches are strided views of x, which would read past its end otherwise
+    if input_dim * feature_group_count != x.shape[-1]:
+        raise ivy.utils.exceptions.IvyException(
+            "the filters take {} input channels, but the input has {}".format(
+                input_dim * feature_group_count, x.shape[-1]
+            )
+        )
+    out_shape = [
+        (x.shape[i + 1] - kernel_shape[i]) // strides[i] + 1 for i in range(dims)
+    ]
+    num_patches = int(np.prod(out_shape))
+    patch_size = int(np.prod(kernel_shape)) * input_dim
+
+    # G x (K... x I) x O/G
+    filters = np.moveaxis(
+        filters.reshape(-1, input_dim, feature_group_count, group_dim), 2, 0
+    ).reshape(feature_group_count, patch_size, group_dim)
+
+    tile = batch_size
+    bytes_per_sample = feature_group_count * num_patches * patch_size * x.dtype.itemsize
+    if _im2col_max_bytes is not None and bytes_per_sample > 0:
+        tile = int(min(max(_im2col_max_bytes // bytes_per_sample, 1), batch_size))
+    res = []
+    for start in range(0, max(batch_size, 1), max(tile, 1)):
+        x_tile = np.ascontiguousarray(x[start : start + tile])
+        # G x B x O... x K... x I, as a view of the input
+        patches = np.lib.stride_tricks.as_strided(
+            x_tile,
+            [
+                feature_group_count,
+                x_tile.shape[0],
+                *out_shape,
+                *kernel_shape,
+                input_dim,
+            ],
+            [
+                x_tile.strides[-1] * input_dim,
+                x_tile.strides[0],
+                *[x_tile.strides[i + 1] * strides[i] for i in range(dims)],
+                *x_tile.strides[1:-1],
+                x_tile.strides[-1],
+            ],
+            writeable=False,
+        )
+        # G x (B x O...) x (K... x I), copying the patches
+        patches = patches.reshape(
+            feature_group_count, x_tile.shape[0] * num_patches, patch_size
+        )
+        # G x (B x O...) x O/G
+        res_tile = np.matmul(patches, filters)
+        res.append(
+            np.moveaxis(res_tile, 0, 1).reshape(x_tile.shape[0], *out_shape, output_dim)
+        )
+    return res[0] if len(res) == 1 else np.concatenate(res, axis=0)
+
+
 def _dilate_pad_conv_tranpose(
     x, filters, strides, padding, dims, dilations, output_shape
 ):
@@ -120,32 +194,7 @@ def conv1d(
 
     x, filters = _dilate_pad_conv(x, filters, strides, padding, 1, dilations)
 
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:1])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_w = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
-    )
-    # B x OW x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OW x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 4 + [output_dim]
-    )
-    # B x OW x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 2 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OW x O
-    res = np.sum(mult, (2, 3))
+    res = _im2col_gemm(x, filters, strides, 1)
 
     if data_format == "NCW":
         res = np.transpose(res, (0, 2, 1))
@@ -197,35 +246,7 @@ def conv2d(
 
     x, filters = _dilate_pad_conv(x, filters, strides, padding, 2, dilations)
 
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:2])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_h = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_w = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OH x OW x KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
-    )
-    # B x OH x OW x KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 3 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OH x OW x O
-    res = np.sum(mult, (3, 4, 5))
+    res = _im2col_gemm(x, filters, strides, 2)
 
     if data_format == "NCHW":
         return np.transpose(res, (0, 3, 1, 2))
@@ -272,47 +293,19 @@ def depthwise_conv2d(
 ):
     strides = [strides] * 2 if isinstance(strides, int) else strides
     dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
-    if isinstance(padding, int):
-        padding = [(padding, padding)] * 2
-    if data_format == "NHWC":
-        x = np.transpose(x, (3, 0, 1, 2))
-    else:
-        x = np.transpose(x, (1, 0, 2, 3))
+    if data_format == "NCHW":
+        x = np.transpose(x, (0, 2, 3, 1))
     filters = np.squeeze(filters, 3) if filters.ndim == 4 else filters
-    filters = np.transpose(filters, (2, 0, 1))
-    filters = np.expand_dims(filters, (-1, -2))
-    filter_h = filters.shape[1] + (filters.shape[1] - 1) * (dilations[0] - 1)
-    filter_w = filters.shape[2] + (filters.shape[2] - 1) * (dilations[1] - 1)
-    if isinstance(padding, str):
-        if padding == "VALID":
-            out_height = np.ceil(float(x.shape[2] - filter_h + 1) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3] - filter_w + 1) / float(strides[1]))
-        else:
-            out_height = np.ceil(float(x.shape[2]) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3]) / float(strides[1]))
-    else:
-        out_height = np.ceil(
-            float(x.shape[2] - filter_h + padding[0][0] + padding[0][1] + 1)
-            / float(strides[0])
-        )
-        out_width = np.ceil(
-            float(x.shape[3] - filter_w + padding[1][0] + padding[1][1] + 1)
-            / float(strides[1])
-        )
-    if data_format == "NHWC":
-        outputs = np.empty([x.shape[1], int(out_height), int(out_width), 0], x.dtype)
-    else:
-        outputs = np.empty([x.shape[1], 0, int(out_height), int(out_width)], x.dtype)
-    x = np.expand_dims(x, -1)
-    for i in range(x.shape[0]):
-        output = conv2d(
-            x[i], filters[i], strides, padding, data_format="NHWC", dilations=dilations
-        )
-        if data_format == "NHWC":
-            outputs = np.append(outputs, output, axis=-1)
-        else:
-            outputs = np.append(outputs, np.transpose(output, (0, 3, 1, 2)), axis=1)
-    return outputs
+    # KH x KW x 1 x C, with each channel convolved as its own feature group
+    filters = np.expand_dims(filters, -2)
+
+    x, filters = _dilate_pad_conv(x, filters, strides, padding, 2, dilations)
+
+    res = _im2col_gemm(x, filters, strides, 2, filters.shape[-1])
+
+    if data_format == "NCHW":
+        return np.transpose(res, (0, 3, 1, 2))
+    return res
 
 
 def conv3d(
@@ -333,38 +326,7 @@ def conv3d(
 
     x, filters = _dilate_pad_conv(x, filters, strides, padding, 3, dilations)
 
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:3])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_d = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_h = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_w = (x_shape[3] - filter_shape[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OD X OH x OW x KD X KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 8 + [output_dim]
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 4 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OD X OH x OW x O
-    res = np.sum(mult, (4, 5, 6, 7))
+    res = _im2col_gemm(x, filters, strides, 3)
 
     if data_format == "NCDHW":
         return np.transpose(res, (0, 4, 1, 2, 3))
@@ -424,46 +386,7 @@ def conv_general_dilated(
             x = _add_dilations(x, x_dilations[j], axis=j + 1)
     x, filters = _dilate_pad_conv(x, filters, strides, padding, dims, dilations)
 
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:dims])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_shape = [
-        (x_shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
-    ]
-    res = []
-    new_shape = [x_shape[0], *new_shape] + filter_shape + [input_dim]
-    for i, j in zip(
-        range(0, x.shape[-1], input_dim),
-        range(0, output_dim, output_dim // feature_group_count),
-    ):
-        sliced_x = x[..., i : i + input_dim]
-        sliced_filters = filters[..., j : j + output_dim // feature_group_count]
-        normal_strides = [sliced_x.strides[i] for i in range(1, dims + 2)]
-        changed_strides = [
-            sliced_x.strides[i] * strides[i - 1] for i in range(1, dims + 1)
-        ]
-        new_strides = (x.strides[0], *changed_strides, *normal_strides)
-        # B x OH x OW x KH x KW x I
-        sub_matrices = np.lib.stride_tricks.as_strided(
-            sliced_x, new_shape, new_strides, writeable=False
-        )
-
-        # B x OH x OW x KH x KW x I x O
-        sub_matrices_w_output_dim = np.tile(
-            np.expand_dims(sub_matrices, -1),
-            [1] * (dims * 2 + 2) + [output_dim // feature_group_count],
-        )
-        # B x OH x OW x KH x KW x I x O
-        mult = sub_matrices_w_output_dim * sliced_filters.reshape(
-            [1] * (dims + 1)
-            + filter_shape
-            + [input_dim, output_dim // feature_group_count]
-        )
-
-        # B x OH x OW x O
-        res.append(np.sum(mult, tuple([i for i in range(dims + 1, dims * 2 + 2)])))
-    res = np.concatenate(res, axis=-1)
+    res = _im2col_gemm(x, filters, strides, dims, feature_group_count)
     res = np.add(res, bias) if bias is not None else res
 
     if data_format == "channel_first":
@@ -519,3 +442,57 @@ def conv_general_transpose(
     if data_format == "channel_first":
         return np.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def lstm_update(
+    x: np.ndarray,
+    init_h: np.ndarray,
+    init_c: np.ndarray,
+    kernel: np.ndarray,
+    recurrent_kernel: np.ndarray,
+    /,
+    *,
+    bias: Optional[np.ndarray] = None,
+    recurrent_bias: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    output_channels = init_h.shape[-1]
+    # the buffers below are written in-place, so they take the promoted dtype upfront
+    dtype = np.result_type(
+        x,
+        init_h,
+        init_c,
+        kernel,
+        recurrent_kernel,
+        *(b for b in (bias, recurrent_bias) if b is not None),
+    )
+    x_proj = np.matmul(x.reshape((-1, x.shape[-1])), kernel)
+    x_proj = x_proj.reshape(x.shape[:-1] + (-1,)).astype(dtype, copy=False)
+    for b in (bias, recurrent_bias):
+        if b is not None:
+            x_proj += b
+    batch_shape = np.broadcast_shapes(x_proj.shape[:-2], init_h.shape[:-1])
+    # the steps write their hidden states straight into the output, and reuse a
+    # single buffer for the packed gates
+    hts = np.empty(batch_shape + x_proj.shape[-2:-1] + (output_channels,), x_proj.dtype)
+    ct = np.array(np.broadcast_to(init_c, hts.shape[:-2] + (output_channels,)))
+    ct = ct.astype(x_proj.dtype, copy=False)
+    gates = np.empty(batch_shape + (4 * output_channels,), x_proj.dtype)
+    it, ft, gt, ot = np.split(gates, 4, axis=-1)
+    ht = np.broadcast_to(init_h, batch_shape + (output_channels,)).astype(dtype)
+    for t in range(x_proj.shape[-2]):
+        np.matmul(ht, recurrent_kernel, out=gates)
+        gates += x_proj[..., t, :]
+        np.tanh(gt, out=gt)
+        # sigmoid(a) = (tanh(a / 2) + 1) / 2, which can't overflow
+        for gate in (gates[..., : 2 * output_channels], ot):
+            gate *= 0.5
+            np.tanh(gate, out=gate)
+            gate += 1
+            gate *= 0.5
+        ct *= ft
+        it *= gt
+        ct += it
+        ht = hts[..., t, :]
+        np.tanh(ct, out=ht)
+        ht *= ot
+    return hts, ct
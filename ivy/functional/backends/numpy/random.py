@@ -51,6 +51,15 @@ def random_normal(
     return np.asarray(np.random.normal(mean, std, shape), dtype=dtype)
 
 
+# the generator used by samplers which don't draw from the global numpy state,
+# reseeded along with it by ivy.seed
+_generator = np.random.default_rng()
+
+
+def _get_generator(seed=None):
+    return np.random.default_rng(seed) if seed else _generator
+
+
 @with_unsupported_dtypes({"1.23.0 and below": ("bfloat16",)}, backend_version)
 def multinomial(
     population_size: int,
@@ -64,8 +73,7 @@ def multinomial(
     seed: Optional[int] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    if seed:
-        np.random.seed(seed)
+    generator = _get_generator(seed)
     if probs is None:
         probs = (
             np.ones(
@@ -79,13 +87,34 @@ def multinomial(
     orig_probs_shape = list(probs.shape)
     num_classes = orig_probs_shape[-1]
     probs_flat = np.reshape(probs, (-1, orig_probs_shape[-1]))
-    probs_flat = probs_flat / np.sum(probs_flat, -1, keepdims=True, dtype="float64")
-    probs_stack = np.split(probs_flat, probs_flat.shape[0])
-    samples_stack = [
-        np.random.choice(num_classes, num_samples, replace, p=prob[0])
-        for prob in probs_stack
-    ]
-    samples_flat = np.stack(samples_stack)
+    num_rows = probs_flat.shape[0]
+    if replace:
+        # inverse cdf sampling, with every row offset by its index so that all
+        # rows are searched at once
+        cdf = np.cumsum(probs_flat, -1, dtype="float64")
+        cdf /= cdf[:, -1:]
+        row_offsets = np.arange(num_rows, dtype="float64")[:, None]
+        cdf += row_offsets
+        uniform = generator.random((num_rows, num_samples))
+        uniform += row_offsets
+        samples_flat = np.searchsorted(cdf.reshape(-1), uniform, side="right")
+        samples_flat -= np.arange(0, num_rows * num_classes, num_classes)[:, None]
+        samples_flat = np.minimum(samples_flat, num_classes - 1)
+    else:
+        if num_samples > np.min(np.count_nonzero(probs_flat, -1), initial=num_classes):
+            raise ValueError("Fewer non-zero entries in p than size")
+        # gumbel top-k in its exponential race form, the classes with the smallest
+        # exponential noise scaled by the inverse probabilities
+        with np.errstate(divide="ignore"):
+            keys = generator.standard_exponential(probs_flat.shape)
+            keys /= probs_flat
+        if num_samples == 1:
+            samples_flat = np.argmin(keys, -1)[:, None]
+        else:
+            top_k = np.argpartition(keys, max(num_samples - 1, 0), -1)
+            top_k = top_k[:, :num_samples]
+            order = np.argsort(np.take_along_axis(keys, top_k, -1), -1)
+            samples_flat = np.take_along_axis(top_k, order, -1)
     return np.asarray(np.reshape(samples_flat, orig_probs_shape[:-1] + [num_samples]))
 
 
@@ -111,7 +140,9 @@ def randint(
 
 
 def seed(*, seed_value: int = 0) -> None:
+    global _generator
     np.random.seed(seed_value)
+    _generator = np.random.default_rng(seed_value)
 
 
 def shuffle(
@@ -11,6 +11,7 @@ from ivy.functional.ivy.experimental.sparse_array import (
     _verify_coo_components,
     _verify_csc_components,
     _verify_csr_components,
+    _verify_sparse_matmul_shapes,
 )
 
 
@@ -55,13 +56,10 @@ def native_sparse_array(
             values,
             dense_shape,
         )
-        all_coordinates = []
-        for i in range(values.shape[0]):
-            coordinate = ivy.gather(coo_indices, ivy.array([[i]]))
-            coordinate = ivy.reshape(coordinate, (coo_indices.shape[0],))
-            all_coordinates.append(coordinate.to_list())
         return tf.SparseTensor(
-            indices=all_coordinates, values=values, dense_shape=dense_shape
+            indices=tf.transpose(tf.cast(coo_indices, tf.int64)),
+            values=values,
+            dense_shape=dense_shape,
         )
     elif format == "csr":
         _verify_csr_components(
@@ -103,3 +101,30 @@ def native_sparse_array_to_indices_values_and_shape(x):
     if isinstance(x, tf.SparseTensor):
         return {"coo_indices": x.indices}, x.values, x.dense_shape
     raise ivy.utils.exceptions.IvyException("not a SparseTensor")
+
+
+def _to_tf_sparse(x):
+    # tensorflow only has coo sparse tensors, so the other formats are converted
+    if x.data is not None:
+        return x.data
+    return tf.sparse.reorder(
+        tf.SparseTensor(
+            indices=ivy.to_native(x._dense_coordinates()),
+            values=ivy.to_native(ivy.flatten(x.values)),
+            dense_shape=tuple(x.dense_shape),
+        )
+    )
+
+
+def sparse_matmul(x, y, /):
+    _verify_sparse_matmul_shapes(x, y)
+    x = _to_tf_sparse(x)
+    dtype = ivy.as_native_dtype(ivy.promote_types(x.dtype, y.dtype))
+    x, y = tf.cast(x, dtype), tf.cast(y, dtype)
+    if len(y.shape) == 1:
+        return tf.sparse.sparse_dense_matmul(x, tf.expand_dims(y, -1))[:, 0]
+    return tf.sparse.sparse_dense_matmul(x, y)
+
+
+def sparse_sum(x, /, *, axis=None):
+    return tf.sparse.reduce_sum(_to_tf_sparse(x), axis=axis)
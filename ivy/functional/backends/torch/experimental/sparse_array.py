@@ -6,6 +6,7 @@ from ivy.functional.ivy.experimental.sparse_array import (
     _verify_csr_components,
     _verify_csc_components,
     _is_data_not_indices_values_and_shape,
+    _verify_sparse_matmul_shapes,
 )
 import torch
 
@@ -116,3 +117,36 @@ def native_sparse_array_to_indices_values_and_shape(x):
             x.size(),
         )
     raise ivy.utils.exceptions.IvyException("not a sparse COO/CSR/CSC/BSC/BSR Tensor")
+
+
+def _to_torch_sparse(x, /, *, coo=False):
+    # the native sparse tensor where torch has kernels for it, and otherwise a coo
+    # tensor, which torch's kernels support for all the formats and dtypes
+    if x.data is not None:
+        if x.format == "coo":
+            return x.data
+        if not coo and x.data.dtype in [torch.float32, torch.float64]:
+            return x.data
+    return torch.sparse_coo_tensor(
+        ivy.to_native(ivy.permute_dims(x._dense_coordinates(), (1, 0))),
+        ivy.to_native(ivy.flatten(x.values)),
+        size=tuple(x.dense_shape),
+    )
+
+
+def sparse_matmul(x, y, /):
+    _verify_sparse_matmul_shapes(x, y)
+    x = _to_torch_sparse(x)
+    dtype = ivy.as_native_dtype(ivy.promote_types(x.dtype, y.dtype))
+    x, y = x.to(dtype), y.to(dtype)
+    if y.dim() == 1:
+        return torch.mv(x, y)
+    return torch.sparse.mm(x, y)
+
+
+def sparse_sum(x, /, *, axis=None):
+    x = _to_torch_sparse(x, coo=True)
+    if axis is None:
+        return torch.sparse.sum(x)
+    ret = torch.sparse.sum(x, dim=axis)
+    return ret.to_dense() if ret.is_sparse else ret
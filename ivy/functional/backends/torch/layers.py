@@ -479,3 +479,63 @@ def conv_general_transpose(
     if data_format == "channel_last":
         res = res.permute(0, *range(2, dims + 2), 1)
     return res
+
+
+@handle_mixed_function(
+    lambda x, init_h, init_c, kernel, recurrent_kernel, **kwargs: x.dtype
+    in [torch.float32, torch.float64]
+    and x.shape[:-2] == init_h.shape[:-1]
+    # the fused kernel doesn't promote, so the states and weights need the dtype of x
+    and all(
+        a.dtype == x.dtype
+        for a in (
+            init_h,
+            init_c,
+            kernel,
+            recurrent_kernel,
+            kwargs.get("bias"),
+            kwargs.get("recurrent_bias"),
+        )
+        if a is not None
+    )
+)
+def lstm_update(
+    x: torch.Tensor,
+    init_h: torch.Tensor,
+    init_c: torch.Tensor,
+    kernel: torch.Tensor,
+    recurrent_kernel: torch.Tensor,
+    /,
+    *,
+    bias: Optional[torch.Tensor] = None,
+    recurrent_bias: Optional[torch.Tensor] = None,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    batch_shape = x.shape[:-2]
+    output_channels = init_h.shape[-1]
+    # torch's fused kernel takes the weights as [4 x out, in], with the gates in the
+    # same order, and a single flattened batch dimension
+    params = [kernel.T, recurrent_kernel.T]
+    has_biases = bias is not None or recurrent_bias is not None
+    if has_biases:
+        params += [
+            b if b is not None else torch.zeros_like(params[0][:, 0])
+            for b in (bias, recurrent_bias)
+        ]
+    hts, _, ct = torch.lstm(
+        x.reshape((-1,) + x.shape[-2:]),
+        (
+            init_h.reshape(1, -1, output_channels),
+            init_c.reshape(1, -1, output_channels),
+        ),
+        params,
+        has_biases,
+        1,
+        0.0,
+        False,
+        False,
+        True,
+    )
+    return (
+        hts.reshape(batch_shape + hts.shape[-2:]),
+        ct.reshape(batch_shape + (output_channels,)),
+    )
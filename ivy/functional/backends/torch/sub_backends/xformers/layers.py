@@ -12,6 +12,7 @@ def scaled_dot_product_attention(
     /,
     *,
     mask=None,
+    chunk_size=None,
     out=None,
 ):
 
@@ -293,6 +293,7 @@ from .tensor_functions import *
 from . import utilities
 from .utilities import *
 from . import linalg
+from . import sparse
 from . import func
 from .func import *
 
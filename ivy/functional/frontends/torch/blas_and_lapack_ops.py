@@ -135,6 +135,8 @@ def matrix_rank(input, tol=None, symmetric=False, *, out=None):
 
 @to_ivy_arrays_and_back
 def mm(input, mat2, *, out=None):
+    if ivy.is_ivy_sparse_array(input):
+        return ivy.sparse_matmul(input, mat2)
     if len(ivy.shape(input)) != 2 or len(ivy.shape(mat2)) != 2:
         raise RuntimeError("input must be 2D matrices")
     input, mat2 = torch_frontend.promote_types_of_torch_inputs(input, mat2)
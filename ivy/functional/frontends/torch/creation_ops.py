@@ -285,3 +285,46 @@ def asarray(
     copy=None,
 ):
     return ivy.asarray(obj, copy=copy, dtype=dtype, device=device)
+
+
+@to_ivy_arrays_and_back
+def sparse_coo_tensor(
+    indices,
+    values,
+    size=None,
+    *,
+    dtype=None,
+    device=None,
+    requires_grad=False,
+    check_invariants=None,
+):
+    values = ivy.asarray(values, dtype=dtype, device=device)
+    if size is None:
+        size = [int(i) + 1 for i in ivy.max(indices, axis=1)]
+    return ivy.SparseArray(
+        coo_indices=indices, values=values, dense_shape=size, format="coo"
+    )
+
+
+@to_ivy_arrays_and_back
+def sparse_csr_tensor(
+    crow_indices,
+    col_indices,
+    values,
+    size=None,
+    *,
+    dtype=None,
+    device=None,
+    requires_grad=False,
+    check_invariants=None,
+):
+    values = ivy.asarray(values, dtype=dtype, device=device)
+    if size is None:
+        size = [ivy.shape(crow_indices)[0] - 1, int(ivy.max(col_indices)) + 1]
+    return ivy.SparseArray(
+        crow_indices=crow_indices,
+        col_indices=col_indices,
+        values=values,
+        dense_shape=size,
+        format="csr",
+    )
@@ -0,0 +1,21 @@
+# local
+import ivy
+from ivy.functional.frontends.torch.func_wrapper import to_ivy_arrays_and_back
+
+
+@to_ivy_arrays_and_back
+def mm(sparse, dense):
+    return ivy.sparse_matmul(sparse, dense)
+
+
+@to_ivy_arrays_and_back
+def sum(input, dim=None, dtype=None):
+    if isinstance(dim, (tuple, list)):
+        dims = sorted(d % len(input.dense_shape) for d in dim)
+        # the last dim is summed first, so the indices of the others stay valid
+        ret = ivy.sparse_sum(input, axis=dims[-1])
+        if len(dims) > 1:
+            ret = ivy.sum(ret, axis=tuple(dims[:-1]))
+    else:
+        ret = ivy.sparse_sum(input, axis=dim)
+    return ret if dtype is None else ivy.astype(ret, dtype)
@@ -1,58 +1,82 @@
 # flake8: noqa
-from . import activations
-from .activations import *
-from . import constants
-from .constants import *
-from . import creation
-from .creation import *
-from . import data_type
-from .data_type import *
-from . import device
-from .device import *
-from . import elementwise
-from .elementwise import *
-from . import general
-from .general import *
-from . import gradients
-from .gradients import *
-from . import layers
-from .layers import *
-from . import linear_algebra as linalg
-from .linear_algebra import *
-from . import losses
-from .losses import *
-from . import manipulation
-from .manipulation import *
-from . import meta
-from .meta import *
-from . import nest
-from .nest import *
-from . import norms
-from .norms import *
-from . import random
-from .random import *
-from . import searching
-from .searching import *
-from . import set
-from .set import *
-from . import sorting
-from .sorting import *
-from . import statistical
-from .statistical import *
-from . import utility
-from .utility import *
-from . import control_flow_ops
-from .control_flow_ops import *
-import types
+from ivy.utils.lazy_import import enabled as _lazy_import, is_api as _is_api
 
-__all__ = [
-    name
-    for name, thing in globals().items()
-    if not (
-        name.startswith("_")
-        or name == "ivy"
-        or (callable(thing) and "ivy" not in thing.__module__)
-        or (isinstance(thing, types.ModuleType) and "ivy" not in thing.__name__)
+if not _lazy_import:
+    from . import activations
+    from .activations import *
+    from . import constants
+    from .constants import *
+    from . import creation
+    from .creation import *
+    from . import data_type
+    from .data_type import *
+    from . import device
+    from .device import *
+    from . import elementwise
+    from .elementwise import *
+    from . import general
+    from .general import *
+    from . import gradients
+    from .gradients import *
+    from . import layers
+    from .layers import *
+    from . import linear_algebra as linalg
+    from .linear_algebra import *
+    from . import losses
+    from .losses import *
+    from . import manipulation
+    from .manipulation import *
+    from . import meta
+    from .meta import *
+    from . import nest
+    from .nest import *
+    from . import norms
+    from .norms import *
+    from . import random
+    from .random import *
+    from . import searching
+    from .searching import *
+    from . import set
+    from .set import *
+    from . import sorting
+    from .sorting import *
+    from . import statistical
+    from .statistical import *
+    from . import utility
+    from .utility import *
+    from . import control_flow_ops
+    from .control_flow_ops import *
+
+    __all__ = [name for name, thing in globals().items() if _is_api(name, thing)]
+else:
+    from ivy.utils.lazy_import import lazy_package as _lazy_package
+
+    __getattr__, __dir__ = _lazy_package(
+        __name__,
+        [
+            ("activations", (), True),
+            ("constants", (), True),
+            ("creation", (), True),
+            ("data_type", (), True),
+            ("device", (), True),
+            ("elementwise", (), True),
+            ("general", (), True),
+            ("gradients", (), True),
+            ("layers", (), True),
+            ("linear_algebra", ("linalg",), True),
+            ("losses", (), True),
+            ("manipulation", (), True),
+            ("meta", (), True),
+            ("nest", (), True),
+            ("norms", (), True),
+            ("random", (), True),
+            ("searching", (), True),
+            ("set", (), True),
+            ("sorting", (), True),
+            ("statistical", (), True),
+            ("utility", (), True),
+            ("control_flow_ops", (), True),
+        ],
+        api_only=True,
+        disjoint=True,
     )
-]
-del types
@@ -1,5 +1,6 @@
 # global
 import ast
+import functools
 import inspect
 import math
 from numbers import Number
@@ -10,6 +11,7 @@ import importlib
 # local
 import ivy
 from ivy.utils.backend import current_backend
+from ivy.utils.context_stack import ContextStack
 from ivy.func_wrapper import (
     handle_array_function,
     handle_out_argument,
@@ -20,6 +22,7 @@ from ivy.func_wrapper import (
     inputs_to_ivy_arrays,
 )
 from ivy.utils.exceptions import handle_exceptions
+from ivy.utils.support_matrix import _memoize_support_query
 
 
 # Helpers #
@@ -76,7 +79,9 @@ def _lstrip_lines(source: str) -> str:
     return source
 
 
-# Get the list of function used the function
+# Get the list of function used the function, bounded as the cache holds on to the
+# functions it's called with
+@functools.lru_cache(maxsize=1024)
 def _get_function_list(func):
     tree = ast.parse(_lstrip_lines(inspect.getsource(func)))
     names = {}
@@ -772,11 +777,11 @@ def result_type(
 # Extra #
 # ------#
 
-default_dtype_stack = list()
-default_float_dtype_stack = list()
-default_int_dtype_stack = list()
-default_uint_dtype_stack = list()
-default_complex_dtype_stack = list()
+default_dtype_stack = ContextStack("default_dtype_stack")
+default_float_dtype_stack = ContextStack("default_float_dtype_stack")
+default_int_dtype_stack = ContextStack("default_int_dtype_stack")
+default_uint_dtype_stack = ContextStack("default_uint_dtype_stack")
+default_complex_dtype_stack = ContextStack("default_complex_dtype_stack")
 
 
 class DefaultDtype:
@@ -1550,6 +1555,7 @@ def dtype(
 
 @handle_nestable
 @handle_exceptions
+@_memoize_support_query
 def function_supported_dtypes(fn: Callable, recurse: bool = True) -> Tuple:
     """Returns the supported data types of the current backend's function.
 
@@ -1587,6 +1593,7 @@ def function_supported_dtypes(fn: Callable, recurse: bool = True) -> Tuple:
 
 @handle_nestable
 @handle_exceptions
+@_memoize_support_query
 def function_unsupported_dtypes(fn: Callable, recurse: bool = True) -> Tuple:
     """Returns the unsupported data types of the current backend's function.
 
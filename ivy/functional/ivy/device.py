@@ -5,7 +5,6 @@ import os
 import gc
 import abc
 import math
-import psutil
 import warnings
 import types
 from typing import Type, Optional, Tuple
@@ -36,9 +35,11 @@ from ivy.func_wrapper import (
     handle_nestable,
     handle_array_like_without_promotion,
 )
+from ivy.utils.context_stack import ContextStack
 from ivy.utils.exceptions import handle_exceptions
+from ivy.utils.support_matrix import _memoize_support_query
 
-default_device_stack = list()
+default_device_stack = ContextStack("default_device_stack")
 dev_handles = dict()
 split_factors = dict()
 max_chunk_sizes = dict()
@@ -428,6 +429,8 @@ def total_mem_on_dev(device: Union[ivy.Device, ivy.NativeDevice], /) -> float:
         info = pynvml.nvmlDeviceGetMemoryInfo(handle)
         return info.total / 1e9
     elif device == "cpu":
+        import psutil
+
         return psutil.virtual_memory().total / 1e9
     else:
         raise ivy.utils.exceptions.IvyException(
@@ -485,6 +488,8 @@ def used_mem_on_dev(
         info = pynvml.nvmlDeviceGetMemoryInfo(handle)
         return info.used / 1e9
     elif device == "cpu":
+        import psutil
+
         if process_specific:
             return psutil.Process(os.getpid()).memory_info().rss / 1e9
         vm = psutil.virtual_memory()
@@ -546,6 +551,8 @@ def percent_used_mem_on_dev(
                     return (process.usedGpuMemory / info.total) * 100
         return (info.used / info.total) * 100
     elif device == "cpu":
+        import psutil
+
         vm = psutil.virtual_memory()
         if process_specific:
             return (psutil.Process(os.getpid()).memory_info().rss / vm.total) * 100
@@ -589,6 +596,8 @@ def dev_util(device: Union[ivy.Device, ivy.NativeDevice], /) -> float:
 
     """
     if device == "cpu":
+        import psutil
+
         return psutil.cpu_percent()
     elif "gpu" in device:
         handle = _get_nvml_gpu_handle(device)
@@ -640,6 +649,8 @@ def num_cpu_cores(*, logical: bool = True) -> int:
     2
 
     """
+    import psutil
+
     if logical:
         return psutil.cpu_count(logical=logical)
     else:
@@ -1135,6 +1146,7 @@ def _get_devices(fn: Callable, complement: bool = True) -> Tuple:
 
 @handle_nestable
 @handle_exceptions
+@_memoize_support_query
 def function_supported_devices(fn: Callable, recurse: bool = True) -> Tuple:
     """Returns the supported devices of the current backend's function.
 
@@ -1173,6 +1185,7 @@ def function_supported_devices(fn: Callable, recurse: bool = True) -> Tuple:
 
 @handle_nestable
 @handle_exceptions
+@_memoize_support_query
 def function_unsupported_devices(fn: Callable, recurse: bool = True) -> Tuple:
     """Returns the unsupported devices of the current backend's function.
 
@@ -1,36 +1,60 @@
 # flake8: noqa
-from .activations import *
-from .constants import *
-from .creation import *
-from .data_type import *
-from .device import *
-from .elementwise import *
-from .general import *
-from .gradients import *
-from .layers import *
-from .linear_algebra import *
-from .losses import *
-from .manipulation import *
-from .meta import *
-from .nest import *
-from .norms import *
-from .random import *
-from .searching import *
-from .set import *
-from .sorting import *
-from .statistical import *
-from .sparse_array import *
-from .utility import *
-import types
+from ivy.utils.lazy_import import enabled as _lazy_import, is_api as _is_api
 
-__all__ = [
-    name
-    for name, thing in globals().items()
-    if not (
-        name.startswith("_")
-        or name == "ivy"
-        or (callable(thing) and "ivy" not in thing.__module__)
-        or (isinstance(thing, types.ModuleType) and "ivy" not in thing.__name__)
+if not _lazy_import:
+    from .activations import *
+    from .constants import *
+    from .creation import *
+    from .data_type import *
+    from .device import *
+    from .elementwise import *
+    from .general import *
+    from .gradients import *
+    from .layers import *
+    from .linear_algebra import *
+    from .losses import *
+    from .manipulation import *
+    from .meta import *
+    from .nest import *
+    from .norms import *
+    from .random import *
+    from .searching import *
+    from .set import *
+    from .sorting import *
+    from .statistical import *
+    from .sparse_array import *
+    from .utility import *
+
+    __all__ = [name for name, thing in globals().items() if _is_api(name, thing)]
+else:
+    from ivy.utils.lazy_import import lazy_package as _lazy_package
+
+    __getattr__, __dir__ = _lazy_package(
+        __name__,
+        [
+            ("activations", (), True),
+            ("constants", (), True),
+            ("creation", (), True),
+            ("data_type", (), True),
+            ("device", (), True),
+            ("elementwise", (), True),
+            ("general", (), True),
+            ("gradients", (), True),
+            ("layers", (), True),
+            ("linear_algebra", (), True),
+            ("losses", (), True),
+            ("manipulation", (), True),
+            ("meta", (), True),
+            ("nest", (), True),
+            ("norms", (), True),
+            ("random", (), True),
+            ("searching", (), True),
+            ("set", (), True),
+            ("sorting", (), True),
+            ("statistical", (), True),
+            ("sparse_array", (), True),
+            ("utility", (), True),
+        ],
+        api_only=True,
+        disjoint=True,
     )
-]
-del types
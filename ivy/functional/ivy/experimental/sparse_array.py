@@ -1,6 +1,9 @@
+# global
+from numbers import Number
+
 # local
 import ivy
-from ivy.func_wrapper import inputs_to_native_arrays
+from ivy.func_wrapper import inputs_to_ivy_arrays, inputs_to_native_arrays
 from ivy.utils.exceptions import handle_exceptions
 
 
@@ -245,6 +248,20 @@ def _verify_bsc_components(
     )
 
 
+def _verify_sparse_matmul_shapes(x, y):
+    ivy.utils.assertions.check_equal(
+        len(x.dense_shape), 2, message="sparse matmul requires a 2D sparse array"
+    )
+    ivy.utils.assertions.check_true(
+        len(ivy.shape(y)) in [1, 2], message="y must be 1D or 2D"
+    )
+    ivy.utils.assertions.check_equal(
+        ivy.shape(y)[0],
+        x.dense_shape[1],
+        message="the first dimension of y does not match the columns of x",
+    )
+
+
 def _is_data_not_indices_values_and_shape(
     data=None,
     coo_indices=None,
@@ -265,7 +282,7 @@ def _is_data_not_indices_values_and_shape(
             row_indices,
             values,
             dense_shape,
-            format=format,
+            format,
             fn=ivy.exists,
             type="any",
             limit=[0],
@@ -371,7 +388,6 @@ class SparseArray:
                     crow_indices, col_indices, values, dense_shape, format
                 )
             else:
-                print(format)
                 self._init_compressed_column_components(
                     ccol_indices, row_indices, values, dense_shape, format
                 )
@@ -543,6 +559,10 @@ class SparseArray:
     def dense_shape(self):
         return self._dense_shape
 
+    @property
+    def format(self):
+        return self._format
+
     # Setters #
     # --------#
 
@@ -654,98 +674,179 @@ class SparseArray:
     # ---------------- #
 
     def _coo_to_dense_coordinates(self):
-        all_coordinates = []
-        for i in range(self._values.shape[0]):
-            coordinate = ivy.gather(self._coo_indices, ivy.array([[i]]))
-            coordinate = ivy.reshape(coordinate, (self._coo_indices.shape[0],))
-            all_coordinates.append(coordinate.to_list())
-        return all_coordinates
+        return ivy.permute_dims(self._coo_indices, (1, 0))
 
     def _csr_to_dense_coordinates(self):
-        all_coordinates = []
-        total_rows = self._dense_shape[0]
-        all_rows = self._col_indices.to_list()
-        all_cols = self._crow_indices.to_list()
-        for row in range(total_rows):
-            cols = all_rows[all_cols[row] : all_cols[row + 1]]
-            for col in cols:
-                all_coordinates.append([row, col])
-        return all_coordinates
+        rows = _expand_compressed_indices(self._crow_indices)
+        return ivy.stack([rows, self._col_indices], axis=-1)
 
     def _csc_to_dense_coordinates(self):
         # CSC sparse array
-        all_coordinates = []
-        total_rows = self._dense_shape[1]
-        all_cols = self._row_indices.to_list()
-        all_rows = self._ccol_indices.to_list()
-        for col in range(total_rows):
-            rows = all_cols[all_rows[col] : all_rows[col + 1]]
-            for row in rows:
-                all_coordinates.append([row, col])
-        return all_coordinates
+        cols = _expand_compressed_indices(self._ccol_indices)
+        return ivy.stack([self._row_indices, cols], axis=-1)
 
     def _bsr_to_dense_coordinates(self):
-        all_coordinates = []
-        total_rows = self._dense_shape[0]
-        all_rows = self._crow_indices.to_list()
-        all_cols = self._col_indices.to_list()
-
-        nblockrows, nblockcols = self._values.shape[-2:]
-
-        for row in range(total_rows // nblockrows):
-            cols = all_cols[all_rows[row] : all_rows[row + 1]]
-            for col in cols:
-                for col_index in range(nblockcols):
-                    for row_index in range(nblockrows):
-                        all_coordinates.append(
-                            [
-                                nblockrows * row + row_index,
-                                nblockcols * col + col_index,
-                            ]
-                        )
-        return all_coordinates
+        block_rows = _expand_compressed_indices(self._crow_indices)
+        return self._block_coordinates(block_rows, self._col_indices)
 
     def _bsc_to_dense_coordinates(self):
-        all_coordinates = []
-        total_cols = self._dense_shape[1]
-        all_rows = self._row_indices.to_list()
-        all_cols = self._ccol_indices.to_list()
+        block_cols = _expand_compressed_indices(self._ccol_indices)
+        return self._block_coordinates(self._row_indices, block_cols)
 
+    def _block_coordinates(self, block_rows, block_cols):
+        # the coordinates of each element of each block, in the row-major order of
+        # the flattened values
         nblockrows, nblockcols = self._values.shape[-2:]
+        rows = ivy.reshape(block_rows * nblockrows, (-1, 1, 1)) + ivy.reshape(
+            ivy.arange(nblockrows, dtype="int64"), (1, -1, 1)
+        )
+        cols = ivy.reshape(block_cols * nblockcols, (-1, 1, 1)) + ivy.reshape(
+            ivy.arange(nblockcols, dtype="int64"), (1, 1, -1)
+        )
+        rows, cols = ivy.broadcast_arrays(rows, cols)
+        return ivy.stack([ivy.flatten(rows), ivy.flatten(cols)], axis=-1)
 
-        for col in range(total_cols // nblockcols):
-            rows = all_rows[all_cols[col] : all_cols[col + 1]]
-            for row in rows:
-                for col_index in range(nblockcols):
-                    for row_index in range(nblockrows):
-                        all_coordinates.append(
-                            [
-                                nblockrows * row + row_index,
-                                nblockcols * col + col_index,
-                            ]
-                        )
-        return all_coordinates
-
-    def to_dense_array(self, *, native=False):
+    def _dense_coordinates(self):
         if self._format == "coo":
-            all_coordinates = self._coo_to_dense_coordinates()
+            return self._coo_to_dense_coordinates()
         elif self._format == "csr":
-            all_coordinates = self._csr_to_dense_coordinates()
+            return self._csr_to_dense_coordinates()
         elif self._format == "csc":
-            all_coordinates = self._csc_to_dense_coordinates()
+            return self._csc_to_dense_coordinates()
         elif self._format == "bsc":
-            all_coordinates = self._bsc_to_dense_coordinates()
+            return self._bsc_to_dense_coordinates()
         else:
-            all_coordinates = self._bsr_to_dense_coordinates()
+            return self._bsr_to_dense_coordinates()
+
+    def to_dense_array(self, *, native=False):
+        all_coordinates = self._dense_coordinates()
 
         # make dense array
         ret = ivy.scatter_nd(
-            ivy.array(all_coordinates),
+            all_coordinates,
             ivy.flatten(self._values),
             ivy.array(self._dense_shape),
         )
         return ret.to_native() if native else ret
 
+    def sum(self, *, axis=None):
+        return ivy.sparse_sum(self, axis=axis)
+
+    def __matmul__(self, other):
+        return ivy.sparse_matmul(self, other)
+
+    def __mul__(self, other):
+        if not _is_scalar(other):
+            return NotImplemented
+        return self._with_values(self._values * other)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        if not _is_scalar(other):
+            return NotImplemented
+        return self._with_values(self._values / other)
+
+    def __neg__(self):
+        return self._with_values(-self._values)
+
+    def _with_values(self, values):
+        # scalar multiples and negation keep the zeros, so only the values change
+        if self._format == "coo":
+            return SparseArray(
+                coo_indices=self._coo_indices,
+                values=values,
+                dense_shape=self._dense_shape,
+                format="coo",
+            )
+        elif self._format in ["csr", "bsr"]:
+            return SparseArray(
+                crow_indices=self._crow_indices,
+                col_indices=self._col_indices,
+                values=values,
+                dense_shape=self._dense_shape,
+                format=self._format,
+            )
+        return SparseArray(
+            ccol_indices=self._ccol_indices,
+            row_indices=self._row_indices,
+            values=values,
+            dense_shape=self._dense_shape,
+            format=self._format,
+        )
+
+    def to_coo_array(self):
+        if self._format == "coo":
+            return SparseArray(self)
+        return SparseArray(
+            coo_indices=ivy.permute_dims(self._dense_coordinates(), (1, 0)),
+            values=ivy.flatten(self._values),
+            dense_shape=self._dense_shape,
+            format="coo",
+        )
+
+    def to_csr_array(self):
+        if self._format == "csr":
+            return SparseArray(self)
+        rows, cols, values = self._sorted_2d_coordinates(major_axis=0)
+        return SparseArray(
+            crow_indices=_compress_indices(rows, self._dense_shape[0]),
+            col_indices=cols,
+            values=values,
+            dense_shape=self._dense_shape,
+            format="csr",
+        )
+
+    def to_csc_array(self):
+        if self._format == "csc":
+            return SparseArray(self)
+        rows, cols, values = self._sorted_2d_coordinates(major_axis=1)
+        return SparseArray(
+            ccol_indices=_compress_indices(cols, self._dense_shape[1]),
+            row_indices=rows,
+            values=values,
+            dense_shape=self._dense_shape,
+            format="csc",
+        )
+
+    def _sorted_2d_coordinates(self, major_axis):
+        ivy.utils.assertions.check_equal(
+            len(self._dense_shape),
+            2,
+            message="only 2D sparse arrays can be converted to compressed formats",
+        )
+        coordinates = self._dense_coordinates()
+        rows, cols = coordinates[:, 0], coordinates[:, 1]
+        if major_axis == 0:
+            keys = rows * self._dense_shape[1] + cols
+        else:
+            keys = cols * self._dense_shape[0] + rows
+        # a stable sort keeps duplicate coordinates in their original order
+        order = ivy.argsort(keys, stable=True)
+        return (
+            ivy.gather(rows, order),
+            ivy.gather(cols, order),
+            ivy.gather(ivy.flatten(self._values), order),
+        )
+
+
+def _is_scalar(x):
+    return isinstance(x, Number) or (ivy.is_array(x) and len(ivy.shape(x)) == 0)
+
+
+def _expand_compressed_indices(compressed_indices):
+    # the row (or column) of each element, given the offsets of the rows (or columns)
+    num_elements = compressed_indices[1:] - compressed_indices[:-1]
+    return ivy.repeat(
+        ivy.arange(ivy.shape(num_elements)[0], dtype="int64"), num_elements
+    )
+
+
+def _compress_indices(sorted_indices, size):
+    # the offsets of each row (or column) in the sorted row (or column) indices
+    return ivy.searchsorted(sorted_indices, ivy.arange(size + 1, dtype="int64"))
+
 
 class NativeSparseArray:
     pass
@@ -791,3 +892,83 @@ def native_sparse_array(
 @handle_exceptions
 def native_sparse_array_to_indices_values_and_shape(x):
     return ivy.current_backend().native_sparse_array_to_indices_values_and_shape(x)
+
+
+@handle_exceptions
+@inputs_to_ivy_arrays
+def sparse_matmul(x, y, /):
+    """Multiply a 2D sparse array by a dense matrix or vector, without densifying the
+    sparse array.
+
+    Parameters
+    ----------
+    x
+        2D sparse array of shape *[m, k]*.
+    y
+        dense matrix of shape *[k, n]*, or vector of shape *[k]*.
+
+    Returns
+    -------
+    ret
+        dense array of shape *[m, n]*, or *[m]* if ``y`` is a vector.
+
+    Examples
+    --------
+    >>> x = ivy.SparseArray(coo_indices=[[0, 1, 1], [1, 0, 2]],
+    ...                     values=[2., 1., 3.], dense_shape=[2, 3], format="coo")
+    >>> y = ivy.array([1., 2., 3.])
+    >>> ivy.sparse_matmul(x, y)
+    ivy.array([ 4., 10.])
+    """
+    _verify_sparse_matmul_shapes(x, y)
+    coordinates = x._dense_coordinates()
+    values = ivy.flatten(x.values)
+    gathered = ivy.gather(y, coordinates[:, 1], axis=0)
+    if len(ivy.shape(y)) == 2:
+        values = ivy.expand_dims(values, axis=-1)
+    return ivy.scatter_nd(
+        coordinates[:, 0:1],
+        values * gathered,
+        (x.dense_shape[0],) + tuple(ivy.shape(y)[1:]),
+    )
+
+
+sparse_matmul.mixed_function = True
+
+
+@handle_exceptions
+@inputs_to_ivy_arrays
+def sparse_sum(x, /, *, axis=None):
+    """Sum the elements of a sparse array, over all of them or along an axis, without
+    densifying it.
+
+    Parameters
+    ----------
+    x
+        sparse array.
+    axis
+        axis to sum along. Default is ``None``, which sums all the elements.
+
+    Returns
+    -------
+    ret
+        the dense sum, with the summed axis removed.
+
+    Examples
+    --------
+    >>> x = ivy.SparseArray(coo_indices=[[0, 1, 1], [1, 0, 2]],
+    ...                     values=[2., 1., 3.], dense_shape=[2, 3], format="coo")
+    >>> ivy.sparse_sum(x, axis=0)
+    ivy.array([1., 2., 3.])
+    """
+    values = ivy.flatten(x.values)
+    if axis is None:
+        return ivy.sum(values)
+    num_dims = len(x.dense_shape)
+    axis = axis % num_dims
+    kept = [i for i in range(num_dims) if i != axis]
+    coordinates = ivy.gather(x._dense_coordinates(), ivy.array(kept), axis=1)
+    return ivy.scatter_nd(coordinates, values, tuple(x.dense_shape[i] for i in kept))
+
+
+sparse_sum.mixed_function = True
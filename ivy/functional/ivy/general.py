@@ -24,8 +24,10 @@ import numpy as np
 # local
 import ivy
 from ivy.utils.backend import current_backend, backend_stack
+from ivy.utils.context_stack import ContextStack
 from ivy.functional.ivy.gradients import _is_variable
 from ivy.utils.exceptions import handle_exceptions
+from ivy.utils.support_matrix import _memoize_support_query
 from ivy.func_wrapper import (
     handle_array_function,
     inputs_to_ivy_arrays,
@@ -42,17 +44,17 @@ FN_CACHE = dict()
 INF = float("inf")
 TMP_DIR = "/tmp"
 
-queue_timeout_stack = list()
-array_mode_stack = list()
-shape_array_mode_stack = list()
-nestable_mode_stack = list()
-exception_trace_mode_stack = list()
+queue_timeout_stack = ContextStack("queue_timeout_stack")
+array_mode_stack = ContextStack("array_mode_stack")
+shape_array_mode_stack = ContextStack("shape_array_mode_stack")
+nestable_mode_stack = ContextStack("nestable_mode_stack")
+exception_trace_mode_stack = ContextStack("exception_trace_mode_stack")
 trace_mode_dict = dict()
 trace_mode_dict["frontend"] = "ivy/functional/frontends"
 trace_mode_dict["ivy"] = "ivy/"
 trace_mode_dict["full"] = ""
 trace_mode_dict["none"] = ""
-show_func_wrapper_trace_mode_stack = list()
+show_func_wrapper_trace_mode_stack = ContextStack("show_func_wrapper_trace_mode_stack")
 
 
 # Extra #
@@ -3608,6 +3610,7 @@ def _get_devices_and_dtypes(fn, complement=True):
 
 @handle_nestable
 @handle_exceptions
+@_memoize_support_query
 def function_supported_devices_and_dtypes(fn: Callable, recurse: bool = True) -> Dict:
     """
     Returns the supported combination of devices and dtypes
@@ -3647,6 +3650,7 @@ def function_supported_devices_and_dtypes(fn: Callable, recurse: bool = True) ->
 
 @handle_nestable
 @handle_exceptions
+@_memoize_support_query
 def function_unsupported_devices_and_dtypes(fn: Callable, recurse: bool = True) -> Dict:
     """
     Returns the unsupported combination of devices and dtypes
@@ -3724,6 +3728,9 @@ def vmap(
         to that of fun, but with extra array axes
         at positions indicated by out_axes.
 
+    With the NumPy backend, func is traced once with the whole batch, and called once
+    per sample if it uses an operation which can't be traced. Side effects of func
+    can then happen both during the tracing and during the calls per sample.
 
     This docstring is a summarised version of the `docstring
     <https://jax.readthedocs.io/en/latest/_autosummary/jax.vmap.html#jax-vmap>`_ for vmap from JAX documentation. # noqa
@@ -8,6 +8,7 @@ import itertools
 # local
 import ivy
 from ivy.utils.backend import current_backend
+from ivy.utils.context_stack import ContextStack
 
 from ivy.func_wrapper import (
     handle_array_function,
@@ -307,7 +308,7 @@ def _variable_data(
 # Extra #
 # ------#
 
-with_grads_stack = list()
+with_grads_stack = ContextStack("with_grads_stack")
 
 
 class GradientTracking:
@@ -378,7 +379,7 @@ def with_grads(*, with_grads: Optional[bool] = None) -> bool:
         return with_grads
     global with_grads_stack
     if not with_grads_stack:
-        with_grads_stack = [True]
+        with_grads_stack.append(True)
     return with_grads_stack[-1]
 
 
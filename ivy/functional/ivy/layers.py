@@ -347,6 +347,46 @@ def dropout(
 # Attention #
 
 
+def _chunked_scaled_dot_product_attention(q, k, v, scale, /, *, mask, chunk_size, out):
+    # the softmax is accumulated over chunks of keys, rescaling the running sums
+    # whenever the running maximum of the similarities grows
+    fill_value = -ivy.finfo(ivy.dtype(q)).max
+    num_keys = k.shape[-2]
+    for start in range(0, num_keys, chunk_size):
+        stop = min(start + chunk_size, num_keys)
+
+        # BS x Q x C
+        sim = ivy.einsum("... q f, ... k f -> ... q k", q, k[..., start:stop, :])
+        sim = sim * scale
+        if ivy.exists(mask):
+            chunk_mask = mask[..., start:stop] if mask.shape[-1] > 1 else mask
+            sim = ivy.where(ivy.logical_not(chunk_mask), fill_value, sim)
+
+        # BS x Q x 1
+        chunk_max = ivy.max(sim, axis=-1, keepdims=True)
+        if start == 0:
+            running_max = chunk_max
+            weights = ivy.exp(sim - running_max)
+            denominator = ivy.sum(weights, axis=-1, keepdims=True)
+            numerator = ivy.einsum(
+                "... q k, ... k f -> ... q f", weights, v[..., start:stop, :]
+            )
+            continue
+        new_max = ivy.maximum(running_max, chunk_max)
+        correction = ivy.exp(running_max - new_max)
+        weights = ivy.exp(sim - new_max)
+        denominator = denominator * correction + ivy.sum(
+            weights, axis=-1, keepdims=True
+        )
+
+        # BS x Q x F
+        numerator = numerator * correction + ivy.einsum(
+            "... q k, ... k f -> ... q f", weights, v[..., start:stop, :]
+        )
+        running_max = new_max
+    return ivy.divide(numerator, denominator, out=out)
+
+
 @handle_array_function
 @handle_array_like_without_promotion
 @handle_exceptions
@@ -359,6 +399,7 @@ def scaled_dot_product_attention(
     /,
     *,
     mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+    chunk_size: Optional[int] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """Applies scaled dot product attention to inputs x using optional mask.
@@ -383,6 +424,12 @@ def scaled_dot_product_attention(
     mask
         The mask input array. The mask to apply to the query-key values. Default is
         None. The shape of mask input should be in *[batch_shape,num_queries,num_keys]*.
+    chunk_size
+        The number of keys to attend to at once. If given, the keys are processed in
+        chunks with an online softmax, so the similarities held at any time are
+        *[batch_shape,num_queries,chunk_size]* rather than
+        *[batch_shape,num_queries,num_keys]*. Default is ``None``, in which case all
+        the keys are attended to at once.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -534,17 +581,18 @@ def scaled_dot_product_attention(
                     [4.3, 5.3]]])
     }
     """
+    if ivy.exists(chunk_size) and chunk_size < k.shape[-2]:
+        return _chunked_scaled_dot_product_attention(
+            q, k, v, scale, mask=mask, chunk_size=chunk_size, out=out
+        )
+
     # BS x Q x K
     sim = ivy.einsum("... q f, ... k f -> ... q k", q, k) * scale
 
     if ivy.exists(mask):
 
         # BS x Q x K
-        sim = ivy.where(
-            ivy.logical_not(mask),
-            -ivy.ones_like(sim) * ivy.finfo(ivy.dtype(sim)).max,
-            sim,
-        )
+        sim = ivy.where(ivy.logical_not(mask), -ivy.finfo(ivy.dtype(sim)).max, sim)
 
     # BS x Q x K
     attn = ivy.softmax(sim, axis=-1)
@@ -571,6 +619,7 @@ def multi_head_attention(
     to_q_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     to_kv_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     to_out_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+    chunk_size: Optional[int] = None,
     out: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """Applies multi-head attention to inputs x.
@@ -603,6 +652,9 @@ def multi_head_attention(
         The variables for function to_kv_fn. Default is ``None``.
     to_out_v
         The variables for function to_out_fn. Default is ``None``.
+    chunk_size
+        The number of keys to attend to at once, see
+        :func:`ivy.scaled_dot_product_attention`. Default is ``None``.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -762,20 +814,22 @@ def multi_head_attention(
         k, v = ivy.split(kv, num_or_size_splits=2, axis=-1)
 
     # BS x H x Q x F,  BS x H x K x F,  BS x H x K x F
-    def call_einops(t):
-        return ivy.einops_rearrange(t, "... n (h f) -> ... h n f", h=num_heads)
+    def split_heads(t):
+        return ivy.stack(ivy.split(t, num_or_size_splits=num_heads, axis=-1), axis=-3)
 
-    q, k, v = map(call_einops, (q, k, v))
+    q, k, v = map(split_heads, (q, k, v))
 
-    # BS x H x Q x K
+    # BS x 1 x Q x K, broadcast over the heads
     if ivy.exists(mask):
-        mask = ivy.einops_repeat(mask, "... q k -> ... h q k", h=num_heads)
+        mask = ivy.expand_dims(mask, axis=-3)
 
     # BS x H x Q x F
-    sdpa = ivy.scaled_dot_product_attention(q, k, v, scale, mask=mask)
+    sdpa = ivy.scaled_dot_product_attention(
+        q, k, v, scale, mask=mask, chunk_size=chunk_size
+    )
 
     # BS x Q x (HxF)
-    sdpa = ivy.einops_rearrange(sdpa, "... h q f -> ... q (h f)")
+    sdpa = ivy.concat(ivy.unstack(sdpa, axis=-3), axis=-1)
 
     # BS x Q x OF
     ret = to_out_fn(sdpa, v=to_out_v) if ivy.exists(to_out_fn) else sdpa
@@ -1915,15 +1969,15 @@ def lstm_update(
     batch_shape = x_shape[:-2]
     timesteps = x_shape[-2]
     input_channels = x_shape[-1]
+    output_channels = init_h.shape[-1]
     x_flat = ivy.reshape(x, (-1, input_channels))
 
-    # input kernel
-    Wi = kernel
-    Wi_x = ivy.reshape(
-        ivy.matmul(x_flat, Wi) + (bias if bias is not None else 0),
-        batch_shape + [timesteps, -1],
-    )
-    Wii_x, Wif_x, Wig_x, Wio_x = ivy.split(Wi_x, num_or_size_splits=4, axis=-1)
+    # input kernel, with both biases added for all the timesteps at once
+    Wi_x = ivy.matmul(x_flat, kernel)
+    for b in (bias, recurrent_bias):
+        if b is not None:
+            Wi_x = Wi_x + b
+    Wi_x = ivy.reshape(Wi_x, batch_shape + [timesteps, -1])
 
     # recurrent kernel
     Wh = recurrent_kernel
@@ -1935,33 +1989,25 @@ def lstm_update(
     # lstm outputs
     hts_list = list()
 
-    # unrolled time dimension with lstm steps
-    for Wii_xt, Wif_xt, Wig_xt, Wio_xt in zip(
-        ivy.unstack(Wii_x, axis=-2),
-        ivy.unstack(Wif_x, axis=-2),
-        ivy.unstack(Wig_x, axis=-2),
-        ivy.unstack(Wio_x, axis=-2),
-    ):
-        htm1 = ht
-        ctm1 = ct
-
-        Wh_htm1 = ivy.matmul(htm1, Wh) + (
-            recurrent_bias if recurrent_bias is not None else 0
-        )
-        Whi_htm1, Whf_htm1, Whg_htm1, Who_htm1 = ivy.split(
-            Wh_htm1, num_or_size_splits=4, axis=-1
-        )
-
-        it = ivy.sigmoid(Wii_xt + Whi_htm1)
-        ft = ivy.sigmoid(Wif_xt + Whf_htm1)
-        gt = ivy.tanh(Wig_xt + Whg_htm1)
-        ot = ivy.sigmoid(Wio_xt + Who_htm1)
-        ct = ft * ctm1 + it * gt
+    # unrolled time dimension with lstm steps, activating the packed 4 x out gates
+    # of each step with a single sigmoid, and the cell gate with a tanh
+    for Wi_xt in ivy.unstack(Wi_x, axis=-2):
+        z = Wi_xt + ivy.matmul(ht, Wh)
+        gates = ivy.sigmoid(z)
+
+        it = gates[..., :output_channels]
+        ft = gates[..., output_channels : 2 * output_channels]
+        gt = ivy.tanh(z[..., 2 * output_channels : 3 * output_channels])
+        ot = gates[..., 3 * output_channels :]
+        ct = ft * ct + it * gt
         ht = ot * ivy.tanh(ct)
 
-        hts_list.append(ivy.expand_dims(ht, axis=-2))
+        hts_list.append(ht)
+
+    return ivy.stack(hts_list, axis=-2), ct
+
 
-    return ivy.concat(hts_list, axis=-2), ct
+lstm_update.mixed_function = True
 
 
 # Helpers #
@@ -13,9 +13,7 @@ from ivy.func_wrapper import (
     inputs_to_ivy_arrays,
 )
 from ivy.utils.exceptions import handle_exceptions
-
-
-inf = float("inf")
+from ivy.functional.ivy.constants import inf
 
 
 # Array API Standard #
@@ -4,7 +4,9 @@
 from builtins import map as _map
 from typing import Callable, Any, Union, List, Tuple, Optional, Dict, Iterable, Sequence
 import copy
+import functools
 from collections import UserDict
+from itertools import islice
 
 # local
 import ivy
@@ -989,6 +991,243 @@ def map(
     return rets
 
 
+class TreeDef:
+    """The structure of a nest, as returned by :func:`ivy.tree_flatten` alongside the
+    leaves of the nest, and consumed by :func:`ivy.tree_unflatten` to build a nest of
+    the same structure from new leaves.
+
+    Tree definitions are hashable and equal for nests of the same structure, and
+    ``ivy.tree_flatten`` returns the same instance each time it flattens nests of a
+    structure it has seen recently, so that the function rebuilding the nest and the
+    key chains of its leaves are only worked out once per structure.
+    """
+
+    __slots__ = ("_node", "_hash", "_num_leaves", "_unflatten_fn", "_key_chains")
+
+    def __init__(self, node):
+        self._node = node
+        self._hash = hash(node)
+        self._num_leaves = _num_leaves(node)
+        self._unflatten_fn = _unflatten_fn(node)
+        self._key_chains = None
+
+    @property
+    def num_leaves(self):
+        return self._num_leaves
+
+    @property
+    def key_chains(self):
+        """The key chains of the leaves, in order, with the keys of dicts and the
+        indices of sequences joined by "/"."""
+        if self._key_chains is None:
+            key_chains = list()
+            _collect_key_chains(self._node, "", key_chains)
+            self._key_chains = tuple(key_chains)
+        return self._key_chains
+
+    def __eq__(self, other):
+        return self is other or (
+            isinstance(other, TreeDef) and self._node == other._node
+        )
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return "TreeDef({})".format(_node_repr(self._node))
+
+
+def _tree_node(x, leaves, derived_nest_types, to_ignore):
+    # returns None for a leaf, which is appended to leaves, and otherwise a tuple of
+    # the node type, the keys of a dict, and the nodes of the children
+    x_type = type(x)
+    if (x_type in _nest_types or isinstance(x, derived_nest_types)) and not isinstance(
+        x, to_ignore
+    ):
+        if isinstance(x, (dict, UserDict)):
+            return (
+                x_type,
+                tuple(x.keys()),
+                tuple(
+                    [
+                        _tree_node(v, leaves, derived_nest_types, to_ignore)
+                        for v in x.values()
+                    ]
+                ),
+            )
+        if x_type is slice:
+            x = (x.start, x.stop, x.step)
+        return (
+            x_type,
+            None,
+            tuple([_tree_node(i, leaves, derived_nest_types, to_ignore) for i in x]),
+        )
+    leaves.append(x)
+    return None
+
+
+_nest_types = {tuple, list, dict, slice}
+
+
+def _num_leaves(node):
+    if node is None:
+        return 1
+    return sum(_num_leaves(child) for child in node[2])
+
+
+def _collect_key_chains(node, key_chain, key_chains):
+    if node is None:
+        key_chains.append(key_chain)
+        return
+    keys = range(len(node[2])) if node[1] is None else node[1]
+    for key, child in zip(keys, node[2]):
+        _collect_key_chains(
+            child,
+            str(key) if key_chain == "" else key_chain + "/" + str(key),
+            key_chains,
+        )
+
+
+def _node_repr(node):
+    if node is None:
+        return "*"
+    node_type, keys, children = node
+    children = [_node_repr(child) for child in children]
+    if keys is not None:
+        ret = (
+            "{"
+            + ", ".join("{}: {}".format(repr(k), c) for k, c in zip(keys, children))
+            + "}"
+        )
+        return ret if node_type is dict else node_type.__name__ + "(" + ret + ")"
+    if node_type is list:
+        return "[" + ", ".join(children) + "]"
+    ret = "(" + ", ".join(children) + ("," if len(children) == 1 else "") + ")"
+    return ret if node_type is tuple else node_type.__name__ + ret
+
+
+def _unflatten_fn(node):
+    # builds the function which consumes the leaves of a nest from an iterator, and
+    # returns the nest
+    if node is None:
+        return next
+    node_type, keys, children = node
+    if all(child is None for child in children):
+        num_children = len(children)
+
+        def children_fn(leaves):
+            return list(islice(leaves, num_children))
+
+    else:
+        child_fns = [_unflatten_fn(child) for child in children]
+
+        def children_fn(leaves):
+            return [fn(leaves) for fn in child_fns]
+
+    if keys is not None:
+        if node_type is dict:
+            return lambda leaves: dict(zip(keys, children_fn(leaves)))
+        return lambda leaves: node_type(dict(zip(keys, children_fn(leaves))))
+    if node_type is list:
+        return children_fn
+    if node_type is tuple:
+        return lambda leaves: tuple(children_fn(leaves))
+    if node_type is slice:
+        return lambda leaves: slice(*children_fn(leaves))
+    if hasattr(node_type, "_fields"):
+        fields = node_type._fields
+        return lambda leaves: node_type(**dict(zip(fields, children_fn(leaves))))
+    return lambda leaves: node_type(children_fn(leaves))
+
+
+# one tree definition per structure, so that equal structures share their functions
+_treedef = functools.lru_cache(maxsize=4096)(TreeDef)
+
+
+@handle_exceptions
+def tree_flatten(
+    x: Any,
+    /,
+    include_derived: Optional[Union[Dict[type, bool], bool]] = None,
+    to_ignore: Optional[Union[type, Tuple[type]]] = None,
+) -> Tuple[List, TreeDef]:
+    """Flatten a nest into the list of its leaves and a hashable description of its
+    structure. The nest is traversed as in :func:`ivy.nested_map`, with tuples, lists,
+    dicts and slices as the nodes, and anything else as a leaf.
+
+    Parameters
+    ----------
+    x
+        The nest to flatten.
+    include_derived
+        Whether to also traverse classes derived from tuple, list and dict.
+        Default is ``False``.
+    to_ignore
+        Types to treat as leaves, even if they would otherwise be traversed.
+
+    Returns
+    -------
+    ret
+        The leaves of the nest in depth first order, and its tree definition, which
+        is the same instance for nests of the same structure.
+
+    Examples
+    --------
+    >>> leaves, treedef = ivy.tree_flatten({"a": [1, 2], "b": (3,)})
+    >>> print(leaves)
+    [1, 2, 3]
+    >>> print(treedef)
+    TreeDef({'a': [*, *], 'b': (*,)})
+    >>> print(ivy.tree_unflatten(treedef, [x * 10 for x in leaves]))
+    {'a': [10, 20], 'b': (30,)}
+    """
+    if include_derived is True:
+        include_derived = {tuple: True, list: True, dict: True}
+    elif not include_derived:
+        include_derived = {}
+    derived_nest_types = tuple(
+        t for t in (tuple, list, dict) if include_derived.get(t, False)
+    ) + (UserDict,)
+    leaves = list()
+    node = _tree_node(
+        x, leaves, derived_nest_types, () if to_ignore is None else to_ignore
+    )
+    return leaves, _treedef(node)
+
+
+@handle_exceptions
+def tree_unflatten(treedef: TreeDef, leaves: Sequence, /) -> Any:
+    """Build a nest with the structure described by a tree definition, from a sequence
+    of leaves in the order :func:`ivy.tree_flatten` returns them.
+
+    Parameters
+    ----------
+    treedef
+        The tree definition of the nest, as returned by ``ivy.tree_flatten``.
+    leaves
+        The leaves to place in the nest.
+
+    Returns
+    -------
+    ret
+        The nest with the given leaves.
+
+    Examples
+    --------
+    >>> leaves, treedef = ivy.tree_flatten(([1, 2], {"c": 3}))
+    >>> print(ivy.tree_unflatten(treedef, ["x", "y", "z"]))
+    (['x', 'y'], {'c': 'z'})
+    """
+    if len(leaves) != treedef.num_leaves:
+        raise ivy.utils.exceptions.IvyException(
+            "expected {} leaves for {}, but got {}".format(
+                treedef.num_leaves, treedef, len(leaves)
+            )
+        )
+    # noinspection PyProtectedMember
+    return treedef._unflatten_fn(iter(leaves))
+
+
 @handle_exceptions
 def nested_map(
     x: Union[ivy.Array, ivy.NativeArray, Iterable],
@@ -1047,6 +1286,17 @@ def nested_map(
         x following the applicable of fn to it's nested leaves, or x itself if x is not
         nested.
     """
+    if (
+        not shallow
+        and not to_mutable
+        and max_depth is None
+        and extra_nest_types is None
+        and _tuple_check_fn is None
+        and not isinstance(x, ivy.Container)
+    ):
+        # a new nest of the same structure, which is rebuilt from its flat leaves
+        leaves, treedef = tree_flatten(x, include_derived, to_ignore)
+        return tree_unflatten(treedef, [fn(leaf) for leaf in leaves])
     to_ignore = ivy.default(to_ignore, ())
     extra_nest_types = ivy.default(extra_nest_types, ())
     if include_derived is True:
@@ -1156,6 +1406,9 @@ def nested_map(
         if shallow:
             x.update(ret)
             return x
+        if isinstance(x, ivy.Container):
+            # noinspection PyProtectedMember
+            return class_instance(ret)._cont_inherit_packed(x)
         return class_instance(ret)
     elif isinstance(x, slice):
         # TODO: add tests for this
@@ -1,5 +1,6 @@
 # global
 import abc
+from numbers import Number
 from typing import List
 
 # local
@@ -7,108 +8,296 @@ import ivy
 
 
 class NestedArray(abc.ABC):
-    """Base class for nested array objects."""
+    """Base class for nested array objects.
 
-    def __init__(self, data, dtype, device, internal=False):
+    The rows are packed into one values buffer, of shape *[total_length, *inner]*,
+    and the offsets of each row in it, ``row_splits``, as in tensorflow's ragged
+    tensors. The rows can differ in the length of their first dimension only.
+    """
+
+    def __init__(self, values, row_splits, internal=False):
         if not internal:
             raise RuntimeError(
                 "NestedArray is an abstract class "
                 "and should not be instantiated directly."
                 "Please use one of the factory methods instead"
             )
-        self._data = data
+        self._values = values
+        self._row_splits = row_splits
+        self._row_lengths = row_splits[1:] - row_splits[:-1]
         self._shape = self._generate_shape()
-        self._dtype = dtype
-        self._device = device
+        self._dtype = values.dtype
+        self._device = ivy.dev(values)
         self._pre_repr = "ivy."
 
     @classmethod
     def nested_array(cls, data, dtype=None, device=None):
-        dtype = ivy.default_dtype(dtype=dtype, item=data)
-        device = ivy.default_device(device, item=data)
-        if ivy.is_ivy_array(data):
-            data = [data]
-        elif isinstance(data, (list, tuple)):
-            data = ivy.to_ivy(data)
-        elif ivy.is_native_array(data):
-            data = [ivy.to_ivy(data)]
-        elif isinstance(data, cls):
-            data = data._data
+        if isinstance(data, cls):
+            values, row_splits = data._values, data._row_splits
         else:
-            raise TypeError(
-                "Input data must be ivy.Array, ivy.NativeArray"
-                " or a list of either, got: {}".format(type(data))
+            if ivy.is_ivy_array(data) or ivy.is_native_array(data):
+                data = [data]
+            elif not isinstance(data, (list, tuple)):
+                raise TypeError(
+                    "Input data must be ivy.Array, ivy.NativeArray"
+                    " or a list of either, got: {}".format(type(data))
+                )
+            data = [ivy.to_ivy(x) for x in data]
+            ivy.utils.assertions.check_greater(
+                len(data), 0, message="a nested array needs at least one array"
+            )
+            if (
+                any(len(x._shape) == 0 for x in data)
+                or len(set(tuple(x._shape[1:]) for x in data)) > 1
+            ):
+                raise RuntimeError(
+                    "All arrays in a nested array must have the same number of "
+                    "dimensions, and can only differ in their first dimension."
+                )
+            values = ivy.concat(data, axis=0)
+            row_splits = ivy.cumsum(
+                ivy.array([0] + [x._shape[0] for x in data], dtype="int64")
             )
-        for i in range(len(data)):
-            data[i] = ivy.astype(data[i], dtype)
-            data[i] = ivy.to_device(data[i], device)
-        return cls(data, dtype, device, internal=True)
+        # the whole buffer is converted at once, rather than each row
+        dtype = ivy.default_dtype(dtype=dtype, item=values)
+        device = ivy.default_device(device, item=values)
+        values = ivy.to_device(ivy.astype(values, dtype), device)
+        return cls(values, row_splits, internal=True)
 
     @classmethod
     def from_row_lengths(cls, values, row_lengths):
-        ivy_arrays = list()
-        for i in range(len(row_lengths)):
-            ivy_arrays.append(values[: row_lengths[i]])
-            values = values[row_lengths[i] :]
-        return cls.nested_array(ivy_arrays)
+        row_lengths = ivy.astype(ivy.array(row_lengths), "int64")
+        row_splits = ivy.concat(
+            [ivy.zeros((1,), dtype="int64"), ivy.cumsum(row_lengths)], axis=0
+        )
+        return cls.from_row_split(values, row_splits)
 
     @classmethod
     def from_row_split(cls, values, row_split):
-        row_lengths = list()
-        for i in range(1, len(row_split)):
-            row_lengths.append(row_split[i] - row_split[i - 1])
-        return cls.from_row_lengths(values, row_lengths)
-
-    def _generate_shape(
-        self,
-    ):
-        final_shape = [len(self._data)]
-        shapes = list()
-        ndims = list()
-        for arr in self._data:
-            shapes.append(arr.shape)
-            ndims.append(arr.ndim)
-        if ndims.count(ndims[0]) != len(ndims):
-            raise RuntimeError(
-                "All arrays in a nested array must have the same number of dimensions."
+        values = ivy.to_ivy(values) if ivy.is_native_array(values) else values
+        row_split = ivy.astype(ivy.array(row_split), "int64")
+        ivy.utils.assertions.check_equal(
+            int(row_split[-1]),
+            values.shape[0],
+            message="the row splits must end at the length of the values",
+        )
+        return cls(values, row_split, internal=True)
+
+    @classmethod
+    def from_padded(cls, padded, row_lengths):
+        """Pack the first ``row_lengths[i]`` elements of each row of a padded
+        array."""
+        padded = ivy.to_ivy(padded) if ivy.is_native_array(padded) else padded
+        row_lengths = ivy.astype(ivy.array(row_lengths), "int64")
+        row_ids = ivy.repeat(
+            ivy.arange(row_lengths.shape[0], dtype="int64"), row_lengths
+        )
+        row_splits = ivy.concat(
+            [ivy.zeros((1,), dtype="int64"), ivy.cumsum(row_lengths)], axis=0
+        )
+        positions = ivy.arange(row_ids.shape[0], dtype="int64") - ivy.gather(
+            row_splits, row_ids
+        )
+        values = ivy.gather_nd(padded, ivy.stack([row_ids, positions], axis=-1))
+        return cls(values, row_splits, internal=True)
+
+    @classmethod
+    def from_native(cls, x):
+        """Create a nested array from a tensorflow ragged tensor or a torch nested
+        tensor."""
+        if type(x).__name__ == "RaggedTensor":
+            ivy.utils.assertions.check_equal(
+                x.ragged_rank,
+                1,
+                message="only ragged tensors with one ragged dimension are supported",
             )
-        for i in range(ndims[0]):
-            same_shape = True
-            current_shape = shapes[0][i]
-            for j in range(final_shape[0]):
-                if shapes[j][i] != current_shape:
-                    same_shape = False
-                    break
-            if same_shape:
-                final_shape.append(current_shape)
-            else:
-                final_shape.append(None)
-        return final_shape
+            return cls.from_row_split(ivy.array(x.values), ivy.array(x.row_splits))
+        if getattr(x, "is_nested", False):
+            if hasattr(x, "offsets") and x.offsets() is not None:
+                return cls.from_row_split(ivy.array(x.values()), ivy.array(x.offsets()))
+            return cls.nested_array(list(x.unbind()))
+        raise TypeError(
+            "Input must be a tensorflow RaggedTensor or a torch nested tensor, "
+            "got: {}".format(type(x))
+        )
+
+    def _generate_shape(self):
+        num_rows = self._row_splits._shape[0] - 1
+        row_length = None
+        if num_rows and bool(ivy.all(self._row_lengths == self._row_lengths[0])):
+            row_length = int(self._row_lengths[0])
+        return [num_rows, row_length] + list(self._values._shape[1:])
 
     def unbind(self):
-        return tuple(self._data)
+        row_splits = ivy.to_list(self._row_splits)
+        return tuple(
+            self._values[start:stop]
+            for start, stop in zip(row_splits[:-1], row_splits[1:])
+        )
 
     def reshape(self, shape):
         assert shape[0] == self._shape[0], "batch dimension is not changeable"
-        for i in range(0, shape[0]):
-            new_shape = list()
-            for j in range(1, len(shape)):
-                if shape[j] == -1:
-                    new_shape.append(self._data[i].shape[j - 1])
-                else:
-                    new_shape.append(shape[j])
-            self._data[i] = self._data[i].reshape(new_shape)
-            print(self._data[i].shape)
-        self._shape = self._generate_shape()
-        return self
+        # the inner dimensions are reshaped for all the rows at once, and the
+        # lengths of the rows scale with the change in the inner size
+        inner_size = ivy.prod(ivy.array(self._values._shape[1:], dtype="int64"))
+        new_inner = [
+            self._values._shape[i] if s == -1 else s for i, s in enumerate(shape[1:])
+        ][1:]
+        new_inner_size = ivy.prod(ivy.array(new_inner, dtype="int64"))
+        scaled_splits = self._row_splits * inner_size
+        ivy.utils.assertions.check_true(
+            bool(ivy.all(scaled_splits % new_inner_size == 0)),
+            message="the rows can't be reshaped to {}".format(shape),
+        )
+        row_splits = ivy.astype(scaled_splits // new_inner_size, "int64")
+        values = ivy.reshape(self._values, [-1] + list(new_inner))
+        return self.__class__(values, row_splits, internal=True)
+
+    def to_padded(self, padding_value=0):
+        """Pad the rows to the length of the longest row.
+
+        Returns
+        -------
+        ret
+            tuple of the padded array, of shape *[num_rows, max_length, *inner]*,
+            and a boolean mask of shape *[num_rows, max_length]* which is ``True``
+            where the elements are from the rows.
+        """
+        num_rows = self._shape[0]
+        max_length = int(ivy.max(self._row_lengths)) if num_rows else 0
+        positions = ivy.arange(max_length, dtype="int64")
+        mask = ivy.expand_dims(positions, axis=0) < ivy.expand_dims(
+            self._row_lengths, axis=-1
+        )
+        # the padding is gathered from an extra element after the values
+        if ivy.is_float_dtype(self._dtype):
+            padding_value = float(padding_value)
+        padding = ivy.full(
+            [1] + list(self._values._shape[1:]), padding_value, dtype=self._dtype
+        )
+        values = ivy.concat([self._values, padding], axis=0)
+        indices = ivy.where(
+            mask,
+            ivy.expand_dims(self._row_splits[:-1], axis=-1) + positions,
+            self._values._shape[0],
+        )
+        return ivy.gather(values, indices, axis=0), mask
+
+    def to_native(self):
+        """Convert to a tensorflow ragged tensor or a torch nested tensor, for the
+        tensorflow and torch backends respectively."""
+        backend = ivy.current_backend_str()
+        values = ivy.to_native(self._values)
+        row_splits = ivy.to_native(self._row_splits)
+        if backend == "tensorflow":
+            import tensorflow as tf
+
+            return tf.RaggedTensor.from_row_splits(values, row_splits)
+        if backend == "torch":
+            import torch
+
+            if hasattr(torch.nested, "nested_tensor_from_jagged"):
+                return torch.nested.nested_tensor_from_jagged(values, row_splits)
+            return torch.nested.nested_tensor([ivy.to_native(x) for x in self.unbind()])
+        raise ivy.utils.exceptions.IvyException(
+            "{} has no native nested arrays".format(backend)
+        )
+
+    # Segment Reductions #
+    # ------------------ #
+
+    def _row_ids(self):
+        # the row of each element of the values
+        return ivy.repeat(ivy.arange(self._shape[0], dtype="int64"), self._row_lengths)
+
+    def sum(self):
+        """Sum each row, returning an array of shape *[num_rows, *inner]*."""
+        num_rows = self._shape[0]
+        inner = list(self._values._shape[1:])
+        inner_size = int(ivy.prod(ivy.array(inner, dtype="int64")))
+        # each position of the inner dimensions of a row is its own segment
+        segment_ids = ivy.expand_dims(
+            self._row_ids() * inner_size, axis=-1
+        ) + ivy.arange(inner_size, dtype="int64")
+        ret = ivy.bincount(
+            ivy.reshape(segment_ids, [-1]),
+            weights=ivy.reshape(self._values, [-1]),
+            minlength=num_rows * inner_size,
+        )
+        return ivy.reshape(ret, [num_rows] + inner)
+
+    def mean(self):
+        """Average each row, returning an array of shape *[num_rows, *inner]*.
+        Empty rows are nan."""
+        lengths = ivy.reshape(
+            self._row_lengths, [-1] + [1] * (len(self._values._shape) - 1)
+        )
+        return ivy.divide(self.sum(), lengths)
+
+    def max(self):
+        """Maximum of each row, returning an array of shape *[num_rows, *inner]*.
+        Empty rows are the lowest value of the dtype."""
+        return self._segment_extreme(ivy.maximum, self._extreme_value(lowest=True))
+
+    def min(self):
+        """Minimum of each row, returning an array of shape *[num_rows, *inner]*.
+        Empty rows are the highest value of the dtype."""
+        return self._segment_extreme(ivy.minimum, self._extreme_value(lowest=False))
+
+    def _segment_extreme(self, fn, empty_value):
+        inner = list(self._values._shape[1:])
+        ret = ivy.full([self._shape[0]] + inner, empty_value, dtype=self._dtype)
+        if not self._values._shape[0]:
+            return ret
+        row_ids = self._row_ids()
+        positions = ivy.arange(self._values._shape[0], dtype="int64") - ivy.gather(
+            self._row_splits, row_ids
+        )
+        positions = ivy.reshape(positions, [-1] + [1] * len(inner))
+        # a scan over the values, doubling the reach of each element at every step,
+        # after which the last element of each row holds the extreme of the row, and
+        # without use_where the nans propagate as they do in ivy.max and ivy.min
+        scanned = self._values
+        max_length = int(ivy.max(self._row_lengths))
+        step = 1
+        while step < max_length:
+            shifted = ivy.concat([scanned[:step], scanned[:-step]], axis=0)
+            extreme = fn(scanned, shifted, use_where=False)
+            scanned = ivy.where(positions >= step, extreme, scanned)
+            step *= 2
+        last = ivy.gather(scanned, ivy.maximum(self._row_splits[1:] - 1, 0), axis=0)
+        non_empty = ivy.reshape(self._row_lengths > 0, [-1] + [1] * len(inner))
+        return ivy.where(non_empty, last, ret)
+
+    def _extreme_value(self, lowest):
+        if ivy.is_float_dtype(self._dtype):
+            return -float("inf") if lowest else float("inf")
+        info = ivy.iinfo(self._dtype)
+        return info.min if lowest else info.max
 
     # Properties #
     # ---------- #
 
     @property
     def data(self) -> ivy.NativeArray:
-        """The native array being wrapped in self."""
-        return self._data
+        """The native values buffer being wrapped in self."""
+        return ivy.to_native(self._values)
+
+    @property
+    def values(self) -> ivy.Array:
+        """The elements of all the rows, concatenated along the first dimension."""
+        return self._values
+
+    @property
+    def row_splits(self) -> ivy.Array:
+        """Offsets of the rows in the values, starting at 0 and ending at the length
+        of the values."""
+        return self._row_splits
+
+    @property
+    def row_lengths(self) -> ivy.Array:
+        """Length of each row."""
+        return self._row_lengths
 
     @property
     def dtype(self) -> ivy.Dtype:
@@ -130,15 +319,100 @@ class NestedArray(abc.ABC):
         """Number of array dimensions (axes)."""
         return len(tuple(self._shape))
 
+    # Elementwise #
+    # ----------- #
+
+    def _elementwise(self, fn, other, reverse=False):
+        # other is a scalar, an array which broadcasts to the inner dimensions, or a
+        # nested array with the same rows
+        if isinstance(other, NestedArray):
+            ivy.utils.assertions.check_true(
+                ivy.array_equal(self._row_splits, other._row_splits),
+                message="the nested arrays must have the same row lengths",
+            )
+            other = other._values
+        elif not isinstance(other, Number) and len(ivy.shape(other)) >= len(
+            self._values._shape
+        ):
+            raise ivy.utils.exceptions.IvyException(
+                "only the inner dimensions of a nested array can be broadcast to"
+            )
+        values = fn(other, self._values) if reverse else fn(self._values, other)
+        return self.__class__(values, self._row_splits, internal=True)
+
+    def map_values(self, fn):
+        """Apply an elementwise function to the values of all the rows at once."""
+        return self.__class__(fn(self._values), self._row_splits, internal=True)
+
     # Built-ins #
     # ----------#
 
     def __repr__(self):
+        if not self._shape[0]:
+            return self._pre_repr + self.__class__.__name__ + "([])"
         arrays_repr = "\t"
+        rows = self.unbind()
         for i in range(self._shape[0] - 1):
-            arrays_repr += repr(self._data[i]) + "\n\t"
-        arrays_repr += repr(self._data[-1])
+            arrays_repr += repr(rows[i]) + "\n\t"
+        arrays_repr += repr(rows[-1])
         return self._pre_repr + self.__class__.__name__ + "([\n" + arrays_repr + "\n])"
 
     def __getitem__(self, query):
-        return self._data[query]
+        if isinstance(query, slice):
+            rows = range(self._shape[0])[query]
+            if not len(rows):
+                row_splits = ivy.zeros((1,), dtype="int64")
+                return self.__class__(self._values[:0], row_splits, internal=True)
+            if rows.step == 1:
+                # contiguous rows share a slice of the values buffer
+                row_splits = self._row_splits[rows.start : rows.stop + 1]
+                values = self._values[int(row_splits[0]) : int(row_splits[-1])]
+                return self.__class__(values, row_splits - row_splits[0], internal=True)
+            # the elements of the other rows are gathered into a new values buffer
+            rows = ivy.array(list(rows), dtype="int64")
+            row_lengths = ivy.gather(self._row_lengths, rows)
+            row_splits = ivy.concat(
+                [ivy.zeros((1,), dtype="int64"), ivy.cumsum(row_lengths)], axis=0
+            )
+            row_ids = ivy.repeat(ivy.arange(rows.shape[0], dtype="int64"), row_lengths)
+            indices = (
+                ivy.gather(self._row_splits[:-1], ivy.gather(rows, row_ids))
+                + ivy.arange(row_ids.shape[0], dtype="int64")
+                - ivy.gather(row_splits, row_ids)
+            )
+            values = ivy.gather(self._values, indices, axis=0)
+            return self.__class__(values, row_splits, internal=True)
+        return self.unbind()[query]
+
+    def __add__(self, other):
+        return self._elementwise(ivy.add, other)
+
+    def __radd__(self, other):
+        return self._elementwise(ivy.add, other, reverse=True)
+
+    def __sub__(self, other):
+        return self._elementwise(ivy.subtract, other)
+
+    def __rsub__(self, other):
+        return self._elementwise(ivy.subtract, other, reverse=True)
+
+    def __mul__(self, other):
+        return self._elementwise(ivy.multiply, other)
+
+    def __rmul__(self, other):
+        return self._elementwise(ivy.multiply, other, reverse=True)
+
+    def __truediv__(self, other):
+        return self._elementwise(ivy.divide, other)
+
+    def __rtruediv__(self, other):
+        return self._elementwise(ivy.divide, other, reverse=True)
+
+    def __pow__(self, other):
+        return self._elementwise(ivy.pow, other)
+
+    def __neg__(self):
+        return self.map_values(ivy.negative)
+
+    def __abs__(self):
+        return self.map_values(ivy.abs)
@@ -1,16 +1,36 @@
-from . import activations
-from .activations import *
-from . import converters
-from .converters import *
-from . import initializers
-from .initializers import *
-from . import layers
-from .layers import *
-from . import module
-from .module import *
-from . import norms
-from .norms import *
-from . import optimizers
-from .optimizers import *
-from . import sequential
-from .sequential import *
+from ivy.utils.lazy_import import enabled as _lazy_import
+
+if not _lazy_import:
+    from . import activations
+    from .activations import *
+    from . import converters
+    from .converters import *
+    from . import initializers
+    from .initializers import *
+    from . import layers
+    from .layers import *
+    from . import module
+    from .module import *
+    from . import norms
+    from .norms import *
+    from . import optimizers
+    from .optimizers import *
+    from . import sequential
+    from .sequential import *
+else:
+    from ivy.utils.lazy_import import lazy_package as _lazy_package
+
+    __getattr__, __dir__ = _lazy_package(
+        __name__,
+        [
+            ("activations", (), True),
+            ("converters", (), True),
+            ("initializers", (), True),
+            ("layers", (), True),
+            ("module", (), True),
+            ("norms", (), True),
+            ("optimizers", (), True),
+            ("sequential", (), True),
+        ],
+        disjoint=True,
+    )
@@ -206,6 +206,7 @@ class MultiHeadAttention(Module):
         with_to_q_fn=True,
         with_to_kv_fn=True,
         with_to_out_fn=True,
+        chunk_size=None,
         device=None,
         v=None,
         build_mode="on_init",
@@ -241,6 +242,10 @@ class MultiHeadAttention(Module):
             Whether to include fully connected mapping from output scaled dot-product
             attention to final output.
             Default is ``True``.
+        chunk_size
+            The number of keys to attend to at once, computing the softmax online over
+            the chunks. Default is ``None``, in which case all the keys are attended to
+            at once.
         device
             device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. Default is cpu.
@@ -267,6 +272,9 @@ class MultiHeadAttention(Module):
         self._with_to_q_fn = with_to_q_fn
         self._with_to_kv_fn = with_to_kv_fn
         self._with_to_out_fn = with_to_out_fn
+        self._chunk_size = chunk_size
+        self._kv_cache = None
+        self._kv_cache_length = 0
         ivy.Module.__init__(
             self,
             device=device,
@@ -320,7 +328,46 @@ class MultiHeadAttention(Module):
         else:
             return {}
 
-    def _forward(self, inputs, context=None, mask=None):
+    def init_kv_cache(self, batch_shape, max_length):
+        """
+        Preallocate the cache of keys and values for incremental decoding, emptying
+        any previous cache.
+
+        Parameters
+        ----------
+        batch_shape
+            The batch shape of the inputs which will be decoded.
+        max_length
+            The maximum number of keys and values which the cache can hold.
+        """
+        feat_dim = self._inner_dim if self._with_to_kv_fn else self._context_dim // 2
+        shape = list(batch_shape) + [max_length, feat_dim]
+        self._kv_cache = {
+            "k": ivy.zeros(shape, dtype=self._dtype, device=self._dev),
+            "v": ivy.zeros(shape, dtype=self._dtype, device=self._dev),
+        }
+        self._kv_cache_length = 0
+
+    def _append_to_kv_cache(self, context):
+        if self._with_to_kv_fn:
+            k, v = self._to_kv(context, v=self.v.to_kv)
+        else:
+            k, v = ivy.split(context, num_or_size_splits=2, axis=-1)
+        start = self._kv_cache_length
+        stop = start + k.shape[-2]
+        ivy.utils.assertions.check_less(
+            stop,
+            self._kv_cache["k"].shape[-2],
+            allow_equal=True,
+            message="the kv cache is full, call init_kv_cache with a larger length",
+        )
+        # the new keys and values are written into the preallocated cache in place
+        self._kv_cache["k"][..., start:stop, :] = ivy.to_native(k)
+        self._kv_cache["v"][..., start:stop, :] = ivy.to_native(v)
+        self._kv_cache_length = stop
+        return self._kv_cache["k"][..., :stop, :], self._kv_cache["v"][..., :stop, :]
+
+    def _forward(self, inputs, context=None, mask=None, use_kv_cache=False):
         """
         Perform forward pass of the MultiHeadAttention layer.
 
@@ -332,17 +379,23 @@ class MultiHeadAttention(Module):
             The array to determine the keys and values from. Default is ``None``.
             *[batch_shape,num_values,cont_feats]*.
         mask
-            (Default value = None)
+            The mask to apply to the query-key values. Default is ``None``.
+            *[batch_shape,num_queries,num_values]*
+        use_kv_cache
+            Whether to append the keys and values of this step to the cache created by
+            ``init_kv_cache`` and attend to all the cached ones, rather than
+            recomputing those of the earlier steps. Unless a mask is given, each query
+            only attends to the keys up to its own position, the queries being the
+            last steps of the cache. Default is ``False``.
 
         Returns
         -------
         ret
             The output following application of scaled dot-product attention.
             *[batch_shape,num_queries,out_feats]*
-            The mask to apply to the query-key values.
-            Default is ``None``.
-            *[batch_shape,num_queries,num_values]*
         """
+        if use_kv_cache:
+            return self._forward_with_kv_cache(inputs, context=context, mask=mask)
         return ivy.multi_head_attention(
             inputs,
             self._scale,
@@ -355,6 +408,34 @@ class MultiHeadAttention(Module):
             to_q_v=self.v.to_q if self._with_to_q_fn else None,
             to_kv_v=self.v.to_kv if self._with_to_kv_fn else None,
             to_out_v=self.v.to_out if self._with_to_out_fn else None,
+            chunk_size=self._chunk_size,
+        )
+
+    def _forward_with_kv_cache(self, inputs, context=None, mask=None):
+        ivy.utils.assertions.check_exists(
+            self._kv_cache, message="call init_kv_cache before decoding"
+        )
+        keys, values = self._append_to_kv_cache(ivy.default(context, inputs))
+        if not ivy.exists(mask):
+            # the queries are the last steps of the cache, whether the context added
+            # as many keys as there are queries or not
+            num_queries = inputs.shape[-2]
+            start = self._kv_cache_length - num_queries
+            # Q x K, broadcast over the batch
+            mask = ivy.expand_dims(
+                ivy.arange(start, start + num_queries), axis=-1
+            ) >= ivy.arange(self._kv_cache_length)
+        return ivy.multi_head_attention(
+            inputs,
+            self._scale,
+            self._num_heads,
+            mask=mask,
+            to_q_fn=self._to_q if self._with_to_q_fn else None,
+            to_kv_fn=lambda context, v=None: (keys, values),
+            to_out_fn=self._to_out if self._with_to_out_fn else None,
+            to_q_v=self.v.to_q if self._with_to_q_fn else None,
+            to_out_v=self.v.to_out if self._with_to_out_fn else None,
+            chunk_size=self._chunk_size,
         )
 
 
@@ -1264,6 +1345,7 @@ class LSTM(Module):
         num_layers=1,
         return_sequence=True,
         return_state=True,
+        streaming=False,
         device=None,
         v=None,
         dtype=None,
@@ -1287,6 +1369,9 @@ class LSTM(Module):
         return_state
             Whether or not to return the latest hidden and cell states.
             Default is ``True``.
+        streaming
+            Whether to carry the latest hidden and cell states over to the next call,
+            so that a sequence can be processed chunk by chunk. Default is ``False``.
         device
             device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. Default is cpu.
@@ -1303,6 +1388,8 @@ class LSTM(Module):
         self._num_layers = num_layers
         self._return_sequence = return_sequence
         self._return_state = return_state
+        self._streaming = streaming
+        self._state = None
         Module.__init__(self, device=device, v=v, dtype=dtype)
 
     # Public #
@@ -1331,6 +1418,11 @@ class LSTM(Module):
             ],
         )
 
+    def reset_state(self):
+        """Forget the states carried over between calls in streaming mode, before
+        starting a new sequence."""
+        self._state = None
+
     # Overridden
 
     def _create_variables(self, device, dtype=None):
@@ -1398,7 +1490,8 @@ class LSTM(Module):
         initial_state
             2-tuple of lists of the hidden states h and c for each layer,
             each of dimension *[batch_shape,out]*.
-            Created internally if None. (Default value = None)
+            Created internally if None, or carried over from the previous call in
+            streaming mode. (Default value = None)
 
         Returns
         -------
@@ -1407,6 +1500,8 @@ class LSTM(Module):
             state tuple of lists, each of dimension *[batch_shape, out]*
 
         """
+        if initial_state is None:
+            initial_state = self._state
         if initial_state is None:
             initial_state = self.get_initial_state(
                 inputs.shape[:-2], dtype=inputs.dtype
@@ -1425,6 +1520,8 @@ class LSTM(Module):
             )
             h_n_list.append(h_t[..., -1, :])
             c_n_list.append(c_n)
+        if self._streaming:
+            self._state = (h_n_list, c_n_list)
         if not self._return_sequence:
             h_t = h_t[..., -1, :]
         if not self._return_state:
@@ -109,11 +109,9 @@ class Module(ModuleConverters, ModuleHelpers):
         self._track_submod_call_order = False
         self.expected_submod_rets = None
         self.submod_dict = dict()
-        with ivy.utils.backend.ContextManager("numpy") as backend:
-            self.submod_rets = ivy.Container(alphabetical_keys=False, ivyh=backend)
-            self.submod_call_order = ivy.Container(
-                alphabetical_keys=False, ivyh=backend
-            )
+        # submodule tracking containers, only allocated once tracking is requested
+        self._submod_rets = None
+        self._submod_call_order = None
         self._sub_mods = set()
         self._dtype = dtype
         self._args = args
@@ -513,11 +511,17 @@ class Module(ModuleConverters, ModuleHelpers):
             return self._module_graph(*args, v=v, **kwargs)
 
         with_grads = ivy.with_grads(with_grads=with_grads)
-        with ivy.utils.backend.ContextManager("numpy") as backend:
-            self.submod_rets = ivy.Container(alphabetical_keys=False, ivyh=backend)
-            self.submod_call_order = ivy.Container(
-                alphabetical_keys=False, ivyh=backend
-            )
+        # fresh tracking containers are only needed if tracking is requested,
+        # otherwise the returns of any previous tracked call are just dropped
+        self._submod_rets = None
+        self._submod_call_order = None
+        if (
+            track_submod_rets
+            or track_submod_call_order
+            or ivy.exists(expected_submod_rets)
+        ):
+            self._submod_rets = ivy.Container(alphabetical_keys=False)
+            self._submod_call_order = ivy.Container(alphabetical_keys=False)
         self._set_submod_flags(
             track_submod_rets,
             submod_depth,
@@ -527,12 +531,22 @@ class Module(ModuleConverters, ModuleHelpers):
         )
 
         # convert variables to native arrays so that they can be tracked
-        v = ivy.to_native(v)
+        if v is not None:
+            v = ivy.to_native(v)
         ret = self._call(*args, v=v, with_grads=with_grads, **kwargs)
         self._unset_submod_flags()
         return ret
 
-    def save_weights(self, weights_path, /):
+    def save_weights(
+        self,
+        weights_path,
+        /,
+        *,
+        chunks=None,
+        compression=None,
+        compression_opts=None,
+        num_workers=None,
+    ):
         """
         Save the weights on the Module.
 
@@ -540,13 +554,28 @@ class Module(ModuleConverters, ModuleHelpers):
         ----------
         weights_path
             The hdf5 file for saving the weights.
+        chunks
+            Chunk shape of the datasets, ``True`` for h5py to choose it, or ``False``
+            for contiguous datasets which can be memory-mapped when loading.
+        compression
+            Compression filter of the datasets, such as 'gzip' or 'lzf'.
+        compression_opts
+            Options of the compression filter, such as the gzip level.
+        num_workers
+            Number of threads converting the weights to numpy.
 
         Returns
         -------
         None
         """
         os.makedirs("/".join(weights_path.split("/")[:-1]), exist_ok=True)
-        self.v.cont_to_disk_as_hdf5(weights_path)
+        self.v.cont_to_disk_as_hdf5(
+            weights_path,
+            chunks=chunks,
+            compression=compression,
+            compression_opts=compression_opts,
+            num_workers=num_workers,
+        )
 
     def build(
         self,
@@ -677,6 +706,26 @@ class Module(ModuleConverters, ModuleHelpers):
     def built_(self):
         return self._built
 
+    @property
+    def submod_rets(self):
+        if self._submod_rets is None:
+            self._submod_rets = ivy.Container(alphabetical_keys=False)
+        return self._submod_rets
+
+    @submod_rets.setter
+    def submod_rets(self, value):
+        self._submod_rets = value
+
+    @property
+    def submod_call_order(self):
+        if self._submod_call_order is None:
+            self._submod_call_order = ivy.Container(alphabetical_keys=False)
+        return self._submod_call_order
+
+    @submod_call_order.setter
+    def submod_call_order(self, value):
+        self._submod_call_order = value
+
     def show_graph(
         self,
         *args,
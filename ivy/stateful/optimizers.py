@@ -7,6 +7,7 @@ from typing import Union, Optional, Callable
 
 # local
 import ivy
+from ivy.data_classes.container.base import _FlatLayout, _segment_norms
 
 
 # Base #
@@ -23,6 +24,7 @@ class Optimizer(abc.ABC):
         compile_on_next_step: bool = False,
         fallback_to_non_compiled: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
     ):
         """
         Construct a general Optimizer. This is an abstract class, and must be derived.
@@ -50,6 +52,10 @@ class Optimizer(abc.ABC):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to pack the variables, gradients and optimizer state into one flat
+            buffer per dtype and device, and update each buffer with a few array ops
+            rather than updating every variable separately. Default is ``False``.
         """
         self._lr = lr
         self._inplace = inplace
@@ -59,7 +65,12 @@ class Optimizer(abc.ABC):
         self._compile_on_next_step = compile_on_next_step
         self._fallback_to_non_compiled = fallback_to_non_compiled
         self._dev = ivy.default(device, ivy.default_device())
-        self._count = ivy.array([0], device=self._dev)
+        self._foreach = foreach
+        self._layout = None
+        self._flat_v = None
+        self._views = None
+        self._view_ids = None
+        self._count = 0
         self._compiled_step_fn = None
         self._compiled = False
 
@@ -92,6 +103,82 @@ class Optimizer(abc.ABC):
 
     # Given #
 
+    def _flat_step(self, w: ivy.Array, dcdw: ivy.Array, lr: float, group: tuple):
+        """
+        Update a flat buffer of variables from update step, using the flat buffer of
+        their gradients. Override this method with child class custom implementation
+        to support the foreach mode.
+
+        Parameters
+        ----------
+        w
+            Flat buffer of variables to update.
+        dcdw
+            Flat buffer of gradients.
+        lr
+            Learning rate of the step.
+        group
+            The (dtype, device) group of the buffers, which keys the optimizer state
+            and the segments of the variables in the buffer.
+
+        Returns
+        -------
+        ret
+            The updated flat buffer of variables, following update step.
+        """
+        raise ivy.utils.exceptions.IvyNotImplementedException
+
+    def _flat_layout(self, xs: ivy.Container):
+        if self._layout is None:
+            self._layout = _FlatLayout(xs)
+        return self._layout
+
+    def _foreach_step(self, v: ivy.Container, grads: ivy.Container):
+        """
+        Update nested variables container v by applying the custom flat step to one
+        flat buffer of variables and gradients per dtype and device. When updating
+        in-place with stopped gradients, the flat buffers of variables are kept
+        between steps and overwritten, so passing back the returned views skips
+        packing the variables again.
+
+        Parameters
+        ----------
+        v
+            Nested variables to update.
+        grads
+            Nested gradients to update.
+
+        Returns
+        -------
+        ret
+            The updated variables, as views of the updated flat buffers.
+        """
+        layout = self._flat_layout(v)
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        grads = layout.pack(grads)
+        inplace = (
+            self._inplace and self._stop_gradients and ivy.inplace_arrays_supported()
+        )
+        if not inplace:
+            return layout.unpack(
+                {
+                    group: self._flat_step(w, grads[group], lr, group)
+                    for group, w in layout.pack(v).items()
+                }
+            )
+        if [id(x) for x in v.cont_to_iterator_values()] != self._view_ids:
+            self._flat_v = {
+                group: ivy.stop_gradient(w, preserve_type=False)
+                for group, w in layout.pack(v).items()
+            }
+            self._views = layout.unpack(self._flat_v)
+            self._view_ids = [id(x) for x in self._views.cont_to_iterator_values()]
+        for group, w in self._flat_v.items():
+            ivy.inplace_update(
+                w, self._flat_step(w, grads[group], lr, group), keep_input_dtype=True
+            )
+        return self._views
+
     def _step_fn(
         self, v: ivy.Container, grads: ivy.Container, ignore_missing: bool = False
     ):
@@ -110,7 +197,9 @@ class Optimizer(abc.ABC):
             Default is ``False``
         """
         if ignore_missing:
-            return v.cont_set_at_keys(self._step(v.cont_at_key_chains(grads), grads))
+            return v.cont_set_at_keys(self._step_fn(v.cont_at_key_chains(grads), grads))
+        if self._foreach and isinstance(v, ivy.Container):
+            return self._foreach_step(v, grads)
         return self._step(v, grads)
 
     # Public #
@@ -171,6 +260,7 @@ class SGD(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
+        foreach: bool = False,
     ):
         """
         Construct a Stochastic-Gradient-Descent (SGD) optimizer.
@@ -189,9 +279,18 @@ class SGD(Optimizer):
             Default is ``True``.
         compile_on_next_step
             Whether to compile the optimizer on the next step. Default is ``False``.
+        foreach
+            Whether to pack the variables, gradients and optimizer state into one flat
+            buffer per dtype and device, and update each buffer with a few array ops
+            rather than updating every variable separately. Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, compile_on_next_step=compile_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            compile_on_next_step=compile_on_next_step,
+            foreach=foreach,
         )
 
     # Custom Step
@@ -221,6 +320,11 @@ class SGD(Optimizer):
             stop_gradients=self._stop_gradients,
         )
 
+    def _flat_step(self, w: ivy.Array, dcdw: ivy.Array, lr: float, group: tuple):
+        return ivy.gradient_descent_update(
+            w, dcdw, lr, stop_gradients=self._stop_gradients
+        )
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -246,6 +350,7 @@ class LARS(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
+        foreach: bool = False,
     ):
         """
         Construct a Layer-wise Adaptive Rate Scaling (LARS) optimizer.
@@ -266,10 +371,19 @@ class LARS(Optimizer):
             Default is ``True``.
         compile_on_next_step
             Whether to compile the optimizer on the next step. Default is ``False``.
+        foreach
+            Whether to pack the variables, gradients and optimizer state into one flat
+            buffer per dtype and device, and update each buffer with a few array ops
+            rather than updating every variable separately. Default is ``False``.
         """
         self._decay_lambda = decay_lambda
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, compile_on_next_step=compile_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            compile_on_next_step=compile_on_next_step,
+            foreach=foreach,
         )
 
     # Custom Step
@@ -300,6 +414,19 @@ class LARS(Optimizer):
             stop_gradients=self._stop_gradients,
         )
 
+    def _flat_step(self, w: ivy.Array, dcdw: ivy.Array, lr: float, group: tuple):
+        segment_ids = self._layout.segment_ids[group]
+        num_segments = self._layout.num_segments[group]
+        w_norm = _segment_norms(w, segment_ids, num_segments)
+        lr = ivy.stable_divide(
+            w_norm * lr, _segment_norms(dcdw, segment_ids, num_segments)
+        )
+        if self._decay_lambda > 0:
+            lr /= w_norm * self._decay_lambda
+        return ivy.gradient_descent_update(
+            w, dcdw, ivy.gather(lr, segment_ids), stop_gradients=self._stop_gradients
+        )
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -328,6 +455,7 @@ class Adam(Optimizer):
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
     ):
         """
         Construct an ADAM optimizer.
@@ -356,17 +484,28 @@ class Adam(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to pack the variables, gradients and optimizer state into one flat
+            buffer per dtype and device, and update each buffer with a few array ops
+            rather than updating every variable separately. Default is ``False``.
         """
         self._beta1 = beta1
         self._beta2 = beta2
         self._epsilon = epsilon
-        self._mw = None
-        self._vw = None
+        self._mw = dict() if foreach else None
+        self._vw = dict() if foreach else None
         self._first_pass = True
         self._should_compile = False
 
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, compile_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            compile_on_next_step,
+            device=device,
+            foreach=foreach,
         )
 
     # Custom Step
@@ -408,6 +547,24 @@ class Adam(Optimizer):
         )
         return new_v
 
+    def _flat_step(self, w: ivy.Array, dcdw: ivy.Array, lr: float, group: tuple):
+        if group not in self._mw:
+            self._mw[group] = dcdw
+            self._vw[group] = dcdw**2
+        new_w, self._mw[group], self._vw[group] = ivy.adam_update(
+            w,
+            dcdw,
+            lr,
+            self._mw[group],
+            self._vw[group],
+            self._count,
+            beta1=self._beta1,
+            beta2=self._beta2,
+            epsilon=self._epsilon,
+            stop_gradients=self._stop_gradients,
+        )
+        return new_w
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -417,12 +574,23 @@ class Adam(Optimizer):
         state
             Nested state to update.
         """
+        if self._foreach:
+            layout = self._flat_layout(state.mw)
+            self._mw = layout.pack(state.mw)
+            self._vw = layout.pack(state.vw)
+            return
         self._mw = state.mw
         self._vw = state.vw
 
     @property
     def state(self):
-
+        if self._foreach and self._mw:
+            return ivy.Container(
+                {
+                    "mw": self._layout.unpack(self._mw),
+                    "vw": self._layout.unpack(self._vw),
+                }
+            )
         return ivy.Container({"mw": self._mw, "vw": self._vw})
 
 
@@ -439,6 +607,7 @@ class LAMB(Optimizer):
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
     ):
         """
         Construct an LAMB optimizer.
@@ -472,15 +641,26 @@ class LAMB(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to pack the variables, gradients and optimizer state into one flat
+            buffer per dtype and device, and update each buffer with a few array ops
+            rather than updating every variable separately. Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, compile_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            compile_on_next_step,
+            device=device,
+            foreach=foreach,
         )
         self._beta1 = beta1
         self._beta2 = beta2
         self._epsilon = epsilon
-        self._mw = None
-        self._vw = None
+        self._mw = dict() if foreach else None
+        self._vw = dict() if foreach else None
         self._max_trust_ratio = max_trust_ratio
         self._decay_lambda = decay_lambda
         self._first_pass = True
@@ -525,6 +705,36 @@ class LAMB(Optimizer):
         )
         return new_v
 
+    def _flat_step(self, w: ivy.Array, dcdw: ivy.Array, lr: float, group: tuple):
+        if group not in self._mw:
+            self._mw[group] = dcdw
+            self._vw[group] = dcdw**2
+        segment_ids = self._layout.segment_ids[group]
+        num_segments = self._layout.num_segments[group]
+        r1 = _segment_norms(w, segment_ids, num_segments)
+        eff_grads, self._mw[group], self._vw[group] = ivy.adam_step(
+            dcdw,
+            self._mw[group],
+            self._vw[group],
+            self._count,
+            beta1=self._beta1,
+            beta2=self._beta2,
+            epsilon=self._epsilon,
+        )
+        if self._decay_lambda > 0:
+            r2 = _segment_norms(
+                eff_grads + self._decay_lambda * w, segment_ids, num_segments
+            )
+        else:
+            r2 = _segment_norms(eff_grads, segment_ids, num_segments)
+        r = ivy.minimum(ivy.stable_divide(r1, r2), self._max_trust_ratio)
+        return ivy.optimizer_update(
+            w,
+            eff_grads,
+            ivy.gather(r * lr, segment_ids),
+            stop_gradients=self._stop_gradients,
+        )
+
     def set_state(self, state: ivy.Container):
         """Set state of the optimizer.
 
@@ -533,10 +743,21 @@ class LAMB(Optimizer):
         state
             Nested state to update.
         """
+        if self._foreach:
+            layout = self._flat_layout(state.mw)
+            self._mw = layout.pack(state.mw)
+            self._vw = layout.pack(state.vw)
+            return
         self._mw = state.mw
         self._vw = state.vw
 
     @property
     def state(self):
-
+        if self._foreach and self._mw:
+            return ivy.Container(
+                {
+                    "mw": self._layout.unpack(self._mw),
+                    "vw": self._layout.unpack(self._vw),
+                }
+            )
         return ivy.Container({"mw": self._mw, "vw": self._vw})
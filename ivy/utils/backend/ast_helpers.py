@@ -1,4 +1,6 @@
 import ast
+import hashlib
+import marshal
 import os
 import sys
 import traceback
@@ -35,6 +37,68 @@ def _retrive_local_modules():
 local_modules = _retrive_local_modules()
 
 
+# Opt-in on-disk cache of the transformed code objects, such that new processes don't
+# parse and transform the whole package again. It's enabled by setting IVY_CACHE_DIR
+# to a writable directory, and any failure to read or write it is ignored.
+_CODE_CACHE_VERSION = 1
+
+
+def _code_cache_dir():
+    root = os.environ.get("IVY_CACHE_DIR")
+    if not root:
+        return None
+    # the transformed imports depend on which modules are local
+    tag = hashlib.sha1(
+        repr((_CODE_CACHE_VERSION, sorted(local_modules))).encode()
+    ).hexdigest()[:16]
+    return os.path.join(root, "local_ivy", sys.implementation.cache_tag, tag)
+
+
+def _code_cache_path(filename):
+    cache_dir = _code_cache_dir()
+    if cache_dir is None:
+        return None
+    name = hashlib.sha1(os.path.abspath(filename).encode()).hexdigest()
+    return os.path.join(cache_dir, name + ".bin")
+
+
+def _source_stamp(filename):
+    stat = os.stat(filename)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_cached_code(filename):
+    path = _code_cache_path(filename)
+    if path is None:
+        return None
+    try:
+        with open(path, "rb") as f:
+            stamp, code = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if tuple(stamp) != _source_stamp(filename):
+        return None
+    return code
+
+
+def _store_cached_code(filename, code):
+    path = _code_cache_path(filename)
+    if path is None:
+        return
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            marshal.dump((_source_stamp(filename), code), f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # the cache is best effort, an unwritable location only costs speed
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
 def _parse_absolute_fromimport(node: ast.ImportFrom):
     # Not to override absolute imports to other packages
     if node.module.partition(".")[0] not in local_modules:
@@ -229,19 +293,27 @@ class IvyLoader(Loader):
     def __init__(self, filename):
         self.filename = filename
 
+    def _compile(self):
+        compiled_obj = _load_cached_code(self.filename)
+        if compiled_obj is not None:
+            return compiled_obj
+        with open(self.filename) as f:
+            data = f.read()
+
+        ast_tree = parse(data)
+        transformer = ImportTransformer()
+        transformer.visit(ast_tree)
+        transformer.impersonate_import(ast_tree)
+        ast.fix_missing_locations(ast_tree)
+        compiled_obj = compile(ast_tree, filename=self.filename, mode="exec")
+        _store_cached_code(self.filename, compiled_obj)
+        return compiled_obj
+
     def exec_module(self, module):
         if self.filename in _compiled_modules_cache:
             compiled_obj = _compiled_modules_cache[self.filename]
         else:
-            with open(self.filename) as f:
-                data = f.read()
-
-            ast_tree = parse(data)
-            transformer = ImportTransformer()
-            transformer.visit(ast_tree)
-            transformer.impersonate_import(ast_tree)
-            ast.fix_missing_locations(ast_tree)
-            compiled_obj = compile(ast_tree, filename=self.filename, mode="exec")
+            compiled_obj = self._compile()
             _compiled_modules_cache[self.filename] = compiled_obj
         try:
             exec(compiled_obj, module.__dict__)
@@ -1,24 +1,50 @@
 # global
 import os
 import copy
+import contextvars
 import types
+import weakref
 import ivy
 import importlib
 import functools
 import numpy as np
 import gc
-from ivy.utils import _importlib, verbosity
+from ivy.utils import _importlib, lazy_import, verbosity
+from ivy.utils.context_stack import ContextStack
 
 # local
-from ivy.func_wrapper import _wrap_function
+from ivy.func_wrapper import _wrap_function, _invalidate_versioned_attributes
 from ivy.utils.backend.sub_backend_handler import _clear_current_sub_backends
+from ivy.utils.inspection import _ensure_array_specs
+from ivy.utils.support_matrix import _clear_support_matrix
 
-backend_stack = []
+# the backends set with set_backend, which each thread and asyncio task can set on
+# its own, see ivy.utils.context_stack
+backend_stack = ContextStack("backend_stack")
 compiled_backends = {}
 _compiled_backends_ids = {}
+# local ivy instances handed back through `release_backend`, which `with_backend`
+# reuses before compiling new ones
+_backend_pool = {}
 implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = dict()
+# per-backend namespace tables, each built once by `_set_backend_as_ivy` and then
+# reapplied to the ivy namespace on every subsequent push or pop of that backend
+_backend_namespaces = dict()
+# whether the ivy namespace holds ivy's own functions, which look up the backend of
+# the calling thread or task on every call, rather than those of the backend of the
+# whole process
+_dispatching = False
+
+
+class _OwnBackends:
+    """Marks a thread or task which set or unset backends of its own, for as long
+    as it's alive."""
+
+
+_own_backends = contextvars.ContextVar("own_backends", default=None)
+_contexts_with_own_backends = weakref.WeakSet()
 
 
 class ContextManager:
@@ -180,6 +206,7 @@ def set_backend_to_specific_version(backend):
 
     f = importlib.import_module(f)
     f_version = f.__version__
+    _invalidate_versioned_attributes()
 
     for key in list(backend.__dict__):
         if "_v_" in key:
@@ -247,6 +274,8 @@ def current_backend(*args, **kwargs):
 def _set_backend_as_ivy(
     original_dict, target, backend, invalid_dtypes=None, backend_str=None
 ):
+    # the wrapped functions take the array specs over from the originals
+    _ensure_array_specs()
     invalid_dtypes = (
         backend.invalid_dtypes if invalid_dtypes is None else invalid_dtypes
     )
@@ -275,6 +304,51 @@ def _set_backend_as_ivy(
             )
 
 
+def _same_namespace(dict_a, dict_b):
+    # identity rather than equality, the namespace may hold arrays
+    if len(dict_a) != len(dict_b):
+        return False
+    return all(k in dict_b and dict_b[k] is v for k, v in dict_a.items())
+
+
+def _clear_backend_namespaces():
+    """Drops all the cached backend namespaces, forcing the ivy namespace to be
+    fully re-wrapped the next time each backend is set."""
+    _backend_namespaces.clear()
+    _clear_support_matrix()
+
+
+def _set_backend_namespace(backend):
+    """Points the ivy namespace to the wrapped implementations of `backend`.
+
+    The wrapped namespace is only built the first time a given backend module and
+    backend version is set, every later switch to that backend simply updates the
+    ivy dict with the cached table.
+
+    Parameters
+    ----------
+    backend
+        the backend module to set as ivy.
+    """
+    backend_str = backend.current_backend_str()
+    version = str(backend.backend_version)
+    _invalidate_versioned_attributes()
+    cached = _backend_namespaces.get(backend_str)
+    if cached is not None and cached[0] is backend and cached[1] == version:
+        _, _, namespace, removed = cached
+        ivy.__dict__.update(namespace)
+        for k in removed:
+            ivy.__dict__.pop(k, None)
+        return
+    # the functions are re-wrapped, so their memoised support is stale
+    _clear_support_matrix(backend_str)
+    set_backend_to_specific_version(backend)
+    _set_backend_as_ivy(ivy_original_dict, ivy, backend)
+    namespace = {k: ivy.__dict__[k] for k in ivy_original_dict if k in ivy.__dict__}
+    removed = [k for k in ivy_original_dict if k not in ivy.__dict__]
+    _backend_namespaces[backend_str] = (backend, version, namespace, removed)
+
+
 def _handle_backend_specific_vars(backend):
     if backend.current_backend_str() == "numpy":
         backend.set_default_device("cpu")
@@ -403,6 +477,11 @@ def set_backend(backend: str, dynamic: bool = False):
     Will also convert all Array and Container objects \
     to the new backend if `dynamic` = True
 
+    A backend set from a thread other than the main one, or from an asyncio task, only
+    applies to that thread or task, and doesn't need to wait for the others. From
+    then on, the ivy functions look up the backend on every call rather than being
+    replaced with those of the backend.
+
     Examples
     --------
     If we set the global backend to be numpy, then subsequent calls to ivy functions
@@ -435,33 +514,95 @@ def set_backend(backend: str, dynamic: bool = False):
             variable_ids, numpy_objs, devices
         )
 
-    # update the global dict with the new backend
+    if backend_stack.is_shared():
+        with ivy.locks["backend_setter"]:
+            _push_backend(backend, rewrite=_rewrites_namespace())
+    else:
+        if isinstance(backend, str):
+            backend = importlib.import_module(_backend_dict[backend])
+        _dispatch_per_context()
+        _push_backend(backend, rewrite=False)
+
+    if dynamic:
+        convert_from_numpy_to_target_backend(variable_ids, numpy_objs, devices)
+
+    if verbosity.level > 0:
+        verbosity.cprint("backend stack: {}".format(backend_stack))
+
+
+def _update_original_dict():
+    global ivy_original_dict
+    # the whole namespace is wrapped, so nothing can be left to load lazily
+    lazy_import.load()
+    original_dict = ivy.__dict__.copy()
+    # the cached namespaces wrap the old originals, so they become stale
+    if not _same_namespace(original_dict, ivy_original_dict):
+        _clear_backend_namespaces()
+    ivy_original_dict = original_dict
+
+
+def _dispatch_per_context():
+    """Points the ivy namespace back to ivy's own functions, when a thread or asyncio
+    task sets or unsets a backend of its own.
+
+    Ivy's own functions get the backend of the calling context from the backend stack
+    on every call, as they do when no backend is set. Once none of the threads and
+    tasks which set their own backends is alive, the next backend set or unset for the
+    whole process rewrites the namespace again.
+    """
+    global _dispatching
+    if _own_backends.get() is None:
+        marker = _OwnBackends()
+        _own_backends.set(marker)
+        _contexts_with_own_backends.add(marker)
+    # the main context stops dispatching by resetting the flag before checking for
+    # other contexts, so either it sees the marker or this sees the flag reset
+    if _dispatching:
+        return
     with ivy.locks["backend_setter"]:
-        global ivy_original_dict
+        if _dispatching:
+            return
+        # the calling context hasn't modified the stack yet, so it reads the
+        # backends of the whole process
         if not backend_stack:
-            ivy_original_dict = ivy.__dict__.copy()
-
+            _update_original_dict()
         _clear_current_sub_backends()
-        if isinstance(backend, str):
-            temp_stack = list()
-            while backend_stack:
-                temp_stack.append(previous_backend())
-            backend = importlib.import_module(_backend_dict[backend])
-            for fw in reversed(temp_stack):
-                backend_stack.append(fw)
-        if backend.current_backend_str() == "numpy":
-            ivy.set_default_device("cpu")
-        elif backend.current_backend_str() == "jax":
-            ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
-        backend_stack.append(backend)
-        set_backend_to_specific_version(backend)
-        _set_backend_as_ivy(ivy_original_dict, ivy, backend)
+        ivy.__dict__.update(ivy_original_dict)
+        _dispatching = True
 
-        if dynamic:
-            convert_from_numpy_to_target_backend(variable_ids, numpy_objs, devices)
 
-        if verbosity.level > 0:
-            verbosity.cprint("backend stack: {}".format(backend_stack))
+def _rewrites_namespace():
+    # whether the backends of the whole process are set by rewriting the namespace,
+    # called with the lock held
+    global _dispatching
+    if _dispatching:
+        _dispatching = False
+        if _contexts_with_own_backends:
+            _dispatching = True
+    return not _dispatching
+
+
+def _push_backend(backend, rewrite):
+    if rewrite:
+        if not backend_stack:
+            _update_original_dict()
+        _clear_current_sub_backends()
+    if isinstance(backend, str):
+        # the backend is imported with ivy's own namespace, which it already is
+        # unless the namespace is rewritten
+        temp_stack = list()
+        while rewrite and backend_stack:
+            temp_stack.append(_pop_backend(rewrite=True))
+        backend = importlib.import_module(_backend_dict[backend])
+        for fw in reversed(temp_stack):
+            backend_stack.append(fw)
+    if backend.current_backend_str() == "numpy":
+        ivy.set_default_device("cpu")
+    elif backend.current_backend_str() == "jax":
+        ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
+    backend_stack.append(backend)
+    if rewrite:
+        _set_backend_namespace(backend)
 
 
 def set_numpy_backend():
@@ -522,35 +663,42 @@ def previous_backend():
     backend = None
     # if the backend stack is empty, nothing is done then we just return `None`
     if backend_stack:
-        backend = backend_stack.pop(-1)  # remove last backend from the stack
-        if backend.current_backend_str() == "numpy":
-            ivy.unset_default_device()
-        elif backend.current_backend_str() == "jax":
-            ivy.del_global_attr("RNG")
-        # the new backend is the backend that was set before the one
-        # we just removed from the stack, or Ivy if there was no
-        # previously set backend
-        if backend_stack:
-            new_backend = backend_stack[-1]
-            if new_backend.current_backend_str() == "numpy":
-                ivy.set_default_device("cpu")
-            elif new_backend.current_backend_str() == "jax":
-                ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
-        new_backend_dict = (
-            backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
-        )
-        # wrap backend functions if there still is a backend, and add functions
-        # to ivy namespace
-        for k, v in new_backend_dict.items():
-            if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
-            if k in ivy_original_dict:
-                ivy.__dict__[k] = v
+        if backend_stack.is_shared():
+            with ivy.locks["backend_setter"]:
+                backend = _pop_backend(rewrite=_rewrites_namespace())
+        else:
+            _dispatch_per_context()
+            backend = _pop_backend(rewrite=False)
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
     return backend
 
 
+def _pop_backend(rewrite):
+    backend = backend_stack.pop(-1)  # remove last backend from the stack
+    if backend.current_backend_str() == "numpy":
+        ivy.unset_default_device()
+    elif backend.current_backend_str() == "jax":
+        ivy.del_global_attr("RNG")
+    # the new backend is the backend that was set before the one
+    # we just removed from the stack, or Ivy if there was no
+    # previously set backend
+    if backend_stack:
+        new_backend = backend_stack[-1]
+        if new_backend.current_backend_str() == "numpy":
+            ivy.set_default_device("cpu")
+        elif new_backend.current_backend_str() == "jax":
+            ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
+    # restore the wrapped namespace of the new backend if there still is a
+    # backend, otherwise return to ivy's original namespace
+    if rewrite:
+        if backend_stack:
+            _set_backend_namespace(backend_stack[-1])
+        else:
+            ivy.__dict__.update(ivy_original_dict)
+    return backend
+
+
 @prevent_access_locally
 def unset_backend():
     while backend_stack:
@@ -579,12 +727,51 @@ def choose_random_backend(excluded=None):
             return f
 
 
+def _context_stacks(ivy_pack):
+    return {
+        name: obj
+        for name, obj in ivy_pack.__dict__.items()
+        if isinstance(obj, ivy_pack.ContextStack)
+    }
+
+
 # noinspection PyProtectedMember
 @prevent_access_locally
 def with_backend(backend: str, cached: bool = False):
+    """Returns a local ivy instance with `backend` set, which is independent of the
+    global ivy module and of any other local instance.
+
+    Parameters
+    ----------
+    backend
+        the backend to set on the local instance.
+    cached
+        whether to return the last local instance created for `backend`, if there's
+        one, rather than a new one.
+
+    Returns
+    -------
+    ret
+        the local ivy instance.
+
+    Creating an instance compiles the whole ivy package again. The compiled modules
+    are kept on disk between processes only if the ``IVY_CACHE_DIR`` environment
+    variable is set to a writable directory, which is read and written on a best
+    effort basis.
+    """
     # Use already compiled object
     if cached and backend in compiled_backends.keys():
         return compiled_backends[backend][-1]
+    # Reuse a released one
+    try:
+        ivy_pack = _backend_pool[backend].pop()
+    except (KeyError, IndexError):
+        pass
+    else:
+        compiled_backends.setdefault(backend, []).append(ivy_pack)
+        return ivy_pack
+    # the global modules must not be imported while the local importer is installed
+    lazy_import.load()
     with _importlib.LocalIvyImporter():
         ivy_pack = _importlib._import_module("ivy")
         ivy_pack._is_local_pkg = True
@@ -603,8 +790,50 @@ def with_backend(backend: str, cached: bool = False):
             _importlib.import_cache
         )
         _compiled_backends_ids[ivy_pack._compiled_id] = ivy_pack
+    ivy_pack._pooled_backend = backend
+    ivy_pack._pooled_stacks = {
+        name: stack.copy() for name, stack in _context_stacks(ivy_pack).items()
+    }
     try:
         compiled_backends[backend].append(ivy_pack)
     except KeyError:
         compiled_backends[backend] = [ivy_pack]
     return ivy_pack
+
+
+@prevent_access_locally
+def release_backend(local_ivy):
+    """Hands a local ivy instance created by :func:`with_backend` back, such that
+    the next call to :func:`with_backend` for its backend reuses it rather than
+    compiling a new one. The global modes set on the instance are reset, so the
+    instance must no longer be used by the caller.
+
+    Parameters
+    ----------
+    local_ivy
+        the local ivy instance to release.
+    """
+    ivy.utils.assertions.check_true(
+        getattr(local_ivy, "_compiled_id", None) in _compiled_backends_ids,
+        "only local ivy instances created by with_backend can be released",
+    )
+    backend = local_ivy._pooled_backend
+    pool = _backend_pool.setdefault(backend, [])
+    if any(pooled is local_ivy for pooled in pool):
+        return
+    # released instances are no longer handed out as the cached one, and a backend
+    # without any is dropped, so a cached with_backend call compiles or reuses one
+    compiled = [
+        compiled
+        for compiled in compiled_backends.get(backend, [])
+        if compiled is not local_ivy
+    ]
+    if compiled:
+        compiled_backends[backend] = compiled
+    else:
+        compiled_backends.pop(backend, None)
+    stacks = _context_stacks(local_ivy)
+    for name, entries in local_ivy._pooled_stacks.items():
+        stacks[name].clear()
+        stacks[name].extend(entries)
+    pool.append(local_ivy)
@@ -0,0 +1,106 @@
+"""Global mode stacks which are local to each thread and asyncio task.
+
+Each stack keeps its entries as an immutable tuple in a :class:`contextvars.ContextVar`,
+so pushing or popping a mode in one thread or task never shows in another one, and no
+lock is needed. Contexts which haven't modified a stack see the process-wide entries,
+which are the ones modified from the main thread outside of any asyncio task. Setting
+a mode at startup therefore still applies to every thread and task.
+"""
+
+# global
+import contextvars
+import sys
+import threading
+
+
+def _in_main_context():
+    if threading.current_thread() is not threading.main_thread():
+        return False
+    asyncio = sys.modules.get("asyncio")
+    return asyncio is None or asyncio._get_running_loop() is None
+
+
+class ContextStack:
+    """List-like stack of global modes, local to the current thread or asyncio task.
+
+    Parameters
+    ----------
+    name
+        name of the stack, used for the underlying context variable.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._var = contextvars.ContextVar(name)
+        self._base = ()
+
+    def _get(self):
+        return self._var.get(self._base)
+
+    def _set(self, entries):
+        if self.is_shared():
+            self._base = entries
+        else:
+            self._var.set(entries)
+
+    def is_shared(self):
+        """Whether the current context sees, and modifies, the process-wide
+        entries."""
+        return _in_main_context() and self._var.get(None) is None
+
+    # Stack Methods #
+
+    def append(self, item):
+        self._set(self._get() + (item,))
+
+    def extend(self, items):
+        self._set(self._get() + tuple(items))
+
+    def pop(self, index=-1):
+        entries = list(self._get())
+        item = entries.pop(index)
+        self._set(tuple(entries))
+        return item
+
+    def clear(self):
+        self._set(())
+
+    def copy(self):
+        return list(self._get())
+
+    # Built-ins #
+
+    def __getitem__(self, index):
+        # the mode getters read the stacks on every call, so _get is inlined here
+        entries = self._var.get(self._base)
+        if index.__class__ is slice:
+            return list(entries[index])
+        return entries[index]
+
+    def __len__(self):
+        return len(self._var.get(self._base))
+
+    def __bool__(self):
+        return len(self._var.get(self._base)) > 0
+
+    def __iter__(self):
+        return iter(self._get())
+
+    def __contains__(self, item):
+        return item in self._get()
+
+    def __eq__(self, other):
+        if isinstance(other, ContextStack):
+            other = other._get()
+        elif not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return list(self._get()) == list(other)
+
+    __hash__ = None
+
+    def __deepcopy__(self, memo):
+        # snapshots, such as ivy's default globals, hold the current entries
+        return list(self._get())
+
+    def __repr__(self):
+        return repr(list(self._get()))
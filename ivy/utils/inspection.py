@@ -62,8 +62,24 @@ def _correct_index(is_opt, is_dict, is_iter):
     return []
 
 
+# id of a type hint -> (type hint, indexes of the arrays it holds). Most functions
+# of the api share the same type hint objects. They're keyed by identity, as unions
+# which only differ in the order of their members compare equal.
+_array_idxs_cache = dict()
+
+
 def _get_array_idxs(typ, idx_so_far=None):
     idx_so_far = ivy.default(idx_so_far, list())
+    cached = _array_idxs_cache.get(id(typ))
+    if cached is not None and cached[0] is typ:
+        these_idxs = cached[1]
+    else:
+        these_idxs = _compute_array_idxs(typ)
+        _array_idxs_cache[id(typ)] = (typ, these_idxs)
+    return [idx_so_far + idxs for idxs in these_idxs]
+
+
+def _compute_array_idxs(typ):
     these_idxs = list()
     if not hasattr(typ, "__args__"):
         return these_idxs
@@ -79,13 +95,11 @@ def _get_array_idxs(typ, idx_so_far=None):
             and "ivy." in a_repr
             and (".Array" in a_repr or ".NativeArray" in a_repr)
         ):
-            these_idxs.append(idx_so_far + _correct_index(is_opt, is_dict, is_iter))
+            these_idxs.append(_correct_index(is_opt, is_dict, is_iter))
             if is_union:
                 break
         else:
-            these_idxs += _get_array_idxs(
-                a, idx_so_far + _correct_index(is_opt, is_dict, is_iter)
-            )
+            these_idxs += _get_array_idxs(a, _correct_index(is_opt, is_dict, is_iter))
     return these_idxs
 
 
@@ -122,3 +136,24 @@ def add_array_specs():
     for k, v in ivy.__dict__.items():
         if callable(v) and k[0].islower():
             v.array_spec = fn_array_spec(v)
+
+
+_array_specs_added = False
+
+
+def _ensure_array_specs():
+    """Adds the array specifications to the functions of the ivy namespace, unless
+    done already. This is deferred from import to the first time they are needed,
+    that is when a backend is set or an instance method is called."""
+    global _array_specs_added
+    if not _array_specs_added:
+        add_array_specs()
+        _array_specs_added = True
+
+
+def _get_array_spec(fn):
+    try:
+        return fn.array_spec
+    except AttributeError:
+        _ensure_array_specs()
+        return fn.array_spec
@@ -0,0 +1,359 @@
+"""Opt-in lazy loading of the ivy api.
+
+By default ``import ivy`` imports every function group of ``ivy.functional`` and
+``ivy.stateful``, along with the mixins which ``ivy.Array`` and ``ivy.Container`` get
+their methods from. With the ``IVY_LAZY_IMPORT`` environment variable set to ``1``,
+these packages instead resolve their names through a module ``__getattr__`` (PEP 562),
+which imports the groups a name may come from on its first access, and the methods of
+the mixins are only set on the data classes once one is first instantiated, or a
+method is looked up on the class. The names resolve to the same objects as when
+loading eagerly, only later, though the mixins aren't bases of the data classes.
+
+Looking up a name which doesn't exist, ``dir`` and star imports import all of the
+groups of a package, and setting a backend imports everything, as the backend wraps
+the whole namespace. Local instances compiled by ``ivy.with_backend`` are always
+loaded eagerly.
+"""
+
+# global
+import abc
+import importlib
+import os
+import sys
+import types
+
+# local
+import ivy
+
+
+# the modules of local ivy instances are executed by ivy's own importer, which isn't
+# aware of module level `__getattr__`, rather than being registered in `sys.modules`
+enabled = os.environ.get("IVY_LAZY_IMPORT", "").lower() in ("1", "true") and (
+    getattr(sys.modules.get(__name__), "__dict__", None) is globals()
+)
+
+# the function groups of ivy.functional.ivy, which ivy adds as instance methods to
+# ivy.Array and ivy.Container
+core_groups = (
+    "activations",
+    "creation",
+    "data_type",
+    "device",
+    "elementwise",
+    "general",
+    "gradients",
+    "layers",
+    "linear_algebra",
+    "losses",
+    "manipulation",
+    "norms",
+    "random",
+    "searching",
+    "set",
+    "sorting",
+    "statistical",
+    "utility",
+)
+
+# package name -> _LazyPackage
+_packages = dict()
+
+_mixins = dict()
+
+_attached = False
+
+# the modules imported by ivy itself rather than by its users, which are the only
+# submodules the star imports of the eager packages could have bound
+_imported = set()
+
+
+def is_api(name, thing):
+    """Whether `thing` is bound to `name` in the api of an ivy function package,
+    rather than being a helper or something the package itself imported."""
+    return not (
+        name.startswith("_")
+        or name == "ivy"
+        or (callable(thing) and "ivy" not in thing.__module__)
+        or (isinstance(thing, types.ModuleType) and "ivy" not in thing.__name__)
+    )
+
+
+def _star_export(module, name):
+    # whether `from module import *` binds `name`, and to what
+    package = _packages.get(module.__name__)
+    if package is not None:
+        return package.star_export(name)
+    names = module.__dict__.get("__all__")
+    if names is None:
+        found = not name.startswith("_") and name in module.__dict__
+    else:
+        found = name in names
+    return found, getattr(module, name) if found else None
+
+
+def _star_bindings(module):
+    # the names `from module import *` binds
+    package = _packages.get(module.__name__)
+    if package is not None:
+        package.load()
+        return {name: package.resolved[name] for name in package.star_names()}
+    if "__all__" in module.__dict__:
+        return {name: getattr(module, name) for name in module.__all__}
+    return {k: v for k, v in module.__dict__.items() if not k.startswith("_")}
+
+
+class _LazyPackage:
+    def __init__(self, name, groups, api_only, disjoint):
+        self.name = name
+        # (submodule, aliases, star), in the order the eager package imports them
+        self.groups = groups
+        self.api_only = api_only
+        self.disjoint = disjoint
+        self.resolved = dict()
+        # the names bound when loading eagerly, in order
+        self.bound = list()
+        # the names only found among the submodules imported so far
+        self.submodules = set()
+        self.loaded = False
+
+    def _import(self, path):
+        try:
+            return sys.modules[self.name + "." + path]
+        except KeyError:
+            pass
+        before = set(sys.modules)
+        module = importlib.import_module(self.name + "." + path)
+        _imported.update(sys.modules.keys() - before)
+        return module
+
+    def _binds(self, group, name):
+        # each import statement binds the first submodule of its path, then the
+        # aliases, then the names of the star import, so the last binding wins
+        path, aliases, star = group
+        if star:
+            found, value = _star_export(self._import(path), name)
+            if found:
+                return True, value
+        if name in aliases:
+            return True, self._import(path)
+        if name == path.split(".")[0]:
+            return True, self._import(name)
+        return False, None
+
+    def resolve(self, name):
+        try:
+            return self.resolved[name]
+        except KeyError:
+            if self.loaded:
+                raise AttributeError(
+                    f"module {self.name!r} has no attribute {name!r}"
+                ) from None
+        # a later import statement overrides the names bound by an earlier one, so
+        # the groups are searched from the last, unless no two groups bind the same
+        # name to different objects, in which case the groups after the first one
+        # binding the name needn't be imported
+        if self.disjoint:
+            # the submodules and their aliases are found without importing anything
+            groups = [(path, aliases, False) for path, aliases, _ in self.groups]
+            groups += [group for group in self.groups if group[2]]
+        else:
+            groups = reversed(self.groups)
+        for group in groups:
+            found, value = self._binds(group, name)
+            if found:
+                break
+        else:
+            # the submodules imported along the way are bound in the namespace too
+            value = sys.modules.get(self.name + "." + name)
+            if value is None or value.__name__ in _packages:
+                raise AttributeError(f"module {self.name!r} has no attribute {name!r}")
+            self.submodules.add(name)
+        self.resolved[name] = value
+        return value
+
+    def star_export(self, name):
+        if name.startswith("_"):
+            return False, None
+        try:
+            value = self.resolve(name)
+        except AttributeError:
+            return False, None
+        if name in self.submodules and value.__name__ not in _imported:
+            return False, None
+        return not self.api_only or is_api(name, value), value
+
+    def load(self):
+        if self.loaded:
+            return
+        bindings = dict()
+        for path, aliases, star in self.groups:
+            module = self._import(path)
+            head = path.split(".")[0]
+            bindings[head] = self._import(head)
+            bindings.update(dict.fromkeys(aliases, module))
+            if star:
+                bindings.update(_star_bindings(module))
+        # so are the submodules the groups import, but not the lazy subpackages, which
+        # only the parent packages import when loading eagerly
+        namespace = sys.modules[self.name].__dict__
+        for name, value in namespace.items():
+            if (
+                isinstance(value, types.ModuleType)
+                and value.__name__ == self.name + "." + name
+                and value.__name__ not in _packages
+                and value.__name__ in _imported
+            ):
+                bindings.setdefault(name, value)
+        self.resolved.update(bindings)
+        self.bound = list(bindings)
+        for name, value in bindings.items():
+            namespace.setdefault(name, value)
+        # every name the groups bind is resolved now, anything else is missing
+        self.loaded = True
+
+    def star_names(self):
+        return [
+            name
+            for name in self.bound
+            if not name.startswith("_")
+            and (not self.api_only or is_api(name, self.resolved[name]))
+        ]
+
+    def getattr(self, name):
+        namespace = sys.modules[self.name].__dict__
+        if name == "__all__":
+            self.load()
+            if not self.api_only:
+                # the star import falls back to the public names of the namespace
+                raise AttributeError(name)
+            namespace["__all__"] = self.star_names()
+            return namespace["__all__"]
+        if name.startswith("_"):
+            raise AttributeError(f"module {self.name!r} has no attribute {name!r}")
+        namespace[name] = self.resolve(name)
+        return namespace[name]
+
+    def dir(self):
+        self.load()
+        return list(sys.modules[self.name].__dict__)
+
+
+def lazy_package(name, groups, api_only=False, disjoint=False):
+    """Defers the imports of the package `name` to the first access of the names they
+    bind.
+
+    Parameters
+    ----------
+    name
+        the name of the package.
+    groups
+        the ``(submodule, aliases, star)`` triples of the import statements the
+        package runs when loading eagerly, in order. `submodule` is relative to the
+        package, `aliases` are the names the submodule itself is bound to, and `star`
+        is whether all of its names are imported as well.
+    api_only
+        whether the package only exports the names which :func:`is_api` accepts from
+        star imports, as set in its ``__all__`` when loading eagerly.
+    disjoint
+        whether no two of the groups bind the same name to different objects, such
+        that a name can be resolved without importing the groups after the first one
+        which binds it.
+
+    Returns
+    -------
+    ret
+        the ``__getattr__`` and ``__dir__`` functions of the package.
+    """
+    package = _packages[name] = _LazyPackage(name, groups, api_only, disjoint)
+    return package.getattr, package.dir
+
+
+class DeferredMixins(abc.ABCMeta):
+    """Metaclass of the data classes, which attaches their mixins on the first
+    instantiation or lookup of a missing class attribute. Both hooks are removed
+    once the mixins are attached."""
+
+    def __call__(cls, *args, **kwargs):
+        load()
+        return type.__call__(cls, *args, **kwargs)
+
+    def __getattr__(cls, name):
+        if name.startswith("__") or _attached:
+            raise AttributeError(
+                f"type object {cls.__name__!r} has no attribute {name!r}"
+            )
+        load()
+        return getattr(cls, name)
+
+
+def defer_mixins(cls, mixins):
+    """Records the mixins to attach to `cls`, which was created with the
+    :class:`DeferredMixins` metaclass.
+
+    Parameters
+    ----------
+    cls
+        the data class.
+    mixins
+        the ``"submodule.ClassName"`` paths of the mixins relative to the package of
+        `cls`, in the order of the bases of `cls` when loading eagerly.
+    """
+    _mixins[cls] = mixins
+
+
+# the attributes every class has, which aren't methods of the mixins
+_class_attributes = (
+    "__abstractmethods__",
+    "__dict__",
+    "__doc__",
+    "__module__",
+    "__qualname__",
+    "__slots__",
+    "__weakref__",
+    "_abc_impl",
+)
+
+
+def _attach_mixins():
+    for cls, mixins in _mixins.items():
+        package = cls.__module__.rpartition(".")[0]
+        bases = []
+        for mixin in mixins:
+            path, _, class_name = mixin.rpartition(".")
+            module = importlib.import_module(package + "." + path)
+            bases.append(getattr(module, class_name))
+        # the methods are set on the class itself, each resolved as it would be
+        # through the bases of the class when loading eagerly
+        found = set(vars(cls)).union(_class_attributes)
+        for base in type("_", tuple(bases), {}).__mro__[1:]:
+            for name, value in vars(base).items():
+                if name not in found and base not in cls.__mro__:
+                    setattr(cls, name, value)
+                found.add(name)
+    # the data classes are complete, and are instantiated as any other class
+    del DeferredMixins.__call__
+    del DeferredMixins.__getattr__
+    groups = [getattr(ivy, group) for group in core_groups]
+    array_groups = [groups[0], ivy.arr_conversions, *groups[1:]]
+    container_groups = [groups[0], ivy.cont_conversions, *groups[1:]]
+    ivy.add_ivy_array_instance_methods(ivy.Array, array_groups)
+    ivy.add_ivy_container_instance_methods(ivy.Container, container_groups)
+    ivy.add_ivy_container_instance_methods(ivy.Container, container_groups, static=True)
+
+
+def initialized():
+    """Records the modules imported by ivy itself, called once the import of the
+    ivy package completes."""
+    _imported.update(sys.modules)
+
+
+def load():
+    """Imports everything that lazy loading deferred, and attaches the mixins of the
+    data classes. Does nothing if lazy loading isn't enabled, or was already
+    completed."""
+    global _attached
+    if not enabled or _attached:
+        return
+    _attached = True
+    _packages["ivy"].load()
+    _attach_mixins()
@@ -0,0 +1,193 @@
+"""Index of the devices and data types supported by each function.
+
+Queries such as :func:`ivy.function_supported_dtypes` parse the source of every
+compositional function they recurse into, so their results are memoised here per
+backend and backend version. The index for the whole API can also be dumped to and
+loaded from disk, for instance from the command line::
+
+    python -m ivy.utils.support_matrix --backend numpy --output numpy.json
+"""
+
+# global
+import argparse
+import functools
+import inspect
+import json
+import sys
+import weakref
+
+# local
+import ivy
+
+
+# (backend, backend version) -> {fn: {(query, recurse): result}}, with the functions
+# held by weak references, so functions which are wrapped or compiled on the fly
+# aren't kept alive by their memoised results
+_support_matrix = dict()
+
+_QUERIES = (
+    "function_supported_dtypes",
+    "function_unsupported_dtypes",
+    "function_supported_devices",
+    "function_unsupported_devices",
+    "function_supported_devices_and_dtypes",
+    "function_unsupported_devices_and_dtypes",
+)
+
+
+def _backend_key():
+    version = ivy.backend_version
+    if isinstance(version, dict):
+        version = version["version"]
+    return ivy.current_backend_str(), version
+
+
+def _clear_support_matrix(backend_str=None):
+    """Drops the memoised results of `backend_str`, or of every backend if None."""
+    for key in list(_support_matrix):
+        if backend_str is None or key[0] == backend_str:
+            del _support_matrix[key]
+
+
+def _backend_table(key):
+    try:
+        return _support_matrix[key]
+    except KeyError:
+        return _support_matrix.setdefault(key, weakref.WeakKeyDictionary())
+
+
+def _copy_result(result):
+    return dict(result) if isinstance(result, dict) else result
+
+
+def _memoize_support_query(query):
+    """Memoises `query`, for the current backend and backend version."""
+
+    @functools.wraps(query)
+    def _query(fn, recurse=True):
+        table = _backend_table(_backend_key())
+        try:
+            fn_table = table.setdefault(fn, dict())
+        except TypeError:
+            # unhashable callables, or ones which can't be weakly referenced,
+            # can't be indexed
+            return query(fn, recurse=recurse)
+        key = (query.__name__, recurse)
+        try:
+            result = fn_table[key]
+        except KeyError:
+            result = fn_table[key] = query(fn, recurse=recurse)
+        return _copy_result(result)
+
+    return _query
+
+
+def _api_function_names():
+    return sorted(
+        name
+        for name, obj in ivy.functional.ivy.__dict__.items()
+        if not name.startswith("_")
+        and inspect.isfunction(obj)
+        and obj.__module__.startswith("ivy.functional.ivy")
+    )
+
+
+def _to_json(result):
+    if isinstance(result, dict):
+        return {str(k): _to_json(v) for k, v in result.items()}
+    return sorted(str(v) for v in result)
+
+
+def _from_json(query, result, dtypes):
+    if isinstance(result, dict):
+        return {
+            device: tuple(dtypes[dtype] for dtype in device_dtypes)
+            for device, device_dtypes in result.items()
+        }
+    if query.endswith("dtypes"):
+        return tuple(dtypes[v] for v in result)
+    return tuple(result)
+
+
+def dump_support_matrix(path=None):
+    """Computes the support matrix of every function of the API for the current
+    backend.
+
+    Parameters
+    ----------
+    path
+        file to write the matrix to as json, if any.
+
+    Returns
+    -------
+    ret
+        dict holding the backend, its version and the result of every support
+        query for each function, keyed by function name.
+    """
+    functions = dict()
+    for name in _api_function_names():
+        fn = getattr(ivy, name, None)
+        if fn is None:
+            continue
+        try:
+            functions[name] = {
+                query: _to_json(getattr(ivy, query)(fn)) for query in _QUERIES
+            }
+        except Exception:
+            # functions whose support can't be resolved are left out
+            continue
+    backend_str, backend_version = _backend_key()
+    matrix = {
+        "backend": backend_str,
+        "backend_version": backend_version,
+        "functions": functions,
+    }
+    if path is not None:
+        with open(path, "w") as f:
+            json.dump(matrix, f, indent=1)
+    return matrix
+
+
+def load_support_matrix(path):
+    """Loads a support matrix written by :func:`dump_support_matrix`, such that the
+    support queries of its functions are answered from it.
+
+    Parameters
+    ----------
+    path
+        the json file holding the matrix.
+    """
+    with open(path) as f:
+        matrix = json.load(f)
+    key = (matrix["backend"], matrix["backend_version"])
+    ivy.utils.assertions.check_true(
+        key == _backend_key(),
+        "the support matrix of {} doesn't match the current backend".format(key),
+    )
+    table = _backend_table(key)
+    dtypes = {str(dtype): dtype for dtype in ivy.all_dtypes}
+    for name, results in matrix["functions"].items():
+        fn = getattr(ivy, name, None)
+        if fn is None:
+            continue
+        fn_table = table.setdefault(fn, dict())
+        for query, result in results.items():
+            fn_table[(query, True)] = _from_json(query, result, dtypes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Dump the devices and data types supported by the ivy API."
+    )
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--output", help="json file to write, stdout by default")
+    args = parser.parse_args(argv)
+
+    ivy.set_backend(args.backend)
+    matrix = dump_support_matrix(args.output)
+    if args.output is None:
+        json.dump(matrix, sys.stdout, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,7 @@ mod_backend = {
 ground_backend = None  # multiversion
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers.test_parameter_flags as pf
 from ivy import DefaultDevice
 from ivy import set_exception_trace_mode
@@ -58,6 +59,10 @@ def pytest_configure(config):
     # Pytest traceback
     config.option.tbstyle = config.getoption("--tb")
 
+    # the test helpers look functions up in the namespaces of the ivy packages, so
+    # everything that lazy loading deferred is imported before collecting the tests
+    ivy.utils.lazy_import.load()
+
     # device
     raw_value = config.getoption("--device")
     if raw_value == "all":
@@ -0,0 +1,34 @@
+# global
+import numpy as np
+
+# local
+import ivy
+import ivy.functional.frontends.torch as torch_frontend
+
+
+def _sparse_and_dense():
+    dense = np.array([[0, 2, 0], [1, 0, 3], [0, 0, 0]], dtype="float32")
+    rows, cols = np.nonzero(dense)
+    sparse = torch_frontend.sparse_coo_tensor(
+        np.stack([rows, cols]), dense[rows, cols], dense.shape
+    )
+    return sparse, dense
+
+
+# mm
+def test_torch_sparse_mm():
+    sparse, dense = _sparse_and_dense()
+    mat2 = np.arange(6, dtype="float32").reshape((3, 2))
+    ret = torch_frontend.sparse.mm(sparse, torch_frontend.tensor(mat2))
+    assert isinstance(ret, torch_frontend.Tensor)
+    assert np.array_equal(ivy.to_numpy(ret.ivy_array), dense @ mat2)
+    ret = torch_frontend.mm(sparse.to_csr_array(), torch_frontend.tensor(mat2))
+    assert np.array_equal(ivy.to_numpy(ret.ivy_array), dense @ mat2)
+
+
+# sum
+def test_torch_sparse_sum():
+    sparse, dense = _sparse_and_dense()
+    for dim in [None, 0, 1, (0, 1)]:
+        ret = torch_frontend.sparse.sum(sparse, dim=dim)
+        assert np.array_equal(ivy.to_numpy(ret.ivy_array), np.sum(dense, axis=dim))
@@ -1,6 +1,7 @@
 """Collection of tests for unified dtype functions."""
 
 # global
+import gc
 import numpy as np
 import importlib
 from hypothesis import strategies as st
@@ -10,6 +11,8 @@ import typing
 import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_test
+from ivy.utils import support_matrix
+from ivy.functional.ivy.data_type import _get_function_list
 
 
 # dtype objects
@@ -940,6 +943,43 @@ def test_function_unsupported_dtypes(*, func):
     assert set(tuple(exp)) == set(res)
 
 
+def test_support_matrix(tmp_path):
+    supported = ivy.function_supported_dtypes(_composition_1)
+    assert ivy.function_supported_dtypes(_composition_1) == supported
+    path = str(tmp_path / "support_matrix.json")
+    matrix = support_matrix.dump_support_matrix(path)
+    assert matrix["backend"] == ivy.current_backend_str()
+    expected = {
+        query: getattr(ivy, query)(ivy.linear) for query in support_matrix._QUERIES
+    }
+    support_matrix._clear_support_matrix()
+    support_matrix.load_support_matrix(path)
+    for query, result in expected.items():
+        loaded = getattr(ivy, query)(ivy.linear)
+        if isinstance(result, dict):
+            assert {k: set(v) for k, v in loaded.items()} == {
+                k: set(v) for k, v in result.items()
+            }
+        else:
+            assert set(loaded) == set(result)
+
+
+def test_support_matrix_releases_functions():
+    def _fn(x):
+        return ivy.abs(x)
+
+    ivy.function_supported_dtypes(_fn)
+    table = support_matrix._support_matrix[support_matrix._backend_key()]
+    assert _fn in table
+    num_fns = len(table)
+    # the memoised results don't keep the function alive, unlike the bounded cache
+    # of the parsed source of the functions
+    del _fn
+    _get_function_list.cache_clear()
+    gc.collect()
+    assert len(table) == num_fns - 1
+
+
 # function_dtype_versioning
 @handle_test(
     fn_tree="functional.ivy.function_unsupported_dtypes",  # dummy fn_tree
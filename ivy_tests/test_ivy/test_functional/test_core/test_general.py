@@ -28,8 +28,10 @@ except ImportError:
     multiprocessing = SimpleNamespace()
 
 # local
+import asyncio
 import threading
 import ivy
+from ivy_tests.test_ivy.helpers.available_frameworks import available_frameworks
 
 try:
     import ivy.functional.backends.jax
@@ -1014,6 +1016,124 @@ def test_framework_setting_with_threading():
     assert not thread.join()
 
 
+def test_mode_stacks_with_threading():
+    barrier = threading.Barrier(2)
+    results = dict()
+
+    def thread_fn(float_dtype, array_mode):
+        ivy.set_default_float_dtype(float_dtype)
+        ivy.set_array_mode(array_mode)
+        # both threads have pushed their modes before either reads or pops them
+        barrier.wait()
+        results[float_dtype] = (ivy.default_float_dtype(), ivy.get_array_mode())
+        barrier.wait()
+        ivy.unset_array_mode()
+        ivy.unset_default_float_dtype()
+
+    float_dtype_stack = ivy.default_float_dtype_stack.copy()
+    array_mode_stack = ivy.array_mode_stack.copy()
+    ivy.set_nestable_mode(False)
+    threads = [
+        threading.Thread(target=thread_fn, args=("float16", False)),
+        threading.Thread(target=thread_fn, args=("float64", True)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {"float16": ("float16", False), "float64": ("float64", True)}
+    # the modes set in the threads don't leak into the main thread
+    assert ivy.default_float_dtype_stack == float_dtype_stack
+    assert ivy.array_mode_stack == array_mode_stack
+    # the modes set in the main thread are seen by the other threads
+    thread = threading.Thread(
+        target=lambda: results.update(nestable=ivy.get_nestable_mode())
+    )
+    thread.start()
+    thread.join()
+    ivy.unset_nestable_mode()
+    assert results["nestable"] is False
+
+
+def test_mode_stacks_with_asyncio():
+    async def task_fn(int_dtype):
+        ivy.set_default_int_dtype(int_dtype)
+        await asyncio.sleep(0)
+        ret = ivy.default_int_dtype()
+        ivy.unset_default_int_dtype()
+        return ret
+
+    async def main():
+        return await asyncio.gather(task_fn("int8"), task_fn("int16"))
+
+    int_dtype_stack = ivy.default_int_dtype_stack.copy()
+    assert asyncio.run(main()) == ["int8", "int16"]
+    assert ivy.default_int_dtype_stack == int_dtype_stack
+
+
+def test_backend_with_threading():
+    fw = ivy.current_backend_str()
+    backends = [fw] + [b for b in available_frameworks() if b != fw][:1]
+    barrier = threading.Barrier(len(backends) + 1, timeout=60)
+    results = dict()
+
+    def thread_fn(backend):
+        ivy.set_backend(backend)
+        # all the threads have set their backends before any uses or unsets them
+        barrier.wait()
+        x = ivy.mean(ivy.array([0.0, 1.0, 2.0]))
+        results[backend] = (
+            ivy.current_backend_str(),
+            type(ivy.to_native(x)).__module__.startswith(backend),
+        )
+        barrier.wait()
+        ivy.previous_backend()
+        results[backend] += (ivy.current_backend_str(),)
+
+    threads = [threading.Thread(target=thread_fn, args=(b,)) for b in backends]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    # the main thread keeps its own backend meanwhile
+    x = ivy.mean(ivy.array([0.0, 1.0, 2.0]))
+    assert ivy.current_backend_str() == fw
+    assert type(ivy.to_native(x)).__module__.startswith(fw)
+    barrier.wait()
+    for thread in threads:
+        thread.join()
+
+    assert results == {backend: (backend, True, fw) for backend in backends}
+    # once the threads are done, the backends of the main thread rewrite the
+    # namespace again
+    ivy.set_backend(fw)
+    assert ivy.add.__module__.startswith("ivy.functional.backends.")
+    ivy.previous_backend()
+    assert ivy.current_backend_str() == fw
+
+
+def test_backend_with_asyncio():
+    fw = ivy.current_backend_str()
+    backends = [fw] + [b for b in available_frameworks() if b != fw][:1]
+
+    async def task_fn(backend):
+        ivy.set_backend(backend)
+        await asyncio.sleep(0)
+        x = ivy.mean(ivy.array([0.0, 1.0, 2.0]))
+        ret = (
+            ivy.current_backend_str(),
+            type(ivy.to_native(x)).__module__.startswith(backend),
+        )
+        ivy.previous_backend()
+        return ret
+
+    async def main():
+        return await asyncio.gather(*(task_fn(backend) for backend in backends))
+
+    assert asyncio.run(main()) == [(backend, True) for backend in backends]
+    assert ivy.current_backend_str() == fw
+
+
 def test_framework_setting_with_multiprocessing():
     if ivy.current_backend_str() == "numpy":
         # Numpy is the conflicting framework being tested against
@@ -2143,6 +2263,83 @@ def test_vmap(func, dtype_and_arrays_and_axes, in_axes_as_cont):
         assert False, "One of the results is None while other isn't"
 
 
+@pytest.mark.parametrize(
+    ("func", "in_axes", "traced"),
+    [
+        (
+            lambda x, w: ivy.sum(ivy.tanh(x @ ivy.matrix_transpose(w)), axis=-1),
+            (0, None),
+            True,
+        ),
+        (lambda x, w: ivy.softmax(x * w, axis=0) * 2.0 + 1, (1, None), True),
+        (
+            lambda x, w: ivy.argmax(ivy.permute_dims(x, (1, 0)), axis=0),
+            (0, None),
+            True,
+        ),
+        (lambda x, w: ivy.reshape(x[..., 1:], (-1,)) - ivy.mean(x), (0, None), True),
+        (lambda x, w: ivy.matmul(w, ivy.matrix_transpose(x)), (0, 0), True),
+        # not supported by the numpy backend's batching rules, so it's vectorized by
+        # calling the function for each sample
+        (lambda x, w: ivy.vecdot(x, w), (0, 0), False),
+    ],
+)
+def test_vmap_per_sample(func, in_axes, traced, monkeypatch):
+    x = ivy.random_uniform(shape=(4, 3, 5))
+    w = ivy.random_uniform(shape=(4, 5))
+    args = (x, w)
+    traced_results = []
+    if ivy.current_backend_str() == "numpy":
+        # records whether the numpy backend vectorized func by tracing it
+        from ivy.functional.backends.numpy import general as np_general
+
+        vmap_traced = np_general._vmap_traced
+
+        def _record_vmap_traced(*args):
+            traced_results.append(vmap_traced(*args))
+            return traced_results[-1]
+
+        monkeypatch.setattr(np_general, "_vmap_traced", _record_vmap_traced)
+    ret = ivy.vmap(func, in_axes=in_axes)(*args)
+    if ivy.current_backend_str() == "numpy":
+        assert len(traced_results) == 1
+        assert (traced_results[0] is not None) == traced
+    batch_size = x.shape[in_axes[0]]
+    expected = np.stack(
+        [
+            ivy.to_numpy(
+                func(
+                    *[
+                        arg if axis is None else ivy.gather(arg, i, axis=axis)
+                        for arg, axis in zip(args, in_axes)
+                    ]
+                )
+            )
+            for i in range(batch_size)
+        ]
+    )
+    assert np.allclose(ivy.to_numpy(ret), expected, rtol=1e-5, atol=1e-5)
+
+
+def test_vmap_raises():
+    calls = []
+
+    def func(x):
+        calls.append(x)
+        raise ValueError("not an unsupported operation")
+
+    # an error of the function itself isn't taken as the function being untraceable,
+    # so the function isn't called again for each sample
+    with pytest.raises(ValueError):
+        ivy.vmap(func)(ivy.ones((3, 2)))
+    if ivy.current_backend_str() == "numpy":
+        assert len(calls) == 1
+
+    # the array methods can't be traced, so they're called for each sample
+    ret = ivy.vmap(lambda x: x.sum())(ivy.ones((3, 2)))
+    assert np.allclose(ivy.to_numpy(ret), np.full((3,), 2.0))
+
+
 @st.composite
 def _isin_data_generation_helper(draw):
     assume_unique = draw(st.booleans())
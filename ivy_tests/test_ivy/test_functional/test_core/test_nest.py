@@ -1,6 +1,7 @@
 """Collection of tests for unified general functions."""
 
 # global
+import collections
 import copy
 import warnings
 import pytest
@@ -503,3 +504,44 @@ def test_duplicate_array_index_chains(nest, x, y):
 def test_prune_empty(nest):
     ret = ivy.prune_empty(ivy.copy_nest(nest))
     assert ret == {"b": {"c": [1]}}
+
+
+# tree_flatten and tree_unflatten
+@pytest.mark.parametrize(
+    "nest",
+    [
+        {"a": [1, 2], "b": (3, {"c": 4}), "d": []},
+        [slice(1, 5), (6,), 7],
+        8,
+    ],
+)
+def test_tree_flatten_and_unflatten(nest):
+    leaves, treedef = ivy.tree_flatten(nest)
+    assert treedef.num_leaves == len(leaves)
+    assert len(treedef.key_chains) == len(leaves)
+    assert ivy.tree_unflatten(treedef, leaves) == nest
+    # nests of the same structure share their tree definition
+    _, other_treedef = ivy.tree_flatten(copy.deepcopy(nest))
+    assert other_treedef is treedef
+    assert hash(other_treedef) == hash(treedef)
+    ret = ivy.tree_unflatten(treedef, [str(x) for x in leaves])
+    assert ret == ivy.nested_map(copy.deepcopy(nest), str)
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.tree_unflatten(treedef, leaves + [0])
+
+
+def test_tree_flatten_w_include_derived():
+    point = collections.namedtuple("point", ["x", "y"])
+    nest = {"p": point(1, [2, 3]), "q": (4,)}
+    leaves, treedef = ivy.tree_flatten(nest)
+    assert leaves == [point(1, [2, 3]), 4]
+    assert treedef.key_chains == ("p", "q/0")
+    leaves, treedef = ivy.tree_flatten(nest, include_derived={tuple: True})
+    assert leaves == [1, 2, 3, 4]
+    assert treedef.key_chains == ("p/0", "p/1/0", "p/1/1", "q/0")
+    ret = ivy.tree_unflatten(treedef, [-x for x in leaves])
+    assert ret == {"p": point(-1, [-2, -3]), "q": (-4,)}
+    assert isinstance(ret["p"], point)
+    _, ignored_treedef = ivy.tree_flatten(nest, include_derived=True, to_ignore=list)
+    assert ignored_treedef.num_leaves == 3
+    assert ignored_treedef != treedef
@@ -2,6 +2,8 @@
 
 # global
 from hypothesis import strategies as st
+import numpy as np
+import pytest
 
 # local
 import ivy
@@ -215,6 +217,46 @@ def test_multinomial(
         assert u.shape == v.shape
 
 
+@pytest.mark.parametrize("replace", [True, False])
+def test_multinomial_seeded_and_distribution(replace):
+    probs = ivy.array([[0.1, 0.2, 0.3, 0.4], [0.7, 0.2, 0.1, 0.0]])
+    ret = ivy.multinomial(4, 3, batch_size=2, probs=probs, replace=replace, seed=5)
+    assert ret.shape == (2, 3)
+    assert np.array_equal(
+        ivy.to_numpy(ret),
+        ivy.to_numpy(
+            ivy.multinomial(4, 3, batch_size=2, probs=probs, replace=replace, seed=5)
+        ),
+    )
+    rets = []
+    for _ in range(2):
+        ivy.seed(seed_value=3)
+        rets.append(ivy.to_numpy(ivy.multinomial(4, 3, probs=probs, replace=replace)))
+    assert np.array_equal(rets[0], rets[1])
+    if not replace:
+        # without replacement, a row has no repeated or zero probability samples
+        assert all(len(set(row)) == 3 for row in rets[0])
+        assert 3 not in rets[0][1]
+    # the frequencies of the classes, with or without replacement for the first
+    # sample of each row, follow the probabilities
+    num_rows = 5000
+    num_samples = 4 if replace else 1
+    samples = ivy.to_numpy(
+        ivy.multinomial(
+            4,
+            num_samples,
+            probs=ivy.tile(probs, (num_rows, 1)),
+            replace=replace,
+            seed=7,
+        )
+    ).reshape((num_rows, 2, num_samples))
+    for row, row_probs in enumerate(ivy.to_numpy(probs)):
+        freqs = np.bincount(samples[:, row].reshape(-1), minlength=4) / (
+            num_rows * num_samples
+        )
+        assert np.allclose(freqs, row_probs, atol=0.03)
+
+
 @st.composite
 def _gen_randint_data(draw):
     dtype = draw(helpers.get_dtypes("signed_integer", full=False))
@@ -1,7 +1,10 @@
 # global
+import numpy as np
+import pytest
 from hypothesis import strategies as st
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_method
 
@@ -356,3 +359,78 @@ def test_sparse_bsr(
         class_name=class_name,
         method_name=method_name,
     )
+
+
+# coo, csr and csc - conversions
+@pytest.mark.parametrize("format", ["coo", "csr", "csc"])
+def test_sparse_format_conversions(format):
+    dense = np.array(
+        [[0, 2, 0, 0, 1], [0, 0, 0, 0, 0], [3, 0, 4, 0, 0], [0, 5, 0, 6, 7]],
+        dtype="float32",
+    )
+    rows, cols = np.nonzero(dense)
+    # coo coordinates in no particular order
+    order = np.array([5, 2, 6, 0, 3, 1, 4])
+    x = ivy.SparseArray(
+        coo_indices=np.stack([rows[order], cols[order]]),
+        values=dense[rows, cols][order],
+        dense_shape=dense.shape,
+        format="coo",
+    )
+    x = getattr(x, f"to_{format}_array")()
+    assert x.format == format
+
+    csr = x.to_csr_array()
+    assert csr.format == "csr"
+    assert np.array_equal(ivy.to_numpy(csr.crow_indices), [0, 2, 2, 4, 7])
+    assert np.array_equal(ivy.to_numpy(csr.col_indices), cols)
+    assert np.array_equal(ivy.to_numpy(csr.values), dense[rows, cols])
+
+    t_rows, t_cols = np.nonzero(dense.T)
+    csc = x.to_csc_array()
+    assert csc.format == "csc"
+    assert np.array_equal(ivy.to_numpy(csc.ccol_indices), [0, 1, 3, 4, 5, 7])
+    assert np.array_equal(ivy.to_numpy(csc.row_indices), t_cols)
+    assert np.array_equal(ivy.to_numpy(csc.values), dense.T[t_rows, t_cols])
+
+    coo = x.to_coo_array()
+    assert coo.format == "coo"
+    coo_dense = np.zeros_like(dense)
+    coo_dense[tuple(ivy.to_numpy(coo.coo_indices))] = ivy.to_numpy(coo.values)
+    assert np.array_equal(coo_dense, dense)
+
+
+# sparse_matmul, sparse_sum and scalar ops
+@pytest.mark.parametrize("format", ["coo", "csr", "csc"])
+@pytest.mark.parametrize("dtype", ["float32", "int64"])
+def test_sparse_kernels(format, dtype):
+    dense = np.array(
+        [[0, 2, 0, 0, 1], [0, 0, 0, 0, 0], [3, 0, 4, 0, 0], [0, 5, 0, 6, 7]],
+        dtype=dtype,
+    )
+    rows, cols = np.nonzero(dense)
+    x = ivy.SparseArray(
+        coo_indices=np.stack([rows, cols]),
+        values=dense[rows, cols],
+        dense_shape=dense.shape,
+        format="coo",
+    )
+    x = getattr(x, f"to_{format}_array")()
+    matrix = np.arange(15, dtype=dtype).reshape((5, 3))
+    vector = np.arange(5, dtype=dtype)
+
+    ret = ivy.sparse_matmul(x, ivy.array(matrix))
+    assert np.array_equal(ivy.to_numpy(ret), dense @ matrix)
+    ret = x @ ivy.array(vector)
+    assert np.array_equal(ivy.to_numpy(ret), dense @ vector)
+
+    for axis in [None, 0, 1, -1]:
+        ret = ivy.to_numpy(ivy.sparse_sum(x, axis=axis))
+        assert ret.shape == np.sum(dense, axis=axis).shape
+        assert np.array_equal(ret, np.sum(dense, axis=axis))
+
+    scaled = -(2 * x)
+    assert scaled.format == format
+    assert np.array_equal(ivy.to_numpy(scaled.sum(axis=1)), -2 * np.sum(dense, 1))
+    halved = x / 2
+    assert np.allclose(ivy.to_numpy(halved.sum(axis=0)), np.sum(dense, 0) / 2)
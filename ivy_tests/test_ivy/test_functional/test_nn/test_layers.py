@@ -1,9 +1,12 @@
 """Collection of tests for unified neural network layers."""
 
 # global
+import numpy as np
+import pytest
 from hypothesis import strategies as st, assume
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_test
 from ivy.functional.ivy.layers import _deconv_length
@@ -162,6 +165,7 @@ def x_and_scaled_attention(draw, dtypes):
     num_keys = draw(helpers.ints(min_value=1, max_value=2))
     feat_dim = draw(helpers.ints(min_value=1, max_value=2))
     scale = draw(helpers.floats(min_value=0.1, max_value=1))
+    chunk_size = draw(st.one_of(st.none(), helpers.ints(min_value=1, max_value=2)))
 
     q_shape = (1,) + (num_queries,) + (feat_dim,)
     k_shape = (1,) + (num_keys,) + (feat_dim,)
@@ -187,7 +191,7 @@ def x_and_scaled_attention(draw, dtypes):
             safety_factor_scale="linear",
         )
     )
-    return dtype, q, k, v, mask, scale
+    return dtype, q, k, v, mask, scale, chunk_size
 
 
 # scaled_dot_product_attention
@@ -207,7 +211,7 @@ def test_scaled_dot_product_attention(
     on_device,
     ground_truth_backend,
 ):
-    dtype, q, k, v, mask, scale = dtype_q_k_v_mask_scale
+    dtype, q, k, v, mask, scale, chunk_size = dtype_q_k_v_mask_scale
     helpers.test_function(
         ground_truth_backend=ground_truth_backend,
         input_dtypes=dtype,
@@ -222,6 +226,7 @@ def test_scaled_dot_product_attention(
         v=v,
         scale=scale,
         mask=mask,
+        chunk_size=chunk_size,
     )
 
 
@@ -232,6 +237,7 @@ def x_and_mha(draw, dtypes):
     feat_dim = draw(helpers.ints(min_value=1, max_value=3))
     num_heads = draw(helpers.ints(min_value=1, max_value=3))
     num_keys = draw(helpers.ints(min_value=1, max_value=3))
+    chunk_size = draw(st.one_of(st.none(), helpers.ints(min_value=1, max_value=2)))
 
     x_mha_shape = (num_queries,) + (feat_dim * num_heads,)
     context_shape = (num_keys,) + (2 * feat_dim * num_heads,)
@@ -261,7 +267,7 @@ def x_and_mha(draw, dtypes):
             max_value=1,
         )
     )
-    return dtype, x_mha, scale, num_heads, context, mask
+    return dtype, x_mha, scale, num_heads, context, mask, chunk_size
 
 
 # multi_head_attention
@@ -281,7 +287,7 @@ def test_multi_head_attention(
     on_device,
     ground_truth_backend,
 ):
-    dtype, x_mha, scale, num_heads, context, mask = dtype_mha
+    dtype, x_mha, scale, num_heads, context, mask, chunk_size = dtype_mha
     to_q_fn = lambda x_, v: x_
     helpers.test_function(
         ground_truth_backend=ground_truth_backend,
@@ -303,6 +309,7 @@ def test_multi_head_attention(
         to_q_v=None,
         to_kv_v=None,
         to_out_v=None,
+        chunk_size=chunk_size,
     )
 
 
@@ -912,6 +919,43 @@ def x_and_lstm(draw, dtypes):
     )
 
 
+def test_conv_im2col_tiling(monkeypatch, backend_fw):
+    # the numpy backend splits the batch into tiles when its im2col buffer would be
+    # too large, which the small inputs of the tests above never trigger
+    if backend_fw.backend != "numpy":
+        pytest.skip("im2col is only used by the numpy backend")
+    from ivy.functional.backends.numpy import layers as np_layers
+
+    rng = np.random.default_rng(0)
+    x = rng.uniform(size=(5, 7, 6, 4)).astype("float32")
+    filters = rng.uniform(size=(3, 3, 4, 6)).astype("float32")
+    depthwise_filters = rng.uniform(size=(2, 2, 4)).astype("float32")
+    grouped_filters = rng.uniform(size=(3, 2, 2, 6)).astype("float32")
+    convs = {
+        "conv2d": lambda: np_layers.conv2d(x, filters, 2, "SAME"),
+        "depthwise_conv2d": lambda: np_layers.depthwise_conv2d(
+            x, depthwise_filters, 1, "VALID", dilations=2
+        ),
+        "conv_general_dilated": lambda: np_layers.conv_general_dilated(
+            x, grouped_filters, 1, "SAME", feature_group_count=2
+        ),
+        "conv2d_transpose": lambda: np_layers.conv2d_transpose(x, filters, 2, "SAME"),
+    }
+    monkeypatch.setattr(np_layers, "_im2col_max_bytes", None)
+    expected = {name: np.array(conv()) for name, conv in convs.items()}
+    # a single sample per tile, and tiles of 2 samples which don't divide the batch
+    for max_bytes in (1, 2 * 7 * 6 * 3 * 3 * 4 * 4):
+        monkeypatch.setattr(np_layers, "_im2col_max_bytes", max_bytes)
+        for name, conv in convs.items():
+            ret = np.array(conv())
+            assert ret.shape == expected[name].shape, name
+            assert np.allclose(ret, expected[name], atol=1e-5), name
+
+    # filters taking a different number of channels than the input has
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        np_layers.conv2d(x[..., :3], filters, 1, "VALID")
+
+
 # lstm
 @handle_test(
     fn_tree="functional.ivy.lstm_update",
@@ -956,3 +1000,65 @@ def test_lstm_update(
         bias=bias,
         recurrent_bias=recurrent_bias,
     )
+
+
+def test_lstm_update_mixed_dtypes():
+    rng = np.random.default_rng(0)
+    shapes = {
+        "x": (2, 5, 3),
+        "init_h": (2, 4),
+        "init_c": (2, 4),
+        "kernel": (3, 16),
+        "recurrent_kernel": (4, 16),
+        "bias": (16,),
+        "recurrent_bias": (16,),
+    }
+    inputs = {k: rng.uniform(size=shape) for k, shape in shapes.items()}
+
+    def lstm_update(dtypes):
+        x, init_h, init_c, kernel, recurrent_kernel, bias, recurrent_bias = (
+            ivy.array(v, dtype=dtypes[k]) for k, v in inputs.items()
+        )
+        return ivy.lstm_update(
+            x,
+            init_h,
+            init_c,
+            kernel,
+            recurrent_kernel,
+            bias=bias,
+            recurrent_bias=recurrent_bias,
+        )
+
+    expected = lstm_update(dict.fromkeys(inputs, "float64"))
+    # any float64 argument promotes the float32 ones
+    for name in inputs:
+        dtypes = dict.fromkeys(inputs, "float32")
+        dtypes[name] = "float64"
+        for ret, expected_ret in zip(lstm_update(dtypes), expected):
+            assert ret.dtype == "float64", name
+            assert np.allclose(
+                ivy.to_numpy(ret), ivy.to_numpy(expected_ret), atol=1e-5
+            ), name
+
+
+def test_lstm_update_broadcast_state():
+    # initial states without a batch dimension are shared by all the sequences
+    rng = np.random.default_rng(0)
+    x = ivy.array(rng.uniform(size=(2, 5, 3)), dtype="float32")
+    init_h = ivy.array(rng.uniform(size=(1, 4)), dtype="float32")
+    init_c = ivy.array(rng.uniform(size=(1, 4)), dtype="float32")
+    kernel = ivy.array(rng.uniform(size=(3, 16)), dtype="float32")
+    recurrent_kernel = ivy.array(rng.uniform(size=(4, 16)), dtype="float32")
+
+    hts, ct = ivy.lstm_update(x, init_h, init_c, kernel, recurrent_kernel)
+    expected_hts, expected_ct = ivy.lstm_update(
+        x,
+        ivy.concat([init_h, init_h]),
+        ivy.concat([init_c, init_c]),
+        kernel,
+        recurrent_kernel,
+    )
+    assert hts.shape == (2, 5, 4)
+    assert ct.shape == (2, 4)
+    assert np.allclose(ivy.to_numpy(hts), ivy.to_numpy(expected_hts), atol=1e-5)
+    assert np.allclose(ivy.to_numpy(ct), ivy.to_numpy(expected_ct), atol=1e-5)
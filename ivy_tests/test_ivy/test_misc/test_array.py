@@ -70,6 +70,45 @@ def test_array_function():
     assert all(y1 == ivy.array([1, 1]))
 
 
+def test_array_lazy_attributes():
+    x = ivy.array([[1.0, 2.0, 3.0]])
+    # arrays don't carry an instance dict or view state until a view is created
+    assert type(x).__dictoffset__ == 0
+    assert x._view_state is None
+    assert x._base is None
+    assert x.dtype == ivy.dtype(x.data)
+    assert x.device == ivy.dev(x.data)
+    assert x.itemsize == ivy.itemsize(x.data)
+    assert x.size == 3
+    y = ivy.reshape(x, (3,))
+    assert y._base is x
+    assert len(x._view_refs) == 1 and x._view_refs[0]() is y
+    x.data = ivy.native_array([[1, 2, 3]], dtype="int32")
+    assert x.dtype == "int32"
+    assert x.itemsize == 4
+
+
+def test_array_metadata_after_set_backend(monkeypatch):
+    # the metadata is that of the backend which created the array, also when the
+    # array was created with no backend set
+    backend = ivy.current_backend_str()
+    # it's computed with the backend module, rather than a local ivy of the backend
+    monkeypatch.setattr(ivy, "with_backend", None)
+    ivy.unset_backend()
+    try:
+        x = ivy.array([1.0, 2.0])
+        ivy.set_backend("numpy")
+        y = ivy.array([1.0, 2.0])
+        ivy.set_backend("torch")
+        for arr in [x, y]:
+            assert arr.dtype == "float32"
+            assert arr.device == "cpu"
+            assert arr.itemsize == 4
+    finally:
+        ivy.unset_backend()
+        ivy.set_backend(backend)
+
+
 # TODO: avoid using dummy fn_tree in property tests
 
 
@@ -2128,6 +2128,36 @@ def test_container_multi_map(on_device):
     assert np.allclose(ivy.to_numpy(container_mapped["d"].f), 3)
 
 
+def test_container_map_sub_cont_configs(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1], device=on_device),
+            "b": Container({"c": ivy.array([2], device=on_device)}, print_limit=3),
+        },
+        print_limit=99,
+    )
+    # whether or not every leaf is mapped, the sub-containers keep their configs
+    for key_chains in (None, ["a", "b/c"]):
+        mapped = container.cont_map(lambda x, _: x + 1, key_chains=key_chains)
+        assert mapped.cont_config["print_limit"] == 99
+        assert mapped.b.cont_config["print_limit"] == 3
+        assert np.allclose(ivy.to_numpy(mapped.b.c), np.array([3]))
+
+        mapped = ivy.Container.cont_multi_map(
+            lambda x, _: x[0] + x[1], [container, container], key_chains=key_chains
+        )
+        assert mapped.cont_config["print_limit"] == 99
+        assert mapped.b.cont_config["print_limit"] == 3
+        assert np.allclose(ivy.to_numpy(mapped.b.c), np.array([4]))
+
+    # a given config applies to the sub-containers too
+    config = dict(container.cont_config, print_limit=7)
+    mapped = ivy.Container.cont_multi_map(
+        lambda x, _: x[0], [container, container], config=config
+    )
+    assert mapped.b.cont_config["print_limit"] == 7
+
+
 def test_container_common_key_chains(on_device):
     arr1 = ivy.array([1], device=on_device)
     arr2 = ivy.array([2], device=on_device)
@@ -2546,6 +2576,43 @@ def test_container_to_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+@pytest.mark.parametrize(
+    "save_kwargs",
+    [
+        {"chunks": False},
+        {"chunks": True, "compression": "gzip", "compression_opts": 4},
+        {"num_workers": 2},
+    ],
+)
+@pytest.mark.parametrize("mmap", [True, False])
+def test_container_to_and_from_disk_as_hdf5_options(
+    save_kwargs, mmap, on_device, tmp_path
+):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = str(tmp_path / "container_on_disk.hdf5")
+    container = Container(
+        {
+            "a": ivy.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], device=on_device),
+            "b": {"c": ivy.array([1, 2, 3], device=on_device)},
+        }
+    )
+    container.cont_to_disk_as_hdf5(save_filepath, **save_kwargs)
+
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath, mmap=mmap)
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), ivy.to_numpy(container.a))
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.c), ivy.to_numpy(container.b.c)
+    )
+    loaded_sliced_container = Container.cont_from_disk_as_hdf5(
+        save_filepath, slice(1, 3), mmap=mmap
+    )
+    assert np.array_equal(
+        ivy.to_numpy(loaded_sliced_container.a), ivy.to_numpy(container.a)[1:3]
+    )
+
+
 def test_container_to_disk_shuffle_and_from_disk_as_hdf5(on_device):
     if ivy.current_backend_str() == "tensorflow":
         # container disk saving requires eager execution
@@ -2642,6 +2709,105 @@ def test_container_to_and_from_disk_as_pickled(on_device):
     os.remove(save_filepath)
 
 
+def test_container_to_and_from_disk_as_flat(on_device, tmp_path):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = str(tmp_path / "container_on_disk.flat")
+    container = Container(
+        {
+            "b": ivy.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], device=on_device),
+            "a": {
+                "c": ivy.array([1, 2, 3], dtype="int16", device=on_device),
+                "d": ivy.array(True, device=on_device),
+                "e": ivy.zeros((0, 2), device=on_device),
+            },
+        }
+    )
+
+    # saving
+    container.cont_to_disk_as_flat(save_filepath, alignment=32)
+    assert os.path.getsize(save_filepath) % 32 == 0
+
+    # loading
+    loaded_container = Container.cont_from_disk_as_flat(save_filepath)
+    assert list(loaded_container.cont_to_iterator_keys()) == list(
+        container.cont_to_iterator_keys()
+    )
+    for key_chain, value in container.cont_to_iterator():
+        loaded_value = loaded_container.cont_at_key_chain(key_chain)
+        assert ivy.dtype(loaded_value) == ivy.dtype(value)
+        assert np.array_equal(ivy.to_numpy(loaded_value), ivy.to_numpy(value))
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b[1:3]), ivy.to_numpy(container.b)[1:3]
+    )
+
+    # loading a file which isn't a flat checkpoint
+    container.cont_to_disk_as_pickled(save_filepath)
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        Container.cont_from_disk_as_flat(save_filepath)
+
+
+def test_container_pack(on_device, tmp_path):
+    container = Container(
+        {
+            "b": ivy.array([[1.0, -2.0], [3.0, 4.0], [5.0, 6.0]], device=on_device),
+            "a": {
+                "c": ivy.array([3.0, 4.0], device=on_device),
+                "d": ivy.array([0.5, -1.5], dtype="float64", device=on_device),
+                "e": ivy.zeros((0, 2), device=on_device),
+            },
+        }
+    )
+    packed = container.cont_pack()
+    assert packed.cont_is_packed
+    assert not container.cont_is_packed
+    assert list(packed.cont_to_iterator_keys()) == list(
+        container.cont_to_iterator_keys()
+    )
+
+    def _assert_leaves_close(ret, expected):
+        for key_chain, value in expected.cont_to_iterator():
+            ret_value = ret.cont_at_key_chain(key_chain)
+            assert ivy.dtype(ret_value) == ivy.dtype(value)
+            assert np.allclose(ivy.to_numpy(ret_value), ivy.to_numpy(value))
+
+    # elementwise arithmetic runs on the buffers
+    ret = (packed * 2 - 1) / (1 + abs(packed)) ** 2
+    assert ret.cont_is_packed
+    _assert_leaves_close(ret, (container * 2 - 1) / (1 + abs(container)) ** 2)
+    _assert_leaves_close(packed + ret, container + ret)
+
+    # norms
+    _assert_leaves_close(
+        packed.vector_norm(ord=3),
+        container.cont_map(lambda x, _: ivy.vector_norm(x, ord=3)),
+    )
+    clipped = ivy.clip_vector_norm(packed, 2.0)
+    assert clipped.cont_is_packed
+    _assert_leaves_close(
+        clipped, container.cont_map(lambda x, _: ivy.clip_vector_norm(x, 2.0))
+    )
+
+    # device transfer, reductions and saving
+    _assert_leaves_close(packed.to_device(on_device), container)
+    assert packed.to_device(on_device).cont_is_packed
+    bools = Container(a=ivy.array([True, True]), b=ivy.array([True])).cont_pack()
+    assert bools.cont_all_true()
+    assert not bools.cont_all_false()
+    if ivy.current_backend_str() != "tensorflow":
+        save_filepath = str(tmp_path / "container_on_disk.flat")
+        packed.cont_to_disk_as_flat(save_filepath)
+        _assert_leaves_close(Container.cont_from_disk_as_flat(save_filepath), packed)
+
+    # setting a leaf unpacks the container
+    packed.a.c = ivy.array([1.0, 1.0], device=on_device)
+    assert not packed.cont_is_packed
+    _assert_leaves_close(packed + 1, packed.cont_map(lambda x, _: x + 1))
+    with pytest.raises(IvyException):
+        Container(a=ivy.array([1.0]), b="b").cont_pack()
+
+
 def test_container_to_and_from_disk_as_json(on_device):
     save_filepath = "container_on_disk.json"
     dict_in = {
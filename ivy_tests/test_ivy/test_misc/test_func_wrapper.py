@@ -37,6 +37,18 @@ def test_handle_array_like_without_promotion(fn, x, expected_type):
     assert isinstance(handle_array_like_without_promotion(fn)(x), expected_type)
 
 
+def test_handle_array_like_without_promotion_w_container():
+    # containers aren't taken for objects overriding ivy functions
+    x = ivy.Container(a=ivy.array([[1.0, 2.0]]), b=ivy.array([[3.0, 4.0]]))
+    weight = ivy.array([[1.0, 1.0]])
+    ret = ivy.linear(x, weight)
+    assert isinstance(ret, ivy.Container)
+    assert np.allclose(ivy.to_numpy(ret.a), [[3.0]])
+    assert np.allclose(ivy.to_numpy(ret.b), [[7.0]])
+    ret = ivy.stable_divide(x, 2.0)
+    assert np.allclose(ivy.to_numpy(ret.b), [[1.5, 2.0]])
+
+
 def test_outputs_to_ivy_arrays():
     assert isinstance(
         ivy.outputs_to_ivy_arrays(_fn1)(ivy.to_native(ivy.array([2.0]))), ivy.Array
@@ -145,3 +157,96 @@ def test_views(array_to_update):
     assert np.allclose(c, c_copy + 1)
     assert np.allclose(d, d_copy + 1)
     assert np.allclose(e[0], e_copy + 1)
+
+
+@pytest.mark.parametrize(
+    ("fn_name", "args", "kwargs"),
+    [
+        ("add", ([1.0, 2.0], [3.0, 4.0]), {}),
+        ("add", ([1, 2], 3), {"alpha": 2}),
+        ("concat", (([1.0], [2.0, 3.0]),), {"axis": 0}),
+        ("zeros_like", ([1, 2, 3],), {}),
+        ("ones", ((2, 3),), {"dtype": "float32"}),
+        ("sum", ([[1.0, 2.0], [3.0, 4.0]],), {"axis": 1, "keepdims": True}),
+    ],
+)
+def test_fused_wrappers(fn_name, args, kwargs):
+    fn = getattr(ivy, fn_name)
+    if not hasattr(fn, "fused_wrappers"):
+        pytest.skip("{} isn't fused for this backend".format(fn_name))
+    # the full decorator stack, which the fused dispatcher falls back to
+    stacked_fn = fn.__wrapped__
+
+    def _to_arrays(x):
+        if isinstance(x, list):
+            return ivy.array(x)
+        if isinstance(x, tuple):
+            return tuple(_to_arrays(i) for i in x)
+        return x
+
+    args = _to_arrays(args)
+    for inputs in [args, ivy.to_native(args, nested=True)]:
+        ret = fn(*inputs, **kwargs)
+        expected = stacked_fn(*inputs, **kwargs)
+        assert type(ret) is type(expected)
+        assert ret.dtype == expected.dtype
+        assert ret.shape == expected.shape
+        assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(expected))
+
+    # inputs the fused dispatcher hands over to the decorator stack
+    if fn_name in ["add", "zeros_like", "sum"]:
+        cont = ivy.Container(a=args[0], b=args[0])
+        ret = fn(cont, *args[1:], **kwargs)
+        expected = stacked_fn(cont, *args[1:], **kwargs)
+        assert ivy.Container.cont_all_true(
+            ivy.Container.cont_multi_map(
+                lambda xs, _: np.allclose(ivy.to_numpy(xs[0]), ivy.to_numpy(xs[1])),
+                [ret, expected],
+            )
+        )
+        out = ivy.zeros_like(expected)
+        ret = fn(*args, out=out, **kwargs)
+        assert ret is out
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs", "expected"),
+    [
+        ((1, [2.0, 3.0]), {"y": "a"}, False),
+        ((ivy.Container(a=1),), {}, True),
+        (([1, (2, ivy.Container(a=1))],), {}, True),
+        ((1,), {"x": {"a": [ivy.Container(a=1)]}}, True),
+        ((1,), {"x": ivy.Container(a=1)}, True),
+    ],
+)
+def test_contains_container(args, kwargs, expected):
+    ret = ivy.func_wrapper._contains_container(args, kwargs)
+    assert ret == expected
+    assert ret == (
+        ivy.nested_any(args, ivy.is_ivy_container, check_nests=True)
+        or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
+    )
+
+
+def test_versioned_attributes_cached():
+    version = {"version": "1.0.0"}
+    calls = []
+
+    def _resolve():
+        calls.append(version["version"])
+        return ivy.func_wrapper._dtype_from_version(dtypes_dict, version)
+
+    dtypes_dict = {"1.0.0 and below": ("float16",), "1.1.0 and above": ("int8",)}
+    attribute = ivy.func_wrapper._versioned_attribute_factory(_resolve, tuple, version)
+    assert tuple(attribute) == ("float16",)
+    assert tuple(attribute) == ("float16",)
+    assert len(calls) == 1
+    # resolved again for a new version
+    version["version"] = "1.2.0"
+    assert tuple(attribute) == ("int8",)
+    assert len(calls) == 2
+    # and whenever the backend is set
+    ivy.set_backend(ivy.current_backend_str() or "numpy")
+    assert tuple(attribute) == ("int8",)
+    ivy.previous_backend()
+    assert len(calls) == 3
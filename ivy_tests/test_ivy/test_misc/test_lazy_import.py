@@ -0,0 +1,142 @@
+# global
+import json
+import os
+import subprocess
+import sys
+
+
+# each test imports ivy in a fresh interpreter, as lazy loading is decided on import
+def _run(script, lazy):
+    env = dict(os.environ)
+    env.pop("IVY_BACKEND", None)
+    env["IVY_LAZY_IMPORT"] = "1" if lazy else "0"
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+    env["PYTHONPATH"] = root
+    out = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", script],
+        cwd=root,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert out.returncode == 0, out.stderr
+    return json.loads(out.stdout.splitlines()[-1])
+
+
+_NAMESPACES = """
+import abc, importlib, json, sys, types
+import ivy
+
+# a submodule imported by the user rather than by ivy
+import ivy.functional.frontends
+
+packages = [
+    "ivy",
+    "ivy.functional",
+    "ivy.functional.ivy",
+    "ivy.functional.ivy.experimental",
+    "ivy.stateful",
+]
+
+
+def describe(v):
+    if isinstance(v, types.ModuleType):
+        return v.__name__
+    if isinstance(v, (types.FunctionType, type)):
+        return v.__module__ + "." + v.__qualname__
+    return type(v).__name__
+
+
+def public(namespace):
+    return {k: describe(v) for k, v in namespace.items() if not k.startswith("_")}
+
+
+ret = dict()
+# names are looked up one at a time before anything else is loaded
+for name in NAMES:
+    package, _, attr = name.rpartition(".")
+    ret[name] = describe(getattr(importlib.import_module(package), attr))
+ivy.utils.lazy_import.load()
+for package in packages:
+    ret[package] = public(vars(sys.modules[package]))
+for package in packages[2:4]:
+    ret[package + ".__all__"] = sorted(sys.modules[package].__all__)
+# the data classes have the same members, whether the mixins are bases or not, and
+# the metaclass which attaches them lazily is an abc.ABCMeta
+for cls in (ivy.Array, ivy.Container):
+    assert isinstance(cls, abc.ABCMeta)
+    members = {name: getattr(cls, name) for name in dir(cls) if name != "__class__"}
+    ret[cls.__name__] = {
+        name: describe(getattr(v, "fget", None) or getattr(v, "__func__", v))
+        for name, v in members.items()
+    }
+print(json.dumps(ret))
+"""
+
+
+def test_lazy_import_namespace():
+    names = [
+        "ivy.add",
+        "ivy.linalg",
+        "ivy.activations",
+        "ivy.Module",
+        "ivy.helpers",
+        "ivy.eig",
+        "ivy.inf",
+        "ivy.functional.ivy.experimental.eig",
+    ]
+    script = _NAMESPACES.replace("NAMES", repr(names))
+    eager = _run(script, lazy=False)
+    lazy = _run(script, lazy=True)
+    assert eager.keys() == lazy.keys()
+    for key in eager:
+        assert eager[key] == lazy[key], key
+
+
+def test_lazy_import_defers_loading():
+    script = """
+import json, sys
+import ivy
+
+fn_group = "ivy.functional.ivy.elementwise"
+experimental_fn_group = "ivy.functional.ivy.experimental.elementwise"
+array_mixin = "ivy.data_classes.array.elementwise"
+container_mixin = "ivy.data_classes.container.elementwise"
+loaded = lambda *names: [name in sys.modules for name in names]
+
+ret = loaded(fn_group, "ivy.stateful.module")
+ivy.add
+ret += loaded(fn_group, experimental_fn_group, array_mixin)
+# the mixins are attached by the first lookup of a missing class attribute
+ivy.Container.cont_map
+ret += loaded(container_mixin)
+ret += [callable(ivy.Container.static_add)] + loaded(container_mixin, array_mixin)
+x = ivy.array([1.0, 2.0])
+ret += [float(x.add(x).sum())] + loaded(experimental_fn_group)
+print(json.dumps(ret))
+"""
+    assert _run(script, lazy=True) == [
+        False,
+        False,
+        True,
+        False,
+        False,
+        False,
+        True,
+        True,
+        True,
+        6.0,
+        True,
+    ]
+
+
+def test_lazy_import_local_ivy_is_eager():
+    script = """
+import json
+import ivy
+
+ivy.set_backend("numpy")
+local_ivy = ivy.with_backend("numpy")
+print(json.dumps(["add" in vars(local_ivy), "__getattr__" in vars(local_ivy)]))
+"""
+    assert _run(script, lazy=True) == [True, False]
@@ -0,0 +1,134 @@
+# global
+import numpy as np
+import pytest
+
+# local
+import ivy
+
+
+_ROWS = [
+    np.array([[1.0, 2.0], [3.0, 4.0]], dtype="float32"),
+    np.array([[5.0, 6.0]], dtype="float32"),
+    np.zeros((0, 2), dtype="float32"),
+    np.array([[7.0, 8.0], [9.0, 10.0], [11.0, 12.0]], dtype="float32"),
+]
+
+
+def _nested():
+    return ivy.NestedArray.nested_array([ivy.array(row) for row in _ROWS])
+
+
+def test_nested_array_packing():
+    x = _nested()
+    assert x.shape == [4, None, 2]
+    assert x.ndim == 3
+    assert np.array_equal(ivy.to_numpy(x.row_splits), [0, 2, 3, 3, 6])
+    assert np.array_equal(ivy.to_numpy(x.row_lengths), [2, 1, 0, 3])
+    assert np.array_equal(ivy.to_numpy(x.values), np.concatenate(_ROWS))
+    for row, expected in zip(x.unbind(), _ROWS):
+        assert np.array_equal(ivy.to_numpy(row), expected)
+    assert np.array_equal(ivy.to_numpy(x[3]), _ROWS[3])
+
+    rows = x[1:]
+    assert rows.shape == [3, None, 2]
+    assert np.array_equal(ivy.to_numpy(rows.row_splits), [0, 1, 1, 4])
+    for query in [slice(None, None, 2), slice(None, None, -1), slice(3, 0, -2)]:
+        rows = x[query]
+        assert isinstance(rows, ivy.NestedArray)
+        for row, expected in zip(rows.unbind(), _ROWS[query]):
+            assert np.array_equal(ivy.to_numpy(row), expected)
+        assert rows.shape[0] == len(_ROWS[query])
+    rows = x[4:]
+    assert isinstance(rows, ivy.NestedArray)
+    assert rows.shape == [0, None, 2]
+    assert rows.unbind() == ()
+    assert repr(rows) == "ivy.NestedArray([])"
+
+    y = ivy.NestedArray.from_row_lengths(x.values, [2, 1, 0, 3])
+    assert np.array_equal(ivy.to_numpy(y.row_splits), ivy.to_numpy(x.row_splits))
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.NestedArray.from_row_lengths(x.values, [2, 1])
+    with pytest.raises(RuntimeError):
+        ivy.NestedArray.nested_array([ivy.zeros((2, 2)), ivy.zeros((2, 3))])
+
+
+def test_nested_array_elementwise():
+    x = _nested()
+    expected = np.concatenate(_ROWS)
+    for ret, values in [
+        (x * 2 + 1, expected * 2 + 1),
+        (1 - x, 1 - expected),
+        (x / ivy.array([1.0, 2.0]), expected / [1.0, 2.0]),
+        (x + x, expected + expected),
+        (abs(-x), expected),
+        (x.map_values(ivy.exp), np.exp(expected)),
+    ]:
+        assert isinstance(ret, ivy.NestedArray)
+        assert np.allclose(ivy.to_numpy(ret.values), values)
+        assert np.array_equal(ivy.to_numpy(ret.row_splits), [0, 2, 3, 3, 6])
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        x + ivy.NestedArray.from_row_lengths(x.values, [3, 0, 0, 3])
+
+
+def test_nested_array_reductions():
+    x = _nested()
+    with np.errstate(invalid="ignore"):
+        mean = np.stack([row.mean(axis=0) for row in _ROWS])
+    assert np.allclose(
+        ivy.to_numpy(x.sum()), np.stack([row.sum(axis=0) for row in _ROWS])
+    )
+    assert np.allclose(ivy.to_numpy(x.mean()), mean, equal_nan=True)
+    assert np.array_equal(
+        ivy.to_numpy(x.max()),
+        [[3.0, 4.0], [5.0, 6.0], [-np.inf, -np.inf], [11.0, 12.0]],
+    )
+    assert np.array_equal(
+        ivy.to_numpy(x.min()), [[1.0, 2.0], [5.0, 6.0], [np.inf, np.inf], [7.0, 8.0]]
+    )
+
+    # rows of very different lengths, integers and nans
+    rng = np.random.default_rng(0)
+    rows = [rng.integers(-100, 100, size=n) for n in (1, 0, 37, 5, 16)]
+    y = ivy.NestedArray.nested_array([ivy.array(row) for row in rows])
+    for reduction in ["sum", "max", "min"]:
+        expected = [getattr(row, reduction)() if len(row) else None for row in rows]
+        ret = ivy.to_numpy(getattr(y, reduction)())
+        assert ret.dtype == rows[0].dtype
+        for value, expected_value in zip(ret, expected):
+            if expected_value is not None:
+                assert value == expected_value, reduction
+    assert ivy.to_numpy(y.max())[1] == ivy.iinfo(y.dtype).min
+    assert ivy.to_numpy(y.min())[1] == ivy.iinfo(y.dtype).max
+    z = ivy.NestedArray.from_row_lengths(ivy.array([1.0, np.nan, 3.0, 4.0]), [3, 1])
+    assert np.array_equal(ivy.to_numpy(z.max()), [np.nan, 4.0], equal_nan=True)
+    assert np.array_equal(ivy.to_numpy(z.min()), [np.nan, 4.0], equal_nan=True)
+
+
+def test_nested_array_padding_and_reshape():
+    x = _nested()
+    padded, mask = x.to_padded(-1)
+    assert padded.shape == (4, 3, 2)
+    assert np.array_equal(
+        ivy.to_numpy(mask),
+        [[1, 1, 0], [1, 0, 0], [0, 0, 0], [1, 1, 1]],
+    )
+    assert np.array_equal(ivy.to_numpy(padded[0, 2]), [-1.0, -1.0])
+    assert np.array_equal(ivy.to_numpy(padded[3]), _ROWS[3])
+    y = ivy.NestedArray.from_padded(padded, x.row_lengths)
+    assert np.array_equal(ivy.to_numpy(y.values), ivy.to_numpy(x.values))
+
+    flat = x.reshape([4, -1])
+    assert flat.shape == [4, None]
+    assert np.array_equal(ivy.to_numpy(flat.row_splits), [0, 4, 6, 6, 12])
+    assert x.reshape([4, -1, 1, 2]).shape == [4, None, 1, 2]
+
+
+def test_nested_array_native():
+    x = _nested()
+    if ivy.current_backend_str() not in ["tensorflow", "torch"]:
+        with pytest.raises(ivy.utils.exceptions.IvyException):
+            x.to_native()
+        return
+    y = ivy.NestedArray.from_native(x.to_native())
+    assert np.array_equal(ivy.to_numpy(y.values), ivy.to_numpy(x.values))
+    assert np.array_equal(ivy.to_numpy(y.row_splits), ivy.to_numpy(x.row_splits))
@@ -62,3 +62,51 @@ def test_with_backend_array(backend_fw):
     ivy.set_backend(backend_fw.backend)
     x = ivy.array([1, 2, 3, 4])
     assert np.allclose(x._data, local_x._data)
+
+
+def test_release_backend(backend_fw):
+    local_ivy = ivy.with_backend(backend_fw.backend)
+    default_float_dtype = local_ivy.default_float_dtype()
+    local_ivy.set_default_float_dtype("float16")
+    ivy.release_backend(local_ivy)
+    assert all(
+        local_ivy is not b for b in ivy.compiled_backends.get(backend_fw.backend, [])
+    )
+
+    # the released instance is reused, with its global modes reset
+    reused_local_ivy = ivy.with_backend(backend_fw.backend)
+    assert reused_local_ivy is local_ivy
+    assert reused_local_ivy.default_float_dtype() == default_float_dtype
+    assert ivy.with_backend(backend_fw.backend) is not reused_local_ivy
+
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.release_backend(ivy)
+
+
+def test_release_backend_then_cached(backend_fw):
+    # releasing every instance of a backend leaves a cached call something to return
+    for local_ivy in list(ivy.compiled_backends.get(backend_fw.backend, [])):
+        ivy.release_backend(local_ivy)
+    cached_local_ivy = ivy.with_backend(backend_fw.backend, cached=True)
+    assert cached_local_ivy.is_local()
+    assert ivy.with_backend(backend_fw.backend, cached=True) is cached_local_ivy
+    ivy.release_backend(cached_local_ivy)
+    x = ivy.with_backend(backend_fw.backend, cached=True).array([1.0, 2.0])
+    assert x.dtype == "float32"
+
+
+def test_compiled_code_cache(tmp_path, monkeypatch):
+    from ivy.utils.backend import ast_helpers
+
+    filename = ivy.utils.backend.handler.__file__
+    # the cache is opt-in
+    monkeypatch.delenv("IVY_CACHE_DIR", raising=False)
+    assert ast_helpers._code_cache_path(filename) is None
+    monkeypatch.setenv("IVY_CACHE_DIR", str(tmp_path / "file"))
+    (tmp_path / "file").write_text("")
+    ast_helpers._store_cached_code(filename, compile("", filename, "exec"))
+    assert ast_helpers._load_cached_code(filename) is None
+    monkeypatch.setenv("IVY_CACHE_DIR", str(tmp_path))
+    assert ast_helpers._load_cached_code(filename) is None
+    code = ast_helpers.IvyLoader(filename)._compile()
+    assert ast_helpers._load_cached_code(filename) == code
@@ -2,6 +2,7 @@
 
 # global
 import numpy as np
+import pytest
 from hypothesis import strategies as st, assume
 
 # local
@@ -314,6 +315,39 @@ def test_multi_head_attention_layer(
     assert_same_type_and_shape([ret_np_flat, ret_np_from_gt_flat])
 
 
+def test_multi_head_attention_kv_cache():
+    x = ivy.array(np.random.uniform(size=(2, 7, 6)).astype("float32"))
+    causal_mask = ivy.tril(ivy.ones((7, 7))) > 0
+    layer = ivy.MultiHeadAttention(6, num_heads=2, head_dim=3)
+    expected = ivy.to_numpy(layer(x, mask=causal_mask))
+
+    # a prompt of three steps, then one step at a time
+    layer.init_kv_cache((2,), 8)
+    decoded = [layer(x[:, :3], use_kv_cache=True)]
+    decoded += [layer(x[:, i : i + 1], use_kv_cache=True) for i in range(3, 7)]
+    assert np.allclose(ivy.to_numpy(ivy.concat(decoded, axis=1)), expected, atol=1e-5)
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        layer(x[:, :2], use_kv_cache=True)
+
+    chunked = ivy.MultiHeadAttention(
+        6, num_heads=2, head_dim=3, chunk_size=3, v=layer.v
+    )
+    assert np.allclose(ivy.to_numpy(chunked(x, mask=causal_mask)), expected, atol=1e-5)
+
+
+def test_multi_head_attention_kv_cache_cross_attention():
+    x = ivy.array(np.random.uniform(size=(2, 1, 6)).astype("float32"))
+    context = ivy.array(np.random.uniform(size=(2, 4, 8)).astype("float32"))
+    layer = ivy.MultiHeadAttention(6, num_heads=2, head_dim=3, context_dim=8)
+    expected = ivy.to_numpy(layer(x, context=context))
+
+    # the single query comes after all the steps of the context
+    layer.init_kv_cache((2,), 4)
+    ret = layer(x, context=context, use_kv_cache=True)
+    assert ret.shape == (2, 1, 6)
+    assert np.allclose(ivy.to_numpy(ret), expected, atol=1e-5)
+
+
 # Convolutions #
 # -------------#
 
@@ -956,6 +990,26 @@ def test_lstm_layer(
     )
 
 
+def test_lstm_layer_streaming():
+    x = ivy.array(np.random.uniform(size=(2, 7, 3)).astype("float32"))
+    layer = ivy.LSTM(3, 4, num_layers=2)
+    expected, (expected_h, expected_c) = layer(x)
+
+    streaming = ivy.LSTM(3, 4, num_layers=2, streaming=True, v=layer.v)
+    chunks = [streaming(x[:, i : i + 3])[0] for i in range(0, 7, 3)]
+    assert np.allclose(
+        ivy.to_numpy(ivy.concat(chunks, axis=1)), ivy.to_numpy(expected), atol=1e-5
+    )
+    h, c = streaming._state
+    for h_n, c_n, expected_h_n, expected_c_n in zip(h, c, expected_h, expected_c):
+        assert np.allclose(ivy.to_numpy(h_n), ivy.to_numpy(expected_h_n), atol=1e-5)
+        assert np.allclose(ivy.to_numpy(c_n), ivy.to_numpy(expected_c_n), atol=1e-5)
+
+    # a new sequence starts from the initial state again
+    streaming.reset_state()
+    assert np.allclose(ivy.to_numpy(streaming(x)[0]), ivy.to_numpy(expected), atol=1e-5)
+
+
 # # Sequential #
 @handle_method(
     method_tree="Sequential.__call__",
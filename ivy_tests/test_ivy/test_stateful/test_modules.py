@@ -847,6 +847,37 @@ def test_module_check_submod_rets(
         pass
 
 
+# untracked calls
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_module_untracked_call(batch_shape, input_channels, output_channels, on_device):
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+        "float32",
+    )
+    module = WithNestedModules(input_channels, output_channels, device=on_device)
+
+    # no tracking state is allocated unless tracking is requested
+    ret = module(x)
+    assert ret.shape == tuple(list(batch_shape) + [64])
+    for mod in [module, module._dl0, module._dl1, module._dl0._l0]:
+        assert mod._submod_rets is None
+        assert mod._submod_call_order is None
+
+    # tracked returns are dropped by the next untracked call
+    module(x, track_submod_rets=True)
+    assert module._dl0.get_mod_key() in module.submod_rets
+    module(x)
+    assert module._submod_rets is None
+    assert isinstance(module.submod_rets, ivy.Container)
+    assert not module.submod_rets
+
+
 # track submod call order
 @given(
     batch_shape=helpers.get_shape(
@@ -2,9 +2,12 @@
 """Collection of tests for Ivy optimizers."""
 
 # global
+import numpy as np
+import pytest
 from hypothesis import strategies as st
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_method
 from ivy_tests.test_ivy.test_functional.test_core.test_gradients import (
@@ -244,3 +247,54 @@ def test_lamb_optimizer(
         xs_grad_idxs=xs_grad_idxs,
         on_device=on_device,
     )
+
+
+# foreach
+@pytest.mark.parametrize(
+    ("optimizer_class", "kwargs"),
+    [
+        ("SGD", {}),
+        ("LARS", {"decay_lambda": 0.1}),
+        ("Adam", {}),
+        ("LAMB", {"decay_lambda": 0.1, "max_trust_ratio": 2}),
+    ],
+)
+@pytest.mark.parametrize("stop_gradients", [True, False])
+def test_optimizer_foreach(optimizer_class, kwargs, stop_gradients):
+    def _random_container():
+        return ivy.Container(
+            a=ivy.array(np.random.normal(size=(3, 4)).astype("float32")),
+            b={
+                "c": ivy.array(np.random.normal(size=(5,)).astype("float32")),
+                "d": ivy.array(np.random.normal(size=(2, 2)).astype("float64")),
+            },
+        )
+
+    v = _random_container()
+    grads = [_random_container() for _ in range(3)]
+    optimizer = getattr(ivy, optimizer_class)(
+        lr=0.1, stop_gradients=stop_gradients, foreach=True, **kwargs
+    )
+    new_v = v
+    for g in grads:
+        new_v = optimizer.step(new_v, g)
+
+    # each variable stepped on its own
+    for kc, x in v.cont_to_iterator():
+        leaf_optimizer = getattr(ivy, optimizer_class)(
+            lr=0.1, stop_gradients=False, **kwargs
+        )
+        for g in grads:
+            x = leaf_optimizer.step(x, g.cont_at_key_chain(kc))
+        ret = new_v.cont_at_key_chain(kc)
+        assert ret.dtype == x.dtype
+        assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(x), rtol=1e-5, atol=1e-6)
+
+    if optimizer_class in ["Adam", "LAMB"]:
+        state = optimizer.state
+        assert state.mw.b.d.shape == (2, 2)
+        restored = getattr(ivy, optimizer_class)(lr=0.1, foreach=True, **kwargs)
+        restored.set_state(state)
+        assert np.allclose(ivy.to_numpy(restored.state.vw.a), ivy.to_numpy(state.vw.a))
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        optimizer.step(new_v, grads[0].cont_prune_key_chain("a"))
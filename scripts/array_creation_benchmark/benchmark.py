@@ -0,0 +1,60 @@
+"""Benchmark the creation throughput and memory footprint of ivy.Array.
+
+Wraps the same small native array in many ivy.Array instances, so that only the
+cost of the ivy.Array objects themselves is measured, both for the creation time
+(with and without reading the dtype, device and itemsize of each array) and for
+the memory allocated per array.
+
+Usage: python scripts/array_creation_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import ivy
+
+
+def _creation_rate(native, num_arrays, repeats, read_metadata=False):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(num_arrays):
+            x = ivy.Array(native)
+            if read_metadata:
+                x.dtype, x.device, x.itemsize
+        times.append(time.perf_counter() - start)
+    return num_arrays / sorted(times)[len(times) // 2]
+
+
+def _bytes_per_array(native, num_arrays):
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    arrays = [ivy.Array(native) for _ in range(num_arrays)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del arrays
+    return (end - start) / num_arrays
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--num-arrays", type=int, default=10000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    native = ivy.native_array([1.0])
+    rate = _creation_rate(native, args.num_arrays, args.repeats)
+    metadata_rate = _creation_rate(
+        native, args.num_arrays, args.repeats, read_metadata=True
+    )
+    memory = _bytes_per_array(native, args.num_arrays)
+    print(f"{'arrays created per second':<44}{rate:>12,.0f}")
+    print(f"{'arrays created per second, reading metadata':<44}{metadata_rate:>12,.0f}")
+    print(f"{'memory per array':<44}{memory:>11.0f}B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark chunked attention and the kv cache of ivy.MultiHeadAttention.
+
+Times scaled dot-product attention over all the keys at once and in chunks of keys,
+reporting the peak memory allocated by numpy during each call, which is where the
+chunks save memory. It then times generating a sequence one step at a time with a
+MultiHeadAttention layer, recomputing the attention over the whole prefix at every
+step, and appending to a preallocated kv cache instead.
+
+Usage: python scripts/attention_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import functools
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+
+
+def _time_call(fn, args, repeats):
+    fn(*args)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def _peak_memory(fn, args):
+    tracemalloc.start()
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def _generate(layer, x, use_kv_cache):
+    num_steps = x.shape[-2]
+    if use_kv_cache:
+        layer.init_kv_cache(x.shape[:-2], num_steps)
+        return [layer(x[:, i : i + 1], use_kv_cache=True) for i in range(num_steps)]
+    return [layer(x[:, : i + 1])[:, -1:] for i in range(num_steps)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--length", type=int, default=4096)
+    parser.add_argument("--feat-dim", type=int, default=64)
+    parser.add_argument("--chunk-size", type=int, default=512)
+    parser.add_argument("--decode-length", type=int, default=256)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    rng = np.random.default_rng(0)
+    q, k, v = (
+        ivy.array(rng.normal(size=(1, args.length, args.feat_dim)).astype("float32"))
+        for _ in range(3)
+    )
+    mask = ivy.tril(ivy.ones((args.length, args.length))) > 0
+    print(f"{'operation':<22}{'time':>12}{'peak memory':>16}")
+    for name, chunk_size in [
+        ("attention", None),
+        ("chunked attention", args.chunk_size),
+    ]:
+        fn = functools.partial(
+            ivy.scaled_dot_product_attention,
+            q,
+            k,
+            v,
+            args.feat_dim**-0.5,
+            mask=mask,
+            chunk_size=chunk_size,
+        )
+        duration = _time_call(fn, (), args.repeats)
+        peak = _peak_memory(fn, ())
+        print(f"{name:<22}{duration * 1e3:>10.2f}ms{peak / 2**20:>14.1f}MB")
+
+    layer = ivy.MultiHeadAttention(args.feat_dim, num_heads=4, head_dim=16)
+    x = ivy.array(
+        rng.normal(size=(1, args.decode_length, args.feat_dim)).astype("float32")
+    )
+    for name, use_kv_cache in [("decode", False), ("decode with kv cache", True)]:
+        duration = _time_call(_generate, (layer, x, use_kv_cache), args.repeats)
+        print(f"{name:<22}{duration * 1e3:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
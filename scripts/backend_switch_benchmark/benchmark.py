@@ -0,0 +1,56 @@
+"""Benchmark the cost of pushing and popping each backend on the ivy namespace.
+
+The cold numbers clear the cached backend namespaces before every push, which
+matches the cost of re-wrapping the whole ivy namespace on each switch, while the
+warm numbers reuse the namespace built by the first push.
+
+Usage: python scripts/backend_switch_benchmark/benchmark.py [--repeats N]
+"""
+
+import argparse
+import importlib
+import time
+
+import ivy
+from ivy.utils.backend import handler
+
+BACKENDS = ["numpy", "jax", "tensorflow", "torch"]
+
+
+def _time_switch(backend, repeats, cold=False):
+    push_times, pop_times = [], []
+    for _ in range(repeats):
+        if cold:
+            handler._clear_backend_namespaces()
+        start = time.perf_counter()
+        ivy.set_backend(backend)
+        push_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        ivy.previous_backend()
+        pop_times.append(time.perf_counter() - start)
+    return min(push_times), min(pop_times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'backend':<12}{'cold push':>12}{'cold pop':>12}{'push':>12}{'pop':>12}")
+    for backend in BACKENDS:
+        try:
+            importlib.import_module(backend)
+        except ImportError:
+            print(f"{backend:<12}{'not installed':>12}")
+            continue
+        # pop onto a backend rather than the original namespace, as in a service
+        # which keeps a default backend set and switches on top of it
+        ivy.set_backend("numpy")
+        cold = _time_switch(backend, args.repeats, cold=True)
+        warm = _time_switch(backend, args.repeats)
+        ivy.previous_backend()
+        print(f"{backend:<12}" + "".join(f"{t * 1e3:>10.3f}ms" for t in cold + warm))
+
+
+if __name__ == "__main__":
+    main()
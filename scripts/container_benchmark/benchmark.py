@@ -0,0 +1,67 @@
+"""Benchmark packed ivy.Container objects against containers of separate leaves.
+
+Builds a container of gradients with many small leaves, as a large model would have,
+then times container arithmetic, per-leaf norms, clipping each leaf by its norm and
+device transfer, first on the container as it is and then on the container
+packed with ``cont_pack``, which holds the leaves of each dtype in one flat buffer
+so each of these is a few ops on the buffer rather than a few ops per leaf.
+
+Usage: python scripts/container_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _time_call(fn, args, repeats):
+    fn(*args)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--num-layers", type=int, default=250)
+    parser.add_argument("--width", type=int, default=64)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    rng = np.random.default_rng(0)
+    grads = ivy.Container(
+        {
+            "layer{}".format(i): {
+                "w": ivy.array(
+                    rng.normal(size=(args.width, args.width)).astype("float32")
+                ),
+                "b": ivy.array(rng.normal(size=(args.width,)).astype("float32")),
+            }
+            for i in range(args.num_layers)
+        }
+    )
+    packed = grads.cont_pack()
+    print(f"{'operation':<22}{'time':>12}")
+    print(f"{'pack':<22}{_time_call(grads.cont_pack, (), args.repeats) * 1e3:>10.2f}ms")
+    for name, cont in [("", grads), ("packed ", packed)]:
+        cases = {
+            "axpy": (lambda c: c * 0.9 + c, (cont,)),
+            "vector_norm": (lambda c: c.vector_norm(), (cont,)),
+            "clip_vector_norm": (lambda c: c.clip_vector_norm(1.0), (cont,)),
+            "to_device": (lambda c: c.to_device("cpu"), (cont,)),
+        }
+        for case, (fn, fn_args) in cases.items():
+            duration = _time_call(fn, fn_args, args.repeats)
+            print(f"{name + case:<22}{duration * 1e3:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
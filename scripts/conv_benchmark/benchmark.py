@@ -0,0 +1,73 @@
+"""Benchmark ivy convolutions.
+
+Times conv2d, a grouped conv_general_dilated and depthwise_conv2d on image-sized
+inputs, and reports the peak memory allocated by numpy during each call. With the
+numpy backend every convolution copies the patches of the input into one matrix
+per feature group and multiplies it with the filters in a single GEMM.
+
+Usage: python scripts/conv_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import ivy
+
+
+def _time_call(fn, args, repeats):
+    fn(*args)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def _peak_memory(fn, args):
+    tracemalloc.start()
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--size", type=int, default=32)
+    parser.add_argument("--channels", type=int, default=32)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    c = args.channels
+    x = ivy.random_uniform(shape=(args.batch_size, args.size, args.size, c))
+    cases = {
+        "conv2d": (
+            lambda x, f: ivy.conv2d(x, f, 1, "SAME"),
+            (x, ivy.random_uniform(shape=(3, 3, c, c))),
+        ),
+        "grouped conv": (
+            lambda x, f: ivy.conv_general_dilated(
+                x, f, 1, "SAME", feature_group_count=4
+            ),
+            (x, ivy.random_uniform(shape=(3, 3, c // 4, c))),
+        ),
+        "depthwise conv2d": (
+            lambda x, f: ivy.depthwise_conv2d(x, f, 1, "SAME"),
+            (x, ivy.random_uniform(shape=(3, 3, c))),
+        ),
+    }
+
+    print(f"{'op':<20}{'time':>12}{'peak memory':>16}")
+    for name, (fn, fn_args) in cases.items():
+        duration = _time_call(fn, fn_args, args.repeats)
+        peak = _peak_memory(fn, fn_args)
+        print(f"{name:<20}{duration * 1e3:>10.2f}ms{peak / 2**20:>14.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark dtype support lookups.
+
+Times reading the versioned unsupported_dtypes attribute of backend functions, and
+resolving the dtypes of a function as the support queries do. With the versioned
+attributes cached, the version dictionaries are only scanned again when the
+backend or its version is set.
+
+Usage: python scripts/dtype_support_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import time
+
+import ivy
+from ivy.functional.ivy.data_type import _get_dtypes
+
+
+def _time_call(fn, args, repeats):
+    fn(*args)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    backend = ivy.current_backend()
+    fns = [
+        getattr(backend, name)
+        for name in dir(backend)
+        if callable(getattr(backend, name))
+        and hasattr(getattr(backend, name), "unsupported_dtypes")
+    ]
+    cases = {
+        "attribute reads": lambda: [tuple(fn.unsupported_dtypes) for fn in fns],
+        "_get_dtypes": lambda: [_get_dtypes(fn) for fn in fns],
+    }
+
+    print(f"{len(fns)} functions with versioned dtype attributes")
+    print(f"{'lookup':<20}{'per function':>16}")
+    for name, fn in cases.items():
+        duration = _time_call(fn, (), args.repeats)
+        print(f"{name:<20}{duration / len(fns) * 1e6:>14.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark loading an ivy.Container from a flat checkpoint.
+
+Saves a synthetic container of float32 weights, 512MB by default, as a pickle, as
+hdf5 and as a flat checkpoint, then times loading each one in several worker
+processes at once, and reading a single leaf from each. It reports the memory which
+every worker held to itself. The flat checkpoint is memory-mapped, so the workers
+share its pages rather than each holding a copy.
+
+Usage: python scripts/flat_checkpoint_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+import ivy
+
+
+_WORKER = """
+import time
+import warnings
+warnings.filterwarnings("ignore")
+import ivy
+ivy.set_backend({backend!r})
+start = time.perf_counter()
+weights = ivy.Container.cont_from_disk_as_{fmt}({path!r})
+loaded = time.perf_counter() - start
+start = time.perf_counter()
+float(ivy.sum(weights.cont_at_key_chain("layer0/w")))
+leaf = time.perf_counter() - start
+float(sum(float(ivy.sum(v)) for _, v in weights.cont_to_iterator()))
+private = 0
+with open("/proc/self/smaps_rollup") as smaps:
+    for line in smaps:
+        if line.startswith(("Private_Clean", "Private_Dirty")):
+            private += int(line.split()[1])
+print(loaded, leaf, private)
+"""
+
+
+def _synthetic_container(size_mb, num_leaves):
+    leaf_size = size_mb * 2**20 // (4 * num_leaves)
+    return ivy.Container(
+        {
+            f"layer{i}": {
+                "w": ivy.array(np.random.uniform(size=(leaf_size,)).astype("float32"))
+            }
+            for i in range(num_leaves)
+        }
+    )
+
+
+def _run_workers(backend, fmt, path, num_workers):
+    workers = [
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                _WORKER.format(backend=backend, fmt=fmt, path=path),
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for _ in range(num_workers)
+    ]
+    results = [list(map(float, w.communicate()[0].split()[-3:])) for w in workers]
+    return [sorted(r)[len(r) // 2] for r in zip(*results)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--size-mb", type=int, default=512)
+    parser.add_argument("--num-leaves", type=int, default=64)
+    parser.add_argument("--num-workers", type=int, default=4)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    container = _synthetic_container(args.size_mb, args.num_leaves)
+    print(f"{'format':<12}{'load':>12}{'one leaf':>12}{'private memory':>18}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for fmt in ("pickled", "hdf5", "flat"):
+            path = os.path.join(tmp_dir, f"weights.{fmt}")
+            getattr(container, f"cont_to_disk_as_{fmt}")(path)
+            # read the file once, so every format loads from the page cache
+            with open(path, "rb") as f:
+                while f.read(2**24):
+                    pass
+            loaded, leaf, private = _run_workers(
+                args.backend, fmt, path, args.num_workers
+            )
+            print(
+                f"{fmt:<12}{loaded * 1e3:>10.2f}ms{leaf * 1e3:>10.2f}ms"
+                f"{private / 2**10:>16.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
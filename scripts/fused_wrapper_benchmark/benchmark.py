@@ -0,0 +1,55 @@
+"""Benchmark the per-op overhead of the function wrappers.
+
+Calls a few ivy functions on scalar-sized arrays, where the cost of the wrappers
+dominates the compute, through the fused dispatcher and through the full
+decorator stack which the dispatcher falls back to.
+
+Usage: python scripts/fused_wrapper_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import time
+
+import ivy
+
+
+def _time_call(fn, args, kwargs, repeats):
+    fn(*args, **kwargs)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args, **kwargs)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--repeats", type=int, default=2000)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    x = ivy.array([1.0])
+    y = ivy.array([2.0])
+    cases = {
+        "add": ((x, y), {}),
+        "multiply": ((x, 2.0), {}),
+        "sum": ((x,), {}),
+        "stack": (([x, y],), {}),
+        "zeros_like": ((x,), {}),
+    }
+
+    print(f"{'function':<14}{'fused':>12}{'stacked':>14}")
+    for name, (fn_args, fn_kwargs) in cases.items():
+        fn = getattr(ivy, name)
+        if not hasattr(fn, "fused_wrappers"):
+            print(f"{name:<14}{'not fused':>12}")
+            continue
+        fused = _time_call(fn, fn_args, fn_kwargs, args.repeats)
+        stacked = _time_call(fn.__wrapped__, fn_args, fn_kwargs, args.repeats)
+        print(f"{name:<14}{fused * 1e6:>10.1f}us{stacked * 1e6:>12.1f}us")
+
+
+if __name__ == "__main__":
+    main()
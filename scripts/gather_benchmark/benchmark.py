@@ -0,0 +1,54 @@
+"""Benchmark batched ivy.gather and ivy.gather_nd.
+
+Times batched embedding-style lookups, a per-example table gathered with
+batch_dims=1, for growing batch sizes. With the numpy backend both functions turn
+the batch into offsets of a single flat take, rather than one take per example.
+
+Usage: python scripts/gather_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import time
+
+import ivy
+
+
+def _time_call(fn, args, repeats):
+    fn(*args)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--table-size", type=int, default=32)
+    parser.add_argument("--features", type=int, default=16)
+    parser.add_argument("--lookups", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    print(f"{'batch size':<12}{'gather':>12}{'gather_nd':>14}")
+    for batch_size in (100, 1000, 10000):
+        params = ivy.random_uniform(shape=(batch_size, args.table_size, args.features))
+        indices = ivy.randint(0, args.table_size, shape=(batch_size, args.lookups))
+        gather = _time_call(
+            lambda p, i: ivy.gather(p, i, axis=1, batch_dims=1),
+            (params, indices),
+            args.repeats,
+        )
+        gather_nd = _time_call(
+            lambda p, i: ivy.gather_nd(p, i, batch_dims=1),
+            (params, ivy.expand_dims(indices, axis=-1)),
+            args.repeats,
+        )
+        print(f"{batch_size:<12}{gather * 1e3:>10.2f}ms{gather_nd * 1e3:>12.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
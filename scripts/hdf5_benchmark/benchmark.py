@@ -0,0 +1,81 @@
+"""Benchmark saving and loading an ivy.Container as hdf5.
+
+Writes a synthetic container of float32 weights, 1GB by default, with the default
+resizable datasets, with contiguous datasets and with gzip compression, then loads
+it back by reading the datasets and by memory-mapping the contiguous ones. The
+throughput of each is reported in MB/s.
+
+Usage: python scripts/hdf5_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _synthetic_container(size_mb, num_leaves):
+    leaf_size = size_mb * 2**20 // (4 * num_leaves)
+    rows = 1024
+    return ivy.Container(
+        {
+            f"layer{i}": {
+                "w": ivy.array(
+                    np.random.uniform(size=(rows, leaf_size // rows)).astype("float32")
+                )
+            }
+            for i in range(num_leaves)
+        }
+    )
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    ret = fn()
+    return time.perf_counter() - start, ret
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--num-leaves", type=int, default=64)
+    parser.add_argument("--num-workers", type=int, default=None)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    container = _synthetic_container(args.size_mb, args.num_leaves)
+    size_mb = sum(v.size * 4 for _, v in container.cont_to_iterator()) / 2**20
+    saves = {
+        "resizable": dict(),
+        "contiguous": dict(chunks=False),
+        "gzip": dict(chunks=True, compression="gzip", compression_opts=1),
+    }
+
+    print(f"{'case':<34}{'time':>12}{'throughput':>16}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, kwargs in saves.items():
+            path = os.path.join(tmp_dir, f"{name}.hdf5")
+            duration, _ = _timed(
+                lambda: container.cont_to_disk_as_hdf5(
+                    path, num_workers=args.num_workers, **kwargs
+                )
+            )
+            print(
+                f"{'save ' + name:<34}{duration:>11.2f}s{size_mb / duration:>12.0f}MB/s"
+            )
+            for mmap in (False, True) if name == "contiguous" else (False,):
+                duration, loaded = _timed(
+                    lambda: ivy.Container.cont_from_disk_as_hdf5(path, mmap=mmap)
+                )
+                label = f"load {name}" + (" (mmap)" if mmap else "")
+                print(f"{label:<34}{duration:>11.2f}s{size_mb / duration:>12.0f}MB/s")
+                del loaded
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark importing ivy.
+
+Times `import ivy`, and `import ivy` followed by setting a backend, each in a fresh
+interpreter, and reports the peak resident memory of that interpreter. Optional
+dependencies such as h5py and psutil are imported by the functions which use them,
+and the array specifications of the api functions are computed when a backend is
+first set, rather than on import. Each statement is timed both with the api loaded
+eagerly, and lazily as with ``IVY_LAZY_IMPORT=1``.
+
+Usage: python scripts/import_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+
+_SNIPPET = """
+import resource
+import time
+start = time.perf_counter()
+{statement}
+duration = time.perf_counter() - start
+print(duration, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def _run(statement, repeats, lazy):
+    env = dict(os.environ)
+    env["IVY_LAZY_IMPORT"] = "1" if lazy else "0"
+    # bytecode caching is what users get, so it's left on
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    runs = []
+    for _ in range(repeats + 1):
+        out = subprocess.run(
+            [
+                sys.executable,
+                "-W",
+                "ignore",
+                "-c",
+                _SNIPPET.format(statement=statement),
+            ],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        duration, peak = out.stdout.split()[-2:]
+        runs.append((float(duration), int(peak)))
+    # the first run may write the bytecode cache
+    runs = sorted(runs[1:])
+    return runs[len(runs) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = {
+        "import ivy": "import ivy",
+        f"set_backend({args.backend!r})": (
+            f"import ivy; ivy.set_backend({args.backend!r})"
+        ),
+    }
+    print(f"{'statement':<28}{'import':>8}{'time':>12}{'peak memory':>16}")
+    for name, statement in cases.items():
+        for lazy in (False, True):
+            duration, peak = _run(statement, args.repeats, lazy)
+            print(
+                f"{name:<28}{'lazy' if lazy else 'eager':>8}"
+                f"{duration * 1e3:>10.2f}ms{peak / 2**10:>14.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark the lstm recurrence of ivy.lstm_update and the streaming ivy.LSTM.
+
+Times the backend's lstm update, which for numpy writes into a preallocated output
+and for torch calls its fused kernel, next to the compositional update which
+activates the packed gates of each step with a single sigmoid. It then times an
+ivy.LSTM in streaming mode consuming the same sequence chunk by chunk.
+
+Usage: python scripts/lstm_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+from ivy.functional.ivy.layers import lstm_update as compositional_lstm_update
+
+
+def _time_call(fn, args, repeats):
+    fn(*args)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def _stream(layer, x, chunk_size):
+    layer.reset_state()
+    return [layer(x[:, i : i + chunk_size]) for i in range(0, x.shape[-2], chunk_size)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--timesteps", type=int, default=512)
+    parser.add_argument("--channels", type=int, default=256)
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    rng = np.random.default_rng(0)
+    shape = (args.batch_size, args.timesteps, args.channels)
+    x = ivy.array(rng.normal(size=shape).astype("float32"))
+    state = ivy.zeros((args.batch_size, args.channels))
+    kernel, recurrent_kernel = (
+        ivy.array(
+            rng.normal(size=(args.channels, 4 * args.channels)).astype("float32")
+            / args.channels**0.5
+        )
+        for _ in range(2)
+    )
+    bias = ivy.zeros((4 * args.channels,))
+    layer = ivy.LSTM(args.channels, args.channels, streaming=True)
+    lstm_args = (x, state, state, kernel, recurrent_kernel)
+    cases = {
+        "lstm_update": (lambda: ivy.lstm_update(*lstm_args, bias=bias), ()),
+        "compositional": (
+            lambda: compositional_lstm_update(*lstm_args, bias=bias),
+            (),
+        ),
+        "streaming LSTM": (_stream, (layer, x, args.chunk_size)),
+    }
+
+    print(f"{'operation':<22}{'time':>12}")
+    for name, (fn, fn_args) in cases.items():
+        duration = _time_call(fn, fn_args, args.repeats)
+        print(f"{name:<22}{duration * 1e3:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
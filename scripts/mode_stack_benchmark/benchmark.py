@@ -0,0 +1,86 @@
+"""Benchmark the global mode stacks under concurrency.
+
+Each worker thread sets its own default float dtype, creates arrays in that mode and
+unsets it again, and the share of arrays which didn't get the worker's dtype is
+reported along with the throughput. With ``--worker-backends``, the workers also set
+their own backends, taken in turn from the list, and an array of another backend
+counts as wrong too. The mode stacks, backends included, are local to each thread and
+asyncio task, so no array should end up with another worker's modes and the workers
+don't contend on a lock.
+
+Usage: python scripts/mode_stack_benchmark/benchmark.py [--backend numpy]
+    [--worker-backends numpy,torch]
+"""
+
+import argparse
+import threading
+import time
+
+import ivy
+
+
+_FLOAT_DTYPES = ("float16", "float32", "float64")
+
+
+def _worker(float_dtype, backend, iterations, barrier, mismatches):
+    if backend is not None:
+        ivy.set_backend(backend)
+    barrier.wait()
+    for _ in range(iterations):
+        ivy.set_default_float_dtype(float_dtype)
+        x = ivy.array([0.0, 1.0, 2.0])
+        if ivy.dtype(x) != float_dtype or (
+            backend is not None
+            and not type(ivy.to_native(x)).__module__.startswith(backend)
+        ):
+            mismatches.append(1)
+        ivy.unset_default_float_dtype()
+    if backend is not None:
+        ivy.previous_backend()
+
+
+def _run(num_threads, iterations, worker_backends):
+    barrier = threading.Barrier(num_threads)
+    mismatches = list()
+    threads = [
+        threading.Thread(
+            target=_worker,
+            args=(
+                _FLOAT_DTYPES[i % len(_FLOAT_DTYPES)],
+                worker_backends[i % len(worker_backends)] if worker_backends else None,
+                iterations,
+                barrier,
+                mismatches,
+            ),
+        )
+        for i in range(num_threads)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, len(mismatches)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--worker-backends", default=None)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    worker_backends = args.worker_backends and args.worker_backends.split(",")
+
+    ivy.set_backend(args.backend)
+    print(f"{'threads':<10}{'arrays/s':>14}{'wrong modes':>14}")
+    for num_threads in (1, 2, 4, 8):
+        duration, mismatches = _run(num_threads, args.iterations, worker_backends)
+        total = num_threads * args.iterations
+        print(
+            f"{num_threads:<10}{total / duration:>14.0f}"
+            f"{mismatches / total * 100:>13.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
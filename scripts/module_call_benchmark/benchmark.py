@@ -0,0 +1,49 @@
+"""Benchmark the forward call latency of small stateful modules.
+
+Times `Linear` layers and `Sequential` stacks of `Linear` layers on tiny inputs,
+where the fixed per-call overhead of `Module.__call__` dominates the compute, both
+with and without submodule return tracking.
+
+Usage: python scripts/module_call_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import time
+
+import ivy
+
+
+def _time_call(module, x, repeats, **kwargs):
+    module(x, **kwargs)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        module(x, **kwargs)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--features", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    x = ivy.random_uniform(shape=(1, args.features))
+    modules = {"Linear": ivy.Linear(args.features, args.features)}
+    for depth in (2, 4, 8):
+        modules[f"Sequential x{depth}"] = ivy.Sequential(
+            *[ivy.Linear(args.features, args.features) for _ in range(depth)]
+        )
+
+    print(f"{'module':<16}{'call':>12}{'tracked call':>16}")
+    for name, module in modules.items():
+        untracked = _time_call(module, x, args.repeats)
+        tracked = _time_call(module, x, args.repeats, track_submod_rets=True)
+        print(f"{name:<16}{untracked * 1e6:>10.1f}us{tracked * 1e6:>14.1f}us")
+
+
+if __name__ == "__main__":
+    main()
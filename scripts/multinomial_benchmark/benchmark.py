@@ -0,0 +1,53 @@
+"""Benchmark ivy.multinomial on many rows of probabilities.
+
+Times token-sampling style draws, one sample per row over a vocabulary, with and
+without replacement, for growing numbers of rows. With the numpy backend all rows
+are sampled at once, by inverse cdf search with replacement and by gumbel top-k
+without.
+
+Usage: python scripts/multinomial_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import time
+
+import ivy
+
+
+def _time_call(fn, args, repeats):
+    fn(*args)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--vocab-size", type=int, default=1000)
+    parser.add_argument("--num-samples", type=int, default=4)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    print(f"{'rows':<10}{'replace':>12}{'no replace':>14}")
+    for rows in (10, 100, 1000):
+        probs = ivy.softmax(ivy.random_normal(shape=(rows, args.vocab_size)))
+        times = [
+            _time_call(
+                lambda p: ivy.multinomial(
+                    args.vocab_size, args.num_samples, probs=p, replace=replace
+                ),
+                (probs,),
+                args.repeats,
+            )
+            for replace in (True, False)
+        ]
+        print(f"{rows:<10}{times[0] * 1e3:>10.2f}ms{times[1] * 1e3:>12.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
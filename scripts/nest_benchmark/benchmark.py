@@ -0,0 +1,85 @@
+"""Benchmark mapping over nests and containers of the same structure repeatedly.
+
+Times the nest traversals the wrapped ivy functions run on nested arguments and
+returns, such as the list of arrays ivy.split returns, which flatten the nest with
+ivy.tree_flatten and rebuild it from the mapped leaves with the cached tree
+definition of its structure, as in a training loop calling the same functions with
+nests of the same structure at every step. It then times mapping over the leaves of
+one and two containers of gradients with many leaves.
+
+Usage: python scripts/nest_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _time_call(fn, args, repeats):
+    fn(*args)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def _repeat(fn, num_calls):
+    return lambda *args: [fn(*args) for _ in range(num_calls)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--num-calls", type=int, default=1000)
+    parser.add_argument("--num-layers", type=int, default=250)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    rng = np.random.default_rng(0)
+    x = ivy.array(rng.normal(size=(8, 8)).astype("float32"))
+    params = [ivy.array(rng.normal(size=(8,)).astype("float32")) for _ in range(4)]
+    nest = (x, params, {"axis": -1, "keepdims": True})
+    grads = ivy.Container(
+        {
+            "layer{}".format(i): {
+                "w": ivy.array(rng.normal(size=(8, 8)).astype("float32")),
+                "b": ivy.array(rng.normal(size=(8,)).astype("float32")),
+            }
+            for i in range(args.num_layers)
+        }
+    )
+    cases = {
+        "nested_map": (
+            lambda n: ivy.nested_map(n, ivy.to_native, shallow=False),
+            (nest,),
+        ),
+        "args_to_native": (
+            lambda n: ivy.args_to_native(*n[:2], **n[2]),
+            (nest,),
+        ),
+        "split": (ivy.split, (x,)),
+    }
+    print(f"{'operation':<22}{'time':>12}")
+    for name, (fn, fn_args) in cases.items():
+        duration = _time_call(_repeat(fn, args.num_calls), fn_args, args.repeats)
+        print(f"{name + ' x' + str(args.num_calls):<22}{duration * 1e3:>10.2f}ms")
+    cont_cases = {
+        "cont_map": (lambda c: c.cont_map(lambda v, _: v), (grads,)),
+        "cont_multi_map": (
+            lambda c: ivy.Container.cont_multi_map(lambda v, _: v[0], [c, c]),
+            (grads,),
+        ),
+    }
+    for name, (fn, fn_args) in cont_cases.items():
+        duration = _time_call(fn, fn_args, args.repeats)
+        print(f"{name:<22}{duration * 1e3:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark ivy.NestedArray on a batch of variable-length sequences.
+
+Builds a batch of sequences of random lengths, then times packing them into a nested
+array, an elementwise op, the per-row reductions and padding to dense, next to the
+same ops applied to each sequence in a python loop. The nested array holds all the
+rows in one values buffer, so each op is a single call to the backend.
+
+Usage: python scripts/nested_array_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _time_call(fn, args, repeats):
+    fn(*args)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--batch-size", type=int, default=1024)
+    parser.add_argument("--max-length", type=int, default=256)
+    parser.add_argument("--features", type=int, default=64)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    rng = np.random.default_rng(0)
+    lengths = rng.integers(1, args.max_length, size=args.batch_size)
+    rows = [
+        ivy.array(rng.uniform(size=(length, args.features)).astype("float32"))
+        for length in lengths
+    ]
+    nested = ivy.NestedArray.nested_array(rows)
+    cases = {
+        "pack": (ivy.NestedArray.nested_array, (rows,)),
+        "loop multiply": (lambda: [row * 2.0 for row in rows], ()),
+        "nested multiply": (lambda: nested * 2.0, ()),
+        "loop sum": (lambda: ivy.stack([ivy.sum(r, axis=0) for r in rows]), ()),
+        "nested sum": (nested.sum, ()),
+        "loop max": (lambda: ivy.stack([ivy.max(r, axis=0) for r in rows]), ()),
+        "nested max": (nested.max, ()),
+        "nested to_padded": (nested.to_padded, ()),
+    }
+
+    print(f"{'operation':<22}{'time':>12}")
+    for name, (fn, fn_args) in cases.items():
+        duration = _time_call(fn, fn_args, args.repeats)
+        print(f"{name:<22}{duration * 1e3:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark the foreach mode of the ivy optimizers against updating leaf by leaf.
+
+Builds containers of variables and gradients with a growing number of leaves, then
+times a step of each optimizer applying its update to every leaf separately, next to
+a step in foreach mode, which packs the leaves into one flat buffer per dtype and
+updates the whole buffer with a few array ops.
+
+Usage: python scripts/optimizer_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _time_call(fn, args, repeats):
+    fn(*args)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def _random_container(rng, num_leaves, leaf_size):
+    return ivy.Container(
+        {
+            "layer{}".format(i): ivy.array(
+                rng.normal(size=(leaf_size,)).astype("float32")
+            )
+            for i in range(num_leaves)
+        }
+    )
+
+
+def _leaf_by_leaf_step(optimizer_class, v, grads):
+    # one optimizer per leaf, as each leaf is otherwise updated on its own
+    optimizers = {kc: optimizer_class(lr=1e-3, stop_gradients=False) for kc in v}
+    return lambda: {kc: optimizers[kc].step(v[kc], grads[kc]) for kc in v}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--num-leaves", type=int, nargs="+", default=[16, 64, 256])
+    parser.add_argument("--leaf-size", type=int, default=4096)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    rng = np.random.default_rng(0)
+    print(f"{'operation':<22}{'parameters':>12}{'time':>12}")
+    for num_leaves in args.num_leaves:
+        v = _random_container(rng, num_leaves, args.leaf_size)
+        grads = _random_container(rng, num_leaves, args.leaf_size)
+        for name, optimizer_class in [
+            ("sgd", ivy.SGD),
+            ("adam", ivy.Adam),
+            ("lamb", ivy.LAMB),
+        ]:
+            optimizer = optimizer_class(lr=1e-3, stop_gradients=False, foreach=True)
+            cases = {
+                name: (_leaf_by_leaf_step(optimizer_class, v, grads), ()),
+                name + " foreach": (optimizer.step, (v, grads)),
+            }
+            for case, (fn, fn_args) in cases.items():
+                duration = _time_call(fn, fn_args, args.repeats)
+                print(
+                    f"{case:<22}{num_leaves * args.leaf_size:>12}"
+                    f"{duration * 1e3:>10.2f}ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
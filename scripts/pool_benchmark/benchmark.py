@@ -0,0 +1,63 @@
+"""Benchmark ivy pooling.
+
+Times max_pool2d, a dilated max_pool2d with ceil_mode and avg_pool2d on
+image-sized inputs, and reports the peak memory allocated by numpy during each
+call. With the numpy backend the windows are reduced one kernel offset at a time
+into the output, so no padded copy or patch tensor of the input is built.
+
+Usage: python scripts/pool_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import ivy
+
+
+def _time_call(fn, args, repeats):
+    fn(*args)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def _peak_memory(fn, args):
+    tracemalloc.start()
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--size", type=int, default=64)
+    parser.add_argument("--channels", type=int, default=64)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    x = ivy.random_uniform(shape=(args.batch_size, args.size, args.size, args.channels))
+    cases = {
+        "max_pool2d": lambda x: ivy.max_pool2d(x, 3, 2, "SAME"),
+        "dilated max_pool2d": lambda x: ivy.max_pool2d(
+            x, 3, 2, 1, dilation=2, ceil_mode=True
+        ),
+        "avg_pool2d": lambda x: ivy.avg_pool2d(x, 3, 2, "SAME"),
+    }
+
+    print(f"{'op':<22}{'time':>12}{'peak memory':>16}")
+    for name, fn in cases.items():
+        duration = _time_call(fn, (x,), args.repeats)
+        peak = _peak_memory(fn, (x,))
+        print(f"{name:<22}{duration * 1e3:>10.2f}ms{peak / 2**20:>14.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
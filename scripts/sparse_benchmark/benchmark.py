@@ -0,0 +1,78 @@
+"""Benchmark the conversions and kernels of ivy.SparseArray.
+
+Builds a random COO sparse matrix and times converting it to CSR and CSC and back,
+and densifying it from each format. The coordinates of the nonzeros are computed
+with array operations, so the time grows with the number of nonzeros only through
+the backend's kernels. It then times multiplying the sparse matrix by a dense matrix
+and a vector, and summing it, next to multiplying its dense equivalent.
+
+Usage: python scripts/sparse_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _time_call(fn, args, repeats):
+    fn(*args)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--nnz", type=int, default=1_000_000)
+    parser.add_argument("--size", type=int, default=8192)
+    parser.add_argument("--cols", type=int, default=64)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    rng = np.random.default_rng(0)
+    flat = rng.choice(args.size * args.size, args.nnz, replace=False)
+    values = rng.uniform(size=args.nnz).astype("float32")
+    coo = ivy.SparseArray(
+        coo_indices=np.stack([flat // args.size, flat % args.size]),
+        values=values,
+        dense_shape=(args.size, args.size),
+        format="coo",
+    )
+    dense = np.zeros(args.size * args.size, dtype="float32")
+    dense[flat] = values
+    dense = ivy.array(dense.reshape((args.size, args.size)))
+    csr = coo.to_csr_array()
+    csc = coo.to_csc_array()
+    matrix = ivy.array(rng.uniform(size=(args.size, args.cols)).astype("float32"))
+    vector = ivy.array(rng.uniform(size=(args.size,)).astype("float32"))
+    cases = {
+        "coo -> csr": (coo.to_csr_array, ()),
+        "coo -> csc": (coo.to_csc_array, ()),
+        "csr -> csc": (csr.to_csc_array, ()),
+        "csc -> coo": (csc.to_coo_array, ()),
+        "coo -> dense": (coo.to_dense_array, ()),
+        "csr -> dense": (csr.to_dense_array, ()),
+        "csc -> dense": (csc.to_dense_array, ()),
+        "coo @ matrix": (ivy.sparse_matmul, (coo, matrix)),
+        "csr @ matrix": (ivy.sparse_matmul, (csr, matrix)),
+        "csr @ vector": (ivy.sparse_matmul, (csr, vector)),
+        "csr sum": (ivy.sparse_sum, (csr,)),
+        "dense @ matrix": (ivy.matmul, (dense, matrix)),
+    }
+
+    print(f"{'operation':<22}{'time':>12}")
+    for name, (fn, fn_args) in cases.items():
+        duration = _time_call(fn, fn_args, args.repeats)
+        print(f"{name:<22}{duration * 1e3:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
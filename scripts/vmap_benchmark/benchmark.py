@@ -0,0 +1,56 @@
+"""Benchmark ivy.vmap on per-sample computations.
+
+Times a per-sample dense layer with a reduction, the kind of function vectorized
+for per-sample losses, for growing batch sizes. With the numpy backend the function
+is traced once with the batch dimension, rather than called once per sample.
+
+Usage: python scripts/vmap_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import time
+
+import ivy
+
+
+def _per_sample_loss(x, w, y):
+    logits = ivy.matmul(x, w)
+    return ivy.mean((ivy.tanh(logits) - y) ** 2)
+
+
+def _time_call(fn, args, repeats):
+    fn(*args)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--features", type=int, default=32)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    w = ivy.native_array(ivy.random_uniform(shape=(args.features, 8)))
+    vmapped = ivy.vmap(_per_sample_loss, in_axes=(0, None, 0))
+
+    print(f"{'batch size':<12}{'vmap':>12}{'per-sample calls':>20}")
+    for batch_size in (16, 128, 1024):
+        x = ivy.native_array(ivy.random_uniform(shape=(batch_size, args.features)))
+        y = ivy.native_array(ivy.random_uniform(shape=(batch_size, 8)))
+        batched = _time_call(vmapped, (x, w, y), args.repeats)
+        looped = _time_call(
+            lambda x, w, y: [_per_sample_loss(x[i], w, y[i]) for i in range(len(x))],
+            (x, w, y),
+            args.repeats,
+        )
+        print(f"{batch_size:<12}{batched * 1e3:>10.2f}ms{looped * 1e3:>18.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark creating local ivy instances with ivy.with_backend.
+
+Times the first with_backend call of a fresh process, without and with the on-disk
+cache of the transformed module code, then further calls in the same process,
+which compile from memory, and calls handed a released instance from the pool.
+
+Usage: python scripts/with_backend_benchmark/benchmark.py [--backend numpy]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import ivy
+
+
+_FIRST_CALL = """
+import time
+import ivy
+start = time.perf_counter()
+ivy.with_backend({backend!r})
+print(time.perf_counter() - start)
+"""
+
+
+def _time_call(fn, args, repeats):
+    fn(*args)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def _first_call(backend, cache_dir):
+    env = dict(os.environ, IVY_CACHE_DIR=cache_dir)
+    out = subprocess.run(
+        [sys.executable, "-c", _FIRST_CALL.format(backend=backend)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(out.stdout.split()[-1])
+
+
+def _pooled_call(backend):
+    ivy.release_backend(ivy.with_backend(backend))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cold = _first_call(args.backend, cache_dir)
+        warm = _first_call(args.backend, cache_dir)
+    cases = {
+        "new process": cold,
+        "new process, disk cache": warm,
+        "same process": _time_call(ivy.with_backend, (args.backend,), args.repeats),
+        "released instance": _time_call(_pooled_call, (args.backend,), args.repeats),
+    }
+
+    print(f"{'with_backend':<28}{'time':>12}")
+    for name, duration in cases.items():
+        print(f"{name:<28}{duration * 1e3:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()